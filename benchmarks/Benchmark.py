@@ -0,0 +1,251 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Benchmark of bipartite_matching_augmentation on generated instances of growing size.
+
+Usage: python -m benchmarks.Benchmark [--families er,power_law,planted,gadget] [--sizes 1000,10000]
+                                      [--reduction {auto,on,off,both}] [--backend {networkx,dense,array}]
+                                      [--repeat N] [--threads N] [--cover {greedy,parallel}] [--cover-processes N]
+                                      [--json]
+                                      [--memory [--vertex-budget BYTES] [--edge-budget BYTES]] [--imports]
+
+For each instance, the wall time of each phase is reported together with the size of the condensation,
+the number of arcs removed by the transitive reduction pre-pass and the size of L. With --threads, the independent
+phases run concurrently on a thread pool of the given size. With --cover, the set cover method of source_cover
+is selected, with --cover-processes, the rounds of the parallel method are split over a pool of N processes.
+
+With --memory, the peak memory allocated by the whole call and by each phase is measured by tracemalloc instead,
+together with the memory each phase retains after it ends (column <phase>_retained, negative if it frees more than
+it allocates) and the peak resident set size sampled in the background. The exit code is 1 if the peak of an instance
+exceeds vertex_budget * |V| + edge_budget * |E|, the default budgets are given by MEMORY_BUDGETS.
+
+With --imports, the time to import each entry point of IMPORT_TARGETS and to answer a first small instance
+is measured in fresh interpreters instead (the minimum of --repeat runs), together with whether the import
+loaded NetworkX and SciPy.
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import tracemalloc
+import numpy as np
+from typing import Dict, List
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.Generators import random_D_erdos_renyi, random_D_power_law, random_D_planted_sccs, gadget_family, \
+    D_arcs_to_bipartite, bipartite_to_networkx
+from src.utils.Instrumentation import Statistics, ResidentMemorySampler, collect, phase
+
+PHASES: List[str] = ['validation', 'precheck', 'matching', 'D', 'condensation', 'classification', 'index', 'reduction',
+                     'source_cover', 'sweeps', 'eswaran_tarjan']
+
+# Default (bytes per vertex, bytes per edge) of G, about twice the peak measured on the generated families
+MEMORY_BUDGETS: Dict[str, tuple] = {'networkx': (1500, 1000), 'dense': (1500, 1000), 'array': (250, 150)}
+
+# Entry point -> (module imported, statements answering a first small instance)
+IMPORT_TARGETS: Dict[str, tuple] = {
+    'core': ('src.algo.ArrayBackend',
+             'from src.utils.Generators import gadget_family\n'
+             'augment_arrays(*gadget_family(10))'),
+    'full': ('src.algo.BipartiteMatchingAugmentation',
+             'from src.utils.Generators import gadget_family, bipartite_to_networkx\n'
+             'bipartite_matching_augmentation(*bipartite_to_networkx(*gadget_family(10)))'),
+}
+
+_IMPORT_SCRIPT = """
+import sys, json, time
+start = time.perf_counter()
+from {module} import *
+imported = time.perf_counter()
+loaded = {{'networkx': 'networkx' in sys.modules, 'scipy': 'scipy' in sys.modules}}
+{first_call}
+print(json.dumps({{'import': imported - start, 'first_call': time.perf_counter() - imported, **loaded}}))
+"""
+
+
+def generate_arrays(family: str, n: int, seed: int = 0) -> (int, np.ndarray, np.ndarray):
+    """ Returns the bipartite instance (n, a, b) of the given family with about n vertices in each bipartition. """
+    if family == 'er':
+        instance = D_arcs_to_bipartite(n, *random_D_erdos_renyi(n, m=int(1.2 * n), seed=seed))
+    elif family == 'power_law':
+        instance = D_arcs_to_bipartite(n, *random_D_power_law(n, 2 * n, seed=seed))
+    elif family == 'planted':
+        tails, heads, _ = random_D_planted_sccs(n, n // 4, 4 * n, internal_arcs=n, seed=seed)
+        instance = D_arcs_to_bipartite(n, tails, heads)
+    elif family == 'gadget':
+        instance = gadget_family(max(1, n // 6))
+    else:
+        raise ValueError("Unknown family {!r}.".format(family))
+    return instance
+
+
+def generate(family: str, n: int, seed: int = 0):
+    """ Returns (G, A, M) of an instance of the given family with about n vertices in each bipartition. """
+    return bipartite_to_networkx(*generate_arrays(family, n, seed))
+
+
+def run(family: str, n: int, reduce_condensation, repeat: int, backend: str = 'networkx',
+        executor: Executor = None, cover_method: str = 'greedy', cover_executor: Executor = None) -> Dict:
+    """ Returns the record of the fastest of repeat runs on the instance (family, n). """
+    G, A, M = generate(family, n)
+    best: Dict = None
+    for _ in range(repeat):
+        with collect() as statistics:
+            start = time.perf_counter()
+            L = bipartite_matching_augmentation(G, A, M, backend=backend, reduce_condensation=reduce_condensation,
+                                                executor=executor, cover_method=cover_method,
+                                                cover_executor=cover_executor)
+            total = time.perf_counter() - start
+        if best is None or total < best['total']:
+            best = {'family': family, 'n': len(A), 'edges': G.number_of_edges(), 'backend': backend,
+                    'mode': {None: 'auto', True: 'on', False: 'off'}[reduce_condensation],
+                    'total': total, 'L': len(L),
+                    'condensation_arcs': statistics.counters.get('condensation_arcs', 0),
+                    'removed_arcs': statistics.counters.get('reduction_removed_arcs', 0)}
+            best.update({name: statistics.timings.get(name, 0.0) for name in PHASES})
+    return best
+
+
+def run_memory(family: str, n: int, backend: str, vertex_budget: float, edge_budget: float) -> Dict:
+    """ Returns the record of memory peaks and retained memory of a single run on the instance (family, n). """
+    G, A, M = generate(family, n)
+    statistics = Statistics(memory=True)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        with ResidentMemorySampler() as sampler, collect(statistics):
+            with phase('total'):  # Phases reset the peak of tracemalloc, the enclosing phase keeps the maximum
+                L = bipartite_matching_augmentation(G, A, M, backend=backend)
+    finally:
+        tracemalloc.stop()
+
+    vertices, edges = len(G), G.number_of_edges()
+    peak = statistics.memory['total']['peak']
+    budget = vertex_budget * vertices + edge_budget * edges
+    record = {'family': family, 'n': len(A), 'edges': edges, 'backend': backend, 'L': len(L),
+              'peak_kB': peak // 1024, 'budget_kB': int(budget) // 1024, 'within_budget': peak <= budget,
+              'bytes_per_vertex': round(peak / vertices), 'bytes_per_edge': round(peak / max(edges, 1)),
+              'rss_peak_kB': sampler.peak // 1024 if sampler.peak is not None else None}
+    for name in PHASES:
+        measured = statistics.memory.get(name, {'peak': 0, 'retained': 0})
+        record[name] = measured['peak'] // 1024
+        record[name + '_retained'] = int(measured['retained'] / 1024)
+    return record
+
+
+def print_table(records: List[Dict], output, columns: List[str] = None):
+    if columns is None:
+        columns = ['family', 'n', 'edges', 'backend', 'mode', 'L', 'condensation_arcs', 'removed_arcs',
+                   'total'] + PHASES
+    widths = [max(len(column), 9) for column in columns]
+    output.write(' '.join(column.rjust(width) for column, width in zip(columns, widths)) + '\n')
+    for record in records:
+        cells = []
+        for column, width in zip(columns, widths):
+            value = record[column]
+            cells.append(('{:.4f}'.format(value) if isinstance(value, float) else str(value)).rjust(width))
+        output.write(' '.join(cells) + '\n')
+
+
+def run_imports(target: str, repeat: int) -> Dict:
+    """ Measures the import of an entry point of IMPORT_TARGETS in fresh interpreters. """
+    module, first_call = IMPORT_TARGETS[target]
+    script = _IMPORT_SCRIPT.format(module=module, first_call=first_call)
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    runs = [json.loads(subprocess.run([sys.executable, '-c', script], cwd=root, check=True, capture_output=True,
+                                      text=True).stdout) for _ in range(max(1, repeat))]
+    return {'entry_point': target, 'module': module, 'import': min(run['import'] for run in runs),
+            'first_call': min(run['first_call'] for run in runs), 'networkx_loaded': runs[0]['networkx'],
+            'scipy_loaded': runs[0]['scipy']}
+
+
+def main(argv: List[str] = None, output=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.Benchmark')
+    parser.add_argument('--families', default='er,power_law,planted,gadget')
+    parser.add_argument('--sizes', default='1000,10000')
+    parser.add_argument('--reduction', choices=('auto', 'on', 'off', 'both'), default='both')
+    parser.add_argument('--backend', choices=('networkx', 'dense', 'array'), default='networkx',
+                        help='the reduction pre-pass is implemented only by the networkx backend')
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--threads', type=int, default=0, metavar='N',
+                        help='run independent phases concurrently on a pool of N threads')
+    parser.add_argument('--cover', choices=('greedy', 'parallel'), default='greedy',
+                        help='set cover method of source_cover')
+    parser.add_argument('--cover-processes', type=int, default=0, metavar='N',
+                        help='split the rounds of the parallel cover method over a pool of N processes')
+    parser.add_argument('--json', action='store_true', help='write JSON lines instead of a table')
+    parser.add_argument('--memory', action='store_true', help='measure peak memory per phase instead of time')
+    parser.add_argument('--vertex-budget', type=float, default=None, metavar='BYTES',
+                        help='memory budget per vertex of G, see MEMORY_BUDGETS for the default')
+    parser.add_argument('--edge-budget', type=float, default=None, metavar='BYTES',
+                        help='memory budget per edge of G, see MEMORY_BUDGETS for the default')
+    parser.add_argument('--imports', action='store_true', help='measure the import time of the entry points')
+    arguments = parser.parse_args(argv)
+    output = output if output is not None else sys.stdout
+
+    if arguments.memory:
+        return memory_main(arguments, output)
+    if arguments.imports:
+        records = [run_imports(target, arguments.repeat) for target in IMPORT_TARGETS]
+        if arguments.json:
+            output.write(''.join(json.dumps(record) + '\n' for record in records))
+        else:
+            print_table(records, output, ['entry_point', 'module', 'import', 'first_call', 'networkx_loaded',
+                                          'scipy_loaded'])
+        return 0
+
+    reductions = {'auto': [None], 'on': [True], 'off': [False], 'both': [False, True]}[arguments.reduction]
+    records: List[Dict] = []
+    executor = ThreadPoolExecutor(arguments.threads) if arguments.threads > 0 else None
+    cover_executor = ProcessPoolExecutor(arguments.cover_processes) if arguments.cover_processes > 0 else None
+    try:
+        for family in arguments.families.split(','):
+            for n in map(int, arguments.sizes.split(',')):
+                for reduce_condensation in reductions:
+                    records.append(run(family, n, reduce_condensation, arguments.repeat, arguments.backend, executor,
+                                       arguments.cover, cover_executor))
+                    if arguments.json:
+                        output.write(json.dumps(records[-1]) + '\n')
+                        output.flush()
+    finally:
+        for pool in (executor, cover_executor):
+            if pool is not None:
+                pool.shutdown()
+
+    if not arguments.json:
+        print_table(records, output)
+    return 0
+
+
+def memory_main(arguments, output) -> int:
+    """ Runs the memory benchmark, returns 1 if any instance exceeds its budget. """
+    vertex_budget, edge_budget = MEMORY_BUDGETS[arguments.backend]
+    vertex_budget = arguments.vertex_budget if arguments.vertex_budget is not None else vertex_budget
+    edge_budget = arguments.edge_budget if arguments.edge_budget is not None else edge_budget
+
+    bipartite_matching_augmentation(*generate('gadget', 12), backend=arguments.backend)  # Imports are not measured
+    records: List[Dict] = []
+    for family in arguments.families.split(','):
+        for n in map(int, arguments.sizes.split(',')):
+            records.append(run_memory(family, n, arguments.backend, vertex_budget, edge_budget))
+            if arguments.json:
+                output.write(json.dumps(records[-1]) + '\n')
+                output.flush()
+
+    if not arguments.json:
+        print_table(records, output, ['family', 'n', 'edges', 'backend', 'L', 'peak_kB', 'budget_kB', 'within_budget',
+                                      'bytes_per_vertex', 'bytes_per_edge', 'rss_peak_kB'] +
+                    [column for name in PHASES for column in (name, name + '_retained')])
+    exceeded = [record for record in records if not record['within_budget']]
+    for record in exceeded:
+        sys.stderr.write('Memory budget exceeded: {family} n={n} peak {peak_kB} kB > {budget_kB} kB\n'.format(**record))
+    return 1 if exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Differential test of the fast engines against the reference NetworkX implementation on generated
+instances up to production sizes.
+
+Usage: python -m benchmarks.Differential [--families er,power_law,planted,gadget] [--sizes 1000,10000,100000]
+                                         [--engines dense,array,arrays,packed,external] [--seeds N] [--json]
+
+For each instance, L is computed by the reference engine and by each fast engine, all with the known perfect
+matching of the instance. For the reference and for each fast engine, it is reported
+    robust          whether G + L is robust, checked independently of the engines by strong components of NetworkX,
+                    see remaining_critical_edges
+    L, cover_*      sizes of L and of the source and sink covers next to those of the reference
+    within_bound    whether the sizes agree with the reference up to the factor H(|X|) of the greedy cover,
+                    where |X| is the number of critical edges and H the harmonic number
+    ratio           the wall time of the engine divided by the wall time of the reference
+    mismatch        the failed checks, empty if the engine agrees with the reference
+The record of the reference only checks its robustness. The exit code is 1 if the reference is not robust
+or any engine disagrees with it.
+"""
+
+import sys
+import json
+import time
+import argparse
+import tempfile
+import itertools
+import numpy as np
+import networkx as nx
+from typing import Callable, Dict, Iterable, List, Set
+from benchmarks.Benchmark import generate_arrays, print_table
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.ArrayBackend import augment_arrays
+from src.algo.PackedSolver import packed_matching_augmentation
+from src.algo.ExternalMemory import write_edge_file, external_matching_augmentation
+from src.utils.Generators import bipartite_to_networkx
+from src.utils.Instrumentation import collect
+
+DENSE_LIMIT: int = 10000  # The dense engine stores |A|^2 bits, it is skipped for larger instances
+
+
+def _external(n: int, a: np.ndarray, b: np.ndarray) -> Set:
+    with tempfile.NamedTemporaryFile(suffix='.bin') as file:
+        write_edge_file(file.name, a, b)
+        return set(zip(*(part.tolist() for part in external_matching_augmentation(file.name, n))))
+
+
+# Engine -> function of an instance (n, a, b, G, A, M) returning L, M is the known matching {i, n + i}
+ENGINES: Dict[str, Callable] = {
+    'networkx': lambda n, a, b, G, A, M: bipartite_matching_augmentation(G, A, M, backend='networkx'),
+    'dense': lambda n, a, b, G, A, M: bipartite_matching_augmentation(G, A, M, backend='dense'),
+    'array': lambda n, a, b, G, A, M: bipartite_matching_augmentation(G, A, M, backend='array'),
+    'arrays': lambda n, a, b, G, A, M: set(zip(*(part.tolist() for part in
+                                                 augment_arrays(n, a, b, np.arange(n, 2 * n))))),
+    'packed': lambda n, a, b, G, A, M: packed_matching_augmentation([(G, A, M)])[0],
+    'external': lambda n, a, b, G, A, M: _external(n, a, b),
+}
+REFERENCE: str = 'networkx'
+
+COLUMNS: List[str] = ['family', 'n', 'seed', 'edges', 'critical', 'engine', 'robust', 'L', 'reference_L',
+                      'cover_sources', 'reference_cover_sources', 'cover_sinks', 'reference_cover_sinks',
+                      'within_bound', 'seconds', 'reference_seconds', 'ratio', 'mismatch']
+
+
+def harmonic(k: int) -> float:
+    """ Returns the harmonic number H(k) = 1 + 1/2 + ... + 1/k, the approximation factor of the greedy cover. """
+    return float(np.sum(1.0 / np.arange(1, k + 1))) if k > 0 else 1.0
+
+
+def within_bound(size: int, reference: int, factor: float) -> bool:
+    """ Returns whether both sizes are approximations of the same optimum with the given factor.
+
+    Notes
+    -----
+    Both sizes lie between the optimum and factor times the optimum, one extra edge is allowed for the marginal
+    case of bipartite_matching_augmentation.
+    """
+    return size <= factor * reference + 1 and reference <= factor * size + 1
+
+
+def remaining_critical_edges(G: nx.Graph, A: Set, M: Dict, L: Iterable) -> int:
+    """ Returns the number of critical edges of G + L, computed directly by NetworkX without any engine.
+
+    Notes
+    -----
+    Each edge {a, b} of G + L with a from A and b != M[a] gives the arc M[b] -> a of D, the matched edge {a, M[a]}
+    is critical iff a forms a trivial strong component of D.
+    """
+    D: nx.DiGraph = nx.DiGraph()
+    D.add_nodes_from(A)
+    for u, v in itertools.chain(G.edges, L):
+        a, b = (u, v) if u in A else (v, u)
+        if a not in A or b not in M or b in A:
+            raise ValueError("Edge {!r} does not join A and B.".format((u, v)))
+        if M[a] != b:
+            D.add_edge(M[b], a)
+    return sum(1 for component in nx.strongly_connected_components(D) if len(component) == 1)
+
+
+def _run_engine(engine: str, instance: tuple) -> Dict:
+    with collect() as statistics:
+        start = time.perf_counter()
+        L = ENGINES[engine](*instance)
+        seconds = time.perf_counter() - start
+    return {'L': L, 'seconds': seconds, 'cover_sources': statistics.counters.get('cover_sources', 0),
+            'cover_sinks': statistics.counters.get('cover_sinks', 0)}
+
+
+def compare(family: str, n: int, seed: int, engines: List[str]) -> List[Dict]:
+    """ Returns the records of the fast engines compared to the reference on the instance (family, n, seed). """
+    n, a, b = generate_arrays(family, n, seed)
+    G, A, M = bipartite_to_networkx(n, a, b)
+    instance = (n, a, b, G, A, M)
+    critical: int = remaining_critical_edges(G, A, M, [])
+    factor: float = harmonic(critical)
+
+    reference = _run_engine(REFERENCE, instance)
+    record = {'family': family, 'n': n, 'seed': seed, 'edges': len(a), 'critical': critical, 'engine': REFERENCE,
+              'L': len(reference['L']), 'reference_L': len(reference['L']), 'seconds': reference['seconds'],
+              'reference_seconds': reference['seconds'], 'ratio': 1.0, 'within_bound': True}
+    for name in ('cover_sources', 'cover_sinks'):
+        record[name] = record['reference_' + name] = reference[name]
+    try:
+        remaining = remaining_critical_edges(G, A, M, reference['L'])
+        record.update({'robust': remaining == 0,
+                       'mismatch': '{} critical edges remain'.format(remaining) if remaining > 0 else ''})
+    except ValueError as exception:
+        record.update({'robust': False, 'mismatch': 'ValueError: {}'.format(exception)})
+    records: List[Dict] = [record]
+    for engine in engines:
+        record = {'family': family, 'n': n, 'seed': seed, 'edges': len(a), 'critical': critical, 'engine': engine,
+                  'reference_L': len(reference['L']), 'reference_seconds': reference['seconds']}
+        if engine == 'dense' and n > DENSE_LIMIT:
+            records.append(dict(record, mismatch='skipped'))
+            continue
+        mismatches: List[str] = []
+        try:
+            result = _run_engine(engine, instance)
+            remaining = remaining_critical_edges(G, A, M, result['L'])
+        except Exception as exception:  # A failing engine is reported as a mismatch, the others still run
+            records.append(dict(record, mismatch='{}: {}'.format(type(exception).__name__, exception)))
+            continue
+
+        if remaining > 0:
+            mismatches.append('{} critical edges remain'.format(remaining))
+        bounded: bool = True
+        for name in ('L', 'cover_sources', 'cover_sinks'):
+            size = len(result[name]) if name == 'L' else result[name]
+            expected = len(reference[name]) if name == 'L' else reference[name]
+            record[name] = size
+            record['reference_' + name] = expected
+            if not within_bound(size, expected, factor):
+                bounded = False
+                mismatches.append('{} = {} is not within H(|X|) of {}'.format(name, size, expected))
+        record.update({'robust': remaining == 0, 'equal_L': len(result['L']) == len(reference['L']),
+                       'within_bound': bounded, 'seconds': result['seconds'],
+                       'ratio': result['seconds'] / max(reference['seconds'], 1e-9),
+                       'mismatch': '; '.join(mismatches)})
+        records.append(record)
+    return records
+
+
+def main(argv: List[str] = None, output=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.Differential')
+    parser.add_argument('--families', default='er,power_law,planted,gadget')
+    parser.add_argument('--sizes', default='1000,10000,100000')
+    parser.add_argument('--engines', default='dense,array,arrays,packed,external',
+                        help='fast engines compared to the reference, any of ' + ','.join(ENGINES))
+    parser.add_argument('--seeds', type=int, default=1, metavar='N', help='number of instances of each size')
+    parser.add_argument('--json', action='store_true', help='write JSON lines instead of a table')
+    arguments = parser.parse_args(argv)
+    output = output if output is not None else sys.stdout
+    engines: List[str] = arguments.engines.split(',')
+    for engine in engines:
+        if engine not in ENGINES:
+            parser.error('unknown engine {!r}'.format(engine))
+
+    records: List[Dict] = []
+    for family in arguments.families.split(','):
+        for n in map(int, arguments.sizes.split(',')):
+            for seed in range(arguments.seeds):
+                for record in compare(family, n, seed, engines):
+                    records.append(record)
+                    if arguments.json:
+                        output.write(json.dumps(record) + '\n')
+                        output.flush()
+
+    if not arguments.json:
+        print_table([{column: record.get(column, '') for column in COLUMNS} for record in records], output, COLUMNS)
+    failed = [record for record in records if record['mismatch'] not in ('', 'skipped')]
+    for record in failed:
+        sys.stderr.write('Mismatch: {family} n={n} seed={seed} {engine}: {mismatch}\n'.format(**record))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,185 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Awaitable entry points of the bipartite matching augmentation for asyncio applications.
+The computation runs in a thread or process executor, so that the event loop is not blocked, the number
+of concurrent computations is limited by a semaphore and concurrent requests for the same instance share
+a single computation.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+from src.utils.LazyImport import networkx as nx
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Set
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.ResultCache import ResultCache, instance_fingerprint
+from src.utils.Deadline import Deadline
+from src.utils.Instrumentation import increment
+
+
+def _solve(G: nx.Graph, A: Set, M: Dict, cache: ResultCache, backend: str, seconds: float,
+           deadline: Deadline = None) -> Set:
+    """ Runs in the executor. A token cannot be shared with a worker process, so that it is created there. """
+    if deadline is None and seconds is not None:
+        deadline = Deadline(seconds)
+    return bipartite_matching_augmentation(G, A, M, cache=cache, backend=backend, deadline=deadline)
+
+
+class _Computation:
+    """ A running computation shared by all requests for the same instance. """
+
+    def __init__(self):
+        self.deadline: Deadline = None  # Created when the computation starts in a thread
+        self.task: asyncio.Task = None
+        self.waiters: int = 0
+
+
+class AsyncAugmenter:
+    """ Runs bipartite_matching_augmentation in an executor on behalf of coroutines.
+
+    Parameters
+    ----------
+    max_concurrency : int = None
+        Maximal number of computations running at the same time, further requests wait for a free slot.
+        If None, it is the number of workers of the executor.
+    executor : Executor = None
+        Executor running the computations, it is not shut down by close(). If None, a ThreadPoolExecutor,
+        resp. a ProcessPoolExecutor if processes is True, with max_concurrency workers is created and owned.
+    processes : bool = False
+        Whether the owned executor uses processes. Processes avoid the global interpreter lock, but the instance
+        is pickled to the worker and a running computation cannot be cancelled.
+    cache : ResultCache = None
+        An optional on-disk cache of results passed to bipartite_matching_augmentation.
+
+    Attributes
+    ----------
+    coalesced : int
+        Number of requests answered by a computation started by an earlier request.
+
+    Notes
+    -----
+    Concurrent requests with the same fingerprint of (G, A, M), backend and timeout share one computation,
+    the fingerprint is computed on the event loop in time linear in the size of G. Each caller receives
+    its own copy of L. If the awaiting task is cancelled, the request is withdrawn, and when no request waits
+    for the computation any more, its Deadline token is cancelled. A computation in a thread then finishes
+    early with a degraded result, which is discarded, and it keeps its concurrency slot until it finishes.
+    G must not be mutated while a computation on it is running.
+
+    Examples
+    --------
+    >>> async with AsyncAugmenter(max_concurrency=4) as augmenter:
+    ...     L = await augmenter.augment(G, A, M, timeout=10)
+    """
+
+    def __init__(self, max_concurrency: int = None, executor: Executor = None, processes: bool = False,
+                 cache: ResultCache = None):
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be positive.")
+        self._owns_executor: bool = executor is None
+        if executor is None:
+            executor = (ProcessPoolExecutor if processes else ThreadPoolExecutor)(max_workers=max_concurrency)
+        if max_concurrency is None:
+            max_concurrency = getattr(executor, '_max_workers', 1)
+        self.max_concurrency: int = max_concurrency
+        self.processes: bool = isinstance(executor, ProcessPoolExecutor)
+        self.cache: ResultCache = cache
+        self.coalesced: int = 0
+        self._executor: Executor = executor
+        self._semaphore: asyncio.Semaphore = None  # Created lazily in the running event loop
+        self._computations: Dict = {}
+
+    async def augment(self, G: nx.Graph, A: Set, M: Dict = None, backend: str = None,
+                      timeout: float = None) -> Set:
+        """ Awaitable version of bipartite_matching_augmentation.
+
+        Parameters
+        ----------
+        G, A, M, backend
+            See bipartite_matching_augmentation.
+        timeout : float = None
+            Time budget of the computation in seconds, measured from its start. If it is exceeded, a valid,
+            but possibly larger, L is returned, see Deadline.
+
+        Returns
+        -------
+        L : Set
+            See bipartite_matching_augmentation.
+
+        Raises
+        ------
+        asyncio.CancelledError
+            If the awaiting task is cancelled.
+        """
+        key = (instance_fingerprint(G, A, M), backend, timeout)
+        computation: _Computation = self._computations.get(key)
+        if computation is None:
+            computation = _Computation()
+            computation.task = asyncio.ensure_future(self._run(computation, G, A, M, backend, timeout))
+            computation.task.add_done_callback(functools.partial(self._finished, key, computation))
+            self._computations[key] = computation
+        else:
+            self.coalesced += 1
+            increment('coalesced')
+
+        computation.waiters += 1
+        try:
+            L: Set = await asyncio.shield(computation.task)
+        except asyncio.CancelledError:
+            computation.waiters -= 1
+            if computation.waiters == 0 and not computation.task.done():
+                self._abandon(key, computation)
+            raise
+        computation.waiters -= 1
+        return set(L)
+
+    async def _run(self, computation: _Computation, G: nx.Graph, A: Set, M: Dict, backend: str,
+                   timeout: float) -> Set:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            if not self.processes:  # The token also serves for cancellation of the thread
+                computation.deadline = Deadline(timeout)
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, _solve, G, A, M, self.cache, backend, timeout, computation.deadline)
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if computation.deadline is not None:
+                    computation.deadline.cancel()
+                    await asyncio.wait([future])  # Keeps the slot until the thread finishes
+                else:
+                    future.cancel()
+                raise
+
+    def _abandon(self, key, computation: _Computation):
+        """ Cancels a computation nobody waits for. """
+        if self._computations.get(key) is computation:
+            del self._computations[key]
+        if computation.deadline is not None:
+            computation.deadline.cancel()
+        computation.task.cancel()
+
+    def _finished(self, key, computation: _Computation, task: asyncio.Task):
+        if self._computations.get(key) is computation:
+            del self._computations[key]
+        if not task.cancelled():
+            task.exception()  # Marks the exception as retrieved, waiters have received it
+
+    def pending(self) -> int:
+        """ Returns the number of computations that are running or waiting for a free slot. """
+        return len(self._computations)
+
+    def close(self, wait: bool = True):
+        """ Shuts the owned executor down. """
+        if self._owns_executor:
+            self._executor.shutdown(wait=wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exception_info):
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
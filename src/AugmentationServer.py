@@ -0,0 +1,330 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Resident augmentation server keeping loaded instances in memory between requests.
+
+Usage: python -m src.AugmentationServer [-h] [--host HOST] [--port PORT | --unix PATH] [--workers N]
+                                        [--data-dir DIR]
+
+Loading an instance computes its perfect matching, D and the condensation of D once, queries are then answered
+from the resident condensation by a pool of worker threads. The server speaks JSON over HTTP on localhost,
+or on a Unix socket if --unix is given:
+
+    PUT    /instances/<id>            load an instance, the body is a JSONL record of src.BatchDriver
+                                      or {"path": FILE, "format": "jsonl" | "edgelist"} (the first instance in FILE),
+                                      FILE is resolved under --data-dir, loading by path is disabled without it
+    DELETE /instances/<id>            unload an instance
+    GET    /instances                 list the loaded instances
+    POST   /instances/<id>/augment    {"deadline": SECONDS, "sizes_only": false} -> {"size", "L", "seconds"}
+    GET    /instances/<id>/critical   critical edges -> {"size", "critical"}
+    POST   /instances/<id>/verify     {"L": [[a, b], ...]} -> {"valid", "remaining_critical"}
+    GET    /memory                    resident memory of the process and of each instance in bytes
+
+Errors are reported as {"error": "..."} with the status 400 for invalid requests and 404 for unknown instances.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from src.algo.ArrayBackend import ArrayCondensation, prepare_condensation, augment_condensation, \
+    critical_edges_of_condensation, remaining_critical
+from src.BatchDriver import build_instance, read_jsonl, read_edgelist, _vertex_from_json
+from src.utils.Deadline import Deadline
+from src.utils.Instrumentation import resident_memory
+from src.exceptions.Exceptions import bipartite_ghraph_not_augmentable_exception, unknown_instance_exception
+
+
+class _Instance:
+    """ A loaded instance. """
+
+    def __init__(self, condensation: ArrayCondensation, num_of_vertices: int, num_of_edges: int, seconds: float):
+        self.condensation: ArrayCondensation = condensation
+        self.num_of_vertices: int = num_of_vertices
+        self.num_of_edges: int = num_of_edges
+        self.load_seconds: float = seconds
+        self.queries: int = 0
+
+    def summary(self, instance_id: str) -> Dict:
+        return {'id': instance_id, 'vertices': self.num_of_vertices, 'edges': self.num_of_edges,
+                'components': self.condensation.num_of_components,
+                'critical': int(self.condensation.X.sum()), 'bytes': self.condensation.nbytes(),
+                'load_seconds': round(self.load_seconds, 6), 'queries': self.queries}
+
+
+class AugmentationService:
+    """ Loaded instances and the operations on them, independent of the transport.
+
+    Parameters
+    ----------
+    workers : int = None
+        Number of worker threads answering the queries, os.cpu_count() if None.
+    data_directory : str = None
+        Directory of the files that instances may be loaded from by path. Paths are resolved under it and
+        anything outside it is rejected. If None, loading by path is disabled.
+
+    Notes
+    -----
+    All operations are safe to call from multiple threads, each of them runs in the worker pool, so that
+    at most workers operations run at the same time. A resident condensation is never modified by a query,
+    an instance unloaded during a query is released when the query finishes. Unknown instances raise
+    unknown_instance_exception, invalid requests raise ValueError.
+    """
+
+    def __init__(self, workers: int = None, data_directory: str = None):
+        self.workers: int = workers or os.cpu_count() or 1
+        self.data_directory: str = os.path.realpath(data_directory) if data_directory is not None else None
+        self._pool = ThreadPoolExecutor(max_workers=self.workers)
+        self._lock = threading.Lock()
+        self._instances: Dict[str, _Instance] = {}
+
+    def _run(self, function, *arguments):
+        return self._pool.submit(function, *arguments).result()
+
+    def _instance(self, instance_id: str) -> _Instance:
+        with self._lock:
+            instance = self._instances.get(instance_id)
+            if instance is None:
+                raise unknown_instance_exception(instance_id)
+            instance.queries += 1
+            return instance
+
+    def load(self, instance_id: str, record: Dict) -> Dict:
+        """ Loads an instance given as a JSONL record of src.BatchDriver, or by {"path": ..., "format": ...}. """
+        return self._run(self._load, instance_id, record)
+
+    def _resolve(self, path) -> str:
+        """ Returns the real path of a file under the data directory, raises ValueError for any other path. """
+        if self.data_directory is None:
+            raise ValueError("Loading by path is disabled, the server has no data directory.")
+        if not isinstance(path, str):
+            raise ValueError("The path must be a string.")
+        resolved = os.path.realpath(os.path.join(self.data_directory, path))
+        if os.path.commonpath([self.data_directory, resolved]) != self.data_directory or \
+                not os.path.isfile(resolved):
+            raise ValueError("No such file in the data directory.")
+        return resolved
+
+    def _load(self, instance_id: str, record: Dict) -> Dict:
+        start = time.perf_counter()
+        if 'path' in record:
+            path = self._resolve(record['path'])
+            file_format = record.get('format') or ('jsonl' if path.endswith(('.jsonl', '.json')) else 'edgelist')
+            if file_format not in ('jsonl', 'edgelist'):
+                raise ValueError("Unknown format {!r}.".format(file_format))
+            reader = read_jsonl if file_format == 'jsonl' else read_edgelist
+            with open(path) as stream:
+                instance = next(reader(stream, record['path']), None)
+            if instance is None:
+                raise ValueError("No instance in the file.")
+        else:
+            if 'edges' not in record:
+                raise ValueError("The instance has no edges.")
+            instance = next(read_jsonl([json.dumps(record)], instance_id))
+        if 'error' in instance:
+            raise ValueError(instance['error'])
+
+        G, A, M = build_instance(instance)
+        if len(A) <= 1 or len(G) != 2 * len(A):
+            raise bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+        condensation = prepare_condensation(G, A, M, keep_components=True)
+        loaded = _Instance(condensation, len(G), G.number_of_edges(), time.perf_counter() - start)
+        del G, A, M, instance  # Only the condensation stays resident
+        with self._lock:
+            self._instances[instance_id] = loaded
+            return loaded.summary(instance_id)
+
+    def unload(self, instance_id: str) -> Dict:
+        """ Unloads an instance, its memory is released when no query uses it. """
+        with self._lock:
+            if instance_id not in self._instances:
+                raise unknown_instance_exception(instance_id)
+            del self._instances[instance_id]
+        return {'id': instance_id, 'unloaded': True}
+
+    def instances(self) -> List[Dict]:
+        """ Returns summaries of the loaded instances. """
+        with self._lock:
+            return [instance.summary(instance_id) for instance_id, instance in self._instances.items()]
+
+    def augment(self, instance_id: str, deadline: float = None, sizes_only: bool = False) -> Dict:
+        """ Returns the augmenting set of a loaded instance, see bipartite_matching_augmentation. """
+        instance = self._instance(instance_id)
+        return self._run(self._augment, instance, deadline, sizes_only)
+
+    @staticmethod
+    def _augment(instance: _Instance, seconds: float, sizes_only: bool) -> Dict:
+        start = time.perf_counter()
+        deadline = Deadline(seconds) if seconds is not None else None
+        L = augment_condensation(instance.condensation, deadline)
+        result = {'size': len(L)}
+        if not sizes_only:
+            result['L'] = sorted(L, key=repr)
+        result['seconds'] = round(time.perf_counter() - start, 6)
+        if deadline is not None and deadline.degraded:
+            result['degraded'] = True
+        return result
+
+    def critical(self, instance_id: str) -> Dict:
+        """ Returns the critical edges of a loaded instance, see critical_edges. """
+        instance = self._instance(instance_id)
+        critical = self._run(critical_edges_of_condensation, instance.condensation)
+        return {'size': len(critical), 'critical': sorted(critical, key=repr)}
+
+    def verify(self, instance_id: str, L: List) -> Dict:
+        """ Checks whether L is an augmenting set of a loaded instance. """
+        instance = self._instance(instance_id)
+        remaining = self._run(remaining_critical, instance.condensation, L)
+        return {'valid': remaining == 0, 'remaining_critical': remaining}
+
+    def memory(self) -> Dict:
+        """ Returns the resident set size of the process and an estimate of the memory of each instance. """
+        with self._lock:
+            instances = {instance_id: instance.condensation.nbytes()
+                         for instance_id, instance in self._instances.items()}
+        return {'rss': resident_memory(), 'instances': instances, 'total': sum(instances.values())}
+
+    def close(self):
+        """ Shuts the worker pool down and unloads all instances. """
+        self._pool.shutdown(wait=True)
+        with self._lock:
+            self._instances.clear()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """ Maps HTTP requests to the operations of the AugmentationService of the server. """
+
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            sys.stderr.write('{} {}\n'.format(self.log_date_time_string(), format % args))
+
+    def _send(self, status: int, body: Dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _body(self) -> Dict:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length == 0:
+            return {}
+        body = json.loads(self.rfile.read(length))
+        if not isinstance(body, dict):
+            raise ValueError("The body must be a JSON object.")
+        return body
+
+    def _dispatch(self, method: str):
+        service: AugmentationService = self.server.service
+        parts = [part for part in self.path.split('?', 1)[0].split('/') if part]
+        try:
+            body = self._body() if method in ('PUT', 'POST') else {}
+            if method == 'GET' and parts == ['memory']:
+                return self._send(200, service.memory())
+            if method == 'GET' and parts == ['instances']:
+                return self._send(200, {'instances': service.instances()})
+            if len(parts) == 2 and parts[0] == 'instances':
+                if method == 'PUT':
+                    return self._send(200, service.load(parts[1], body))
+                if method == 'DELETE':
+                    return self._send(200, service.unload(parts[1]))
+            if len(parts) == 3 and parts[0] == 'instances':
+                if method == 'POST' and parts[2] == 'augment':
+                    return self._send(200, service.augment(parts[1], body.get('deadline'),
+                                                           bool(body.get('sizes_only', False))))
+                if method == 'GET' and parts[2] == 'critical':
+                    return self._send(200, service.critical(parts[1]))
+                if method == 'POST' and parts[2] == 'verify':
+                    L = [tuple(map(_vertex_from_json, edge)) for edge in body.get('L', [])]
+                    return self._send(200, service.verify(parts[1], L))
+            self._send(404, {'error': 'Unknown request {} {}'.format(method, self.path)})
+        except unknown_instance_exception as exception:
+            self._send(404, {'error': 'Unknown instance {}'.format(exception)})
+        except Exception as exception:  # A bad request must not stop the server
+            self._send(400, {'error': '{}: {}'.format(type(exception).__name__, exception)})
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+
+class _UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('unix', 0)  # BaseHTTPRequestHandler expects a (host, port) address
+
+
+def make_server(service: AugmentationService, host: str = '127.0.0.1', port: int = 0, unix: str = None,
+                verbose: bool = False) -> socketserver.BaseServer:
+    """ Returns an HTTP server of the service, call serve_forever() to run it.
+
+    Parameters
+    ----------
+    service : AugmentationService
+        The loaded instances and the worker pool.
+    host, port : str, int
+        Address of the TCP socket, port 0 selects a free port, see server.server_address.
+    unix : str = None
+        If given, a Unix socket at this path is used instead of TCP.
+    verbose : bool = False
+        Whether requests are logged to the standard error.
+    """
+    if unix is not None:
+        server = _UnixHTTPServer(unix, _Handler)
+    else:
+        server = ThreadingHTTPServer((host, port), _Handler)
+    server.service = service
+    server.verbose = verbose
+    return server
+
+
+def main(argv: List[str] = None) -> int:
+    """ Runs the server with command-line arguments argv until interrupted, returns the exit code. """
+    parser = argparse.ArgumentParser(prog='python -m src.AugmentationServer',
+                                     description='Keeps bipartite graphs loaded and answers augmentation, '
+                                                 'critical edge and verification queries over HTTP.')
+    parser.add_argument('--host', default='127.0.0.1', help='address to listen on')
+    parser.add_argument('--port', type=int, default=8642, help='TCP port to listen on')
+    parser.add_argument('--unix', default=None, metavar='PATH', help='listen on a Unix socket instead of TCP')
+    parser.add_argument('--workers', type=int, default=None, metavar='N', help='number of worker threads')
+    parser.add_argument('--data-dir', default=None, metavar='DIR',
+                        help='directory that instances may be loaded from by path, disabled if not given')
+    parser.add_argument('--verbose', action='store_true', help='log requests to the standard error')
+    arguments = parser.parse_args(argv)
+
+    service = AugmentationService(arguments.workers, arguments.data_dir)
+    server = make_server(service, arguments.host, arguments.port, arguments.unix, arguments.verbose)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+        if arguments.unix is not None and os.path.exists(arguments.unix):
+            os.unlink(arguments.unix)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
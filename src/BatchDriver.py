@@ -0,0 +1,234 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Command-line batch driver computing augmenting sets for streams of instances.
+
+Usage: python -m src.BatchDriver [-h] [--format {jsonl,edgelist}] [--workers N] [--output FILE]
+                                 [--cache DIR] [--sizes-only] [--deadline SECONDS] [--validate] [FILE ...]
+
+Instances are read from the given files, or from the standard input if no file (or '-') is given.
+
+JSONL format, one instance per line:
+    {"id": "x", "edges": [[a, b], ...], "A": [a, ...], "M": [[a, b], ...]}
+    Only "edges" is mandatory. If "A" is missing, the first vertex of each edge is taken to be in A.
+    If "M" is missing, a perfect matching is computed.
+
+Edge-list format, instances separated by an empty line, '#' starts a comment:
+    a b      an edge, where a is from A and b from B
+    a b *    an edge of the perfect matching M, if any edge is marked, all matched edges must be marked
+    Vertices that look like integers are read as integers. The id of an instance is FILE:N for the N-th
+    instance in FILE, counted from 1.
+
+Results are written as JSON lines in the input order as soon as they are available:
+    {"id": "x", "size": 2, "L": [[a, b], ...], "seconds": 0.01}
+    {"id": "z", "size": 9, "L": [[a, b], ...], "seconds": 1.0, "degraded": true}   if the deadline expired
+    {"id": "y", "error": "..."}
+A malformed JSONL line or edge-list instance is reported by an error record as well, the batch continues.
+"""
+
+from __future__ import annotations
+
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, Iterator, List
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.ResultCache import ResultCache
+from src.utils.Deadline import Deadline
+
+_worker_cache: ResultCache = None
+_worker_sizes_only: bool = False
+_worker_deadline: float = None
+_worker_validate: bool = False
+
+
+def _vertex(token: str):
+    """ Returns token as int if it represents an integer, otherwise the token itself. """
+    try:
+        return int(token)
+    except ValueError:
+        return token
+
+
+def _vertex_from_json(vertex):
+    """ JSON has no tuples, lists are converted so that the vertex is hashable. """
+    return tuple(map(_vertex_from_json, vertex)) if isinstance(vertex, list) else vertex
+
+
+def read_jsonl(stream, name: str) -> Iterator[Dict]:
+    """ Yields instances from a stream in the JSONL format, see the module description.
+    A malformed line is yielded as an instance with an 'error' instead of its edges. """
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        identifier = '{}:{}'.format(name, number)
+        try:
+            record = json.loads(line)
+            if isinstance(record, dict):
+                identifier = record.get('id', identifier)
+            instance = {'id': identifier,
+                        'edges': [tuple(map(_vertex_from_json, edge)) for edge in record['edges']]}
+            if 'A' in record:
+                instance['A'] = list(map(_vertex_from_json, record['A']))
+            if 'M' in record:
+                instance['M'] = [tuple(map(_vertex_from_json, edge)) for edge in record['M']]
+        except (ValueError, KeyError, TypeError) as exception:  # json.JSONDecodeError is a ValueError
+            instance = {'id': identifier, 'error': '{}: {}'.format(type(exception).__name__, exception)}
+        yield instance
+
+
+def read_edgelist(stream, name: str) -> Iterator[Dict]:
+    """ Yields instances from a stream in the edge-list format, see the module description.
+    An instance with a malformed line is yielded with an 'error' instead of its edges. """
+    number: int = 0
+    edges: List = []
+    matching: List = []
+    error: str = None
+
+    def instance():
+        if error is not None:
+            return {'id': '{}:{}'.format(name, number), 'error': error}
+        result = {'id': '{}:{}'.format(name, number), 'edges': edges}
+        if matching:
+            result['M'] = matching
+        return result
+
+    for line_number, line in enumerate(stream, 1):
+        tokens = line.split('#', 1)[0].split()
+        if not tokens:
+            if not line.strip() and (edges or error is not None):  # Empty line terminates the instance
+                number += 1
+                yield instance()
+                edges, matching, error = [], [], None
+            continue
+        if len(tokens) not in (2, 3) or (len(tokens) == 3 and tokens[2] != '*'):
+            if error is None:  # The rest of the instance is skipped, the next one is read normally
+                error = "ValueError: Malformed line {} in {}".format(line_number, name)  # Not its content
+            continue
+        edge = (_vertex(tokens[0]), _vertex(tokens[1]))
+        edges.append(edge)
+        if len(tokens) == 3:
+            matching.append(edge)
+
+    if edges or error is not None:
+        number += 1
+        yield instance()
+
+
+def build_instance(instance: Dict) -> (nx.Graph, set, Dict):
+    """ Returns (G, A, M) of an instance read by read_jsonl or read_edgelist, M is None if not given. """
+    G: nx.Graph = nx.Graph()
+    G.add_edges_from(instance['edges'])
+    A = set(instance['A']) if 'A' in instance else {a for a, _ in instance['edges']}
+    M = None
+    if 'M' in instance:
+        M = {}
+        for a, b in instance['M']:
+            M[a], M[b] = b, a
+    return G, A, M
+
+
+def solve_instance(instance: Dict) -> Dict:
+    """ Returns the result record of a single instance, errors are reported in the record. """
+    if 'error' in instance:  # The instance could not be read
+        return {'id': instance['id'], 'error': instance['error']}
+    start = time.perf_counter()
+    deadline = Deadline(_worker_deadline) if _worker_deadline is not None else None
+    try:
+        G, A, M = build_instance(instance)
+        L = bipartite_matching_augmentation(G, A, M, cache=_worker_cache, deadline=deadline,
+                                            validate=_worker_validate)
+    except Exception as exception:  # One bad instance must not stop the whole batch
+        return {'id': instance['id'], 'error': '{}: {}'.format(type(exception).__name__, exception)}
+
+    result = {'id': instance['id'], 'size': len(L)}
+    if not _worker_sizes_only:
+        result['L'] = sorted(L, key=repr)
+    result['seconds'] = round(time.perf_counter() - start, 6)
+    if deadline is not None and deadline.degraded:
+        result['degraded'] = True
+    return result
+
+
+def _initialize_worker(cache_directory: str, sizes_only: bool, deadline: float = None, validate: bool = False):
+    global _worker_cache, _worker_sizes_only, _worker_deadline, _worker_validate
+    _worker_cache = ResultCache(cache_directory) if cache_directory is not None else None
+    _worker_sizes_only = sizes_only
+    _worker_deadline = deadline
+    _worker_validate = validate
+
+
+def _instances(paths: List[str], input_format: str, stdin) -> Iterator[Dict]:
+    for path in paths or ['-']:
+        file_format = input_format
+        if file_format is None:
+            file_format = 'jsonl' if path.endswith(('.jsonl', '.json')) or path == '-' else 'edgelist'
+        reader = read_jsonl if file_format == 'jsonl' else read_edgelist
+        if path == '-':
+            yield from reader(stdin, '<stdin>')
+        else:
+            with open(path) as stream:
+                yield from reader(stream, path)
+
+
+def main(argv: List[str] = None, stdin=None, stdout=None) -> int:
+    """ Runs the batch driver with command-line arguments argv, returns the exit code. """
+    parser = argparse.ArgumentParser(prog='python -m src.BatchDriver',
+                                     description='Computes augmenting sets of bipartite graphs for batches of '
+                                                 'instances. Results are written as JSON lines in the input order.')
+    parser.add_argument('files', nargs='*', metavar='FILE', help="input files, '-' or none for standard input")
+    parser.add_argument('--format', choices=('jsonl', 'edgelist'), default=None,
+                        help='input format, by default jsonl for .jsonl/.json files and standard input, '
+                             'edgelist otherwise')
+    parser.add_argument('--workers', type=int, default=1, metavar='N', help='number of worker processes')
+    parser.add_argument('--output', default='-', metavar='FILE', help="output file, '-' for standard output")
+    parser.add_argument('--cache', default=None, metavar='DIR', help='directory of a persistent result cache')
+    parser.add_argument('--sizes-only', action='store_true', help='do not write the augmenting sets')
+    parser.add_argument('--deadline', type=float, default=None, metavar='SECONDS',
+                        help='time budget of a single instance, a valid but possibly larger augmenting set is '
+                             'written if it is exceeded')
+    parser.add_argument('--validate', action='store_true',
+                        help='check each instance first and report all problems of an invalid instance')
+    arguments = parser.parse_args(argv)
+
+    stdin = stdin if stdin is not None else sys.stdin
+    stdout = stdout if stdout is not None else sys.stdout
+    output = stdout if arguments.output == '-' else open(arguments.output, 'w')
+
+    instances = _instances(arguments.files, arguments.format, stdin)
+    initializer_arguments = (arguments.cache, arguments.sizes_only, arguments.deadline, arguments.validate)
+    failed: int = 0
+    pool = None
+    try:
+        if arguments.workers <= 1:
+            _initialize_worker(*initializer_arguments)
+            results = map(solve_instance, instances)
+        else:
+            pool = multiprocessing.Pool(arguments.workers, _initialize_worker, initializer_arguments)
+            results = pool.imap(solve_instance, instances)
+
+        for result in results:
+            failed += 'error' in result
+            output.write(json.dumps(result) + '\n')
+            output.flush()  # Results are consumed incrementally by the pipeline
+
+        if pool is not None:
+            pool.close()
+            pool.join()
+            pool = None
+    finally:
+        if pool is not None:  # Reading of the input failed
+            pool.terminate()
+        if output is not stdout:
+            output.close()
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
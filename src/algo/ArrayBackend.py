@@ -0,0 +1,423 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Array backend of the bipartite matching augmentation algorithm for large sparse bipartite graphs.
+G is converted to CSR arrays once, the matching, D, its strong components and all traversals of the condensation
+are then computed on NumPy arrays by SciPy, without constructing any NetworkX graph.
+"""
+
+from __future__ import annotations
+
+import sys
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from concurrent.futures import Executor
+from src.algo.EswaranTarjan import eswaran_tarjan_arrays
+from src.algo.SourceCover import source_cover_arrays
+from src.algo.FastPaths import close_single_trivial
+from src.utils.ArrayFunctions import graph_to_csr, matching_to_array, mask_from_set, perfect_matching_array, \
+    bipartite_csr_to_D_arcs, condensation_arrays, sources_sinks_isolated_arrays, transpose_csr, reachable_mask, \
+    edges_to_csr, strong_components
+from src.utils.Instrumentation import phase, increment, event
+from src.utils.Deadline import Deadline
+from src.utils.Validation import validate_instance, validate_bipartite_arrays
+from src.utils.Concurrency import run_concurrently
+from src.exceptions import Exceptions
+
+
+class ArrayCondensation:
+    """ The condensation of D of a bipartite graph G together with everything needed to map results back to G.
+
+    Attributes
+    ----------
+    labels : List
+        Vertices of G, vertex labels[i] of G is represented by integer i.
+    index : Dict
+        Dictionary inverse to labels.
+    mate : np.ndarray
+        The perfect matching of G as an array of mates.
+    num_of_components : int
+        Number of strong components of D, which are the vertices 0..num_of_components-1 of the condensation.
+    indptr, indices : np.ndarray
+        CSR arrays of the condensation.
+    X : np.ndarray
+        Boolean mask of trivial strong components, which correspond to critical edges of G.
+    sources, sinks, isolated : np.ndarray
+        Sources, sinks and isolated vertices of the condensation.
+    representative : np.ndarray
+        A vertex of G (from A) in each strong component.
+    component : np.ndarray
+        Strong component of each vertex of A, -1 for vertices of B. None unless requested by prepare_condensation.
+    """
+
+    def __init__(self, labels: List, index: Dict, mate: np.ndarray, num_of_components: int, indptr: np.ndarray,
+                 indices: np.ndarray, X: np.ndarray, sources: np.ndarray, sinks: np.ndarray, isolated: np.ndarray,
+                 representative: np.ndarray, component: np.ndarray = None):
+        self.labels: List = labels
+        self.index: Dict = index
+        self.mate: np.ndarray = mate
+        self.num_of_components: int = num_of_components
+        self.indptr: np.ndarray = indptr
+        self.indices: np.ndarray = indices
+        self.X: np.ndarray = X
+        self.sources: np.ndarray = sources
+        self.sinks: np.ndarray = sinks
+        self.isolated: np.ndarray = isolated
+        self.representative: np.ndarray = representative
+        self.component: np.ndarray = component
+
+    def nbytes(self) -> int:
+        """ Returns an estimate of the memory held by the structure in bytes. """
+        arrays = (self.mate, self.indptr, self.indices, self.X, self.sources, self.sinks, self.isolated,
+                  self.representative, self.component)
+        # The labels themselves are shared with G, only the containers are accounted
+        return sum(array.nbytes for array in arrays if array is not None) + sys.getsizeof(self.labels) + \
+            sys.getsizeof(self.index)
+
+
+def prepare_condensation(G: nx.Graph, A: Set, M: Dict = None, keep_components: bool = False,
+                         validate: bool = False) -> ArrayCondensation:
+    """ Computes the matching (if not given), D and its condensation of a bipartite graph G on NumPy arrays.
+
+    Parameters
+    ----------
+    G, A, M
+        See array_matching_augmentation.
+    keep_components : bool = False
+        Whether to keep the strong component of each vertex, which is needed by remaining_critical.
+    validate : bool = False
+        If True, the instance is checked by Validation.validate_instance on the CSR arrays computed here.
+
+    Returns
+    -------
+    ArrayCondensation
+        The condensation of D, vertices of D are the vertices of A.
+
+    Raises
+    ------
+    NetworkXError
+        If M is not given and G does not admit a perfect matching.
+    invalid_instance_exception
+        If validate is True and the instance is not valid.
+    """
+    with phase('matching'):
+        labels, index, indptr, indices = graph_to_csr(G)
+        if validate:
+            in_A, mate = validate_instance(G, A, M, (labels, index, indptr, indices))
+        else:
+            in_A = mask_from_set(A, labels)
+            mate = matching_to_array(M, labels, index) if M is not None else None
+        if mate is None:
+            mate = perfect_matching_array(indptr, indices, in_A)
+    return _condensation_of_csr(labels, index, indptr, indices, in_A, mate, keep_components)
+
+
+def condensation_of_csr(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray, mate: np.ndarray,
+                        keep_components: bool = False) -> ArrayCondensation:
+    """ Computes D and its condensation of a bipartite graph given by CSR arrays, see prepare_condensation.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        Symmetric CSR arrays of G on vertices 0..n-1, they are only read, so they may be views of shared memory.
+    in_A : np.ndarray
+        Boolean mask of the bipartition A.
+    mate : np.ndarray
+        A perfect matching of G as an array of mates.
+    keep_components : bool = False
+        See prepare_condensation.
+
+    Returns
+    -------
+    ArrayCondensation
+        The condensation of D, whose labels are the integers 0..n-1 themselves.
+    """
+    return _condensation_of_csr(range(len(indptr) - 1), None, indptr, indices, in_A, mate, keep_components)
+
+
+def _condensation_of_csr(labels, index: Dict, indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray,
+                         mate: np.ndarray, keep_components: bool) -> ArrayCondensation:
+    """ Builds D and its condensation from symmetric CSR arrays of G and the matching, see prepare_condensation. """
+    with phase('D'):
+        tails, heads = bipartite_csr_to_D_arcs(indptr, indices, in_A, mate)
+        vertices = np.flatnonzero(in_A)  # Vertex i of D is vertices[i] of G
+        local = np.empty(len(labels), dtype=np.int64)
+        local[vertices] = np.arange(len(vertices), dtype=np.int64)
+        del indptr, indices, in_A
+
+    with phase('condensation'):
+        num_of_components, component, c_indptr, c_indices = condensation_arrays(len(vertices), local[tails],
+                                                                                 local[heads])
+        del tails, heads, local
+
+    with phase('classification'):
+        X = np.bincount(component, minlength=num_of_components) == 1  # Trivial strong components
+        sources, sinks, isolated = sources_sinks_isolated_arrays(c_indptr, c_indices)
+        # Only a representative of each component is needed from now on
+        representative = np.empty(num_of_components, dtype=np.int64)
+        representative[component] = vertices
+        if keep_components:
+            component_of_vertex = np.full(len(labels), -1, dtype=np.int64)
+            component_of_vertex[vertices] = component
+        else:
+            component_of_vertex = None
+        del component, vertices
+
+    return ArrayCondensation(labels, index, mate, num_of_components, c_indptr, c_indices, X, sources, sinks,
+                             isolated, representative, component_of_vertex)
+
+
+def augment_condensation(C: ArrayCondensation, deadline: Deadline = None, executor: Executor = None,
+                         cover_method: str = 'greedy', cover_executor: Executor = None) -> Set:
+    """ Returns the augmenting set of the graph whose condensation C was computed by prepare_condensation.
+
+    Parameters
+    ----------
+    C : ArrayCondensation
+        The condensation of D, it is not modified, so that it can be queried repeatedly.
+    deadline: Deadline = None
+        An optional deadline or cancellation token, see bipartite_matching_augmentation.
+    executor: Executor = None
+        An optional thread pool running the independent phases concurrently, see bipartite_matching_augmentation.
+    cover_method: str = 'greedy'
+        The set cover method of source_cover, see bipartite_matching_augmentation.
+    cover_executor: Executor = None
+        An optional pool splitting the rounds of the 'parallel' cover method, see bipartite_matching_augmentation.
+
+    Returns
+    -------
+    L : Set
+        See array_matching_augmentation.
+    """
+    X = C.X
+    c_indptr, c_indices = C.indptr, C.indices
+    trivial = np.flatnonzero(X)
+    if len(trivial) == 0:  # If there is no trivial strong component, G admits a perfect matching after edge removal
+        increment('fast_path_robust')
+        return set()
+    if len(trivial) == 1:  # A single trivial strong component is put on a cycle directly, see FastPaths
+        increment('fast_path_single_trivial')
+        x = int(trivial[0])
+        predecessors = np.searchsorted(c_indptr, np.flatnonzero(c_indices == x), side='right') - 1
+        arcs = close_single_trivial(x, c_indices[c_indptr[x]:c_indptr[x + 1]], predecessors, 1 if x == 0 else 0)
+        mate: List[int] = C.mate.tolist()
+        return {(C.labels[C.representative[v]], C.labels[mate[C.representative[u]]]) for u, v in arcs}
+    increment('fast_path_missed')
+
+    r_indptr, r_indices = transpose_csr(c_indptr, c_indices)
+    try:
+        if deadline is not None:
+            deadline.check()
+
+        with phase('source_cover'):
+            C_0, C_1 = run_concurrently(
+                executor,
+                lambda: source_cover_arrays(c_indptr, c_indices, X, np.concatenate((C.sources, C.isolated)), deadline,
+                                            cover_method, cover_executor),
+                lambda: source_cover_arrays(r_indptr, r_indices, X, np.concatenate((C.sinks, C.isolated)), deadline,
+                                            cover_method, cover_executor))
+            increment('cover_sources', len(C_0))
+            increment('cover_sinks', len(C_1))
+
+        with phase('sweeps'):
+            if deadline is not None:
+                deadline.check()
+            start_CX, start_XC = X.copy(), X.copy()
+            start_CX[C_0] = True
+            start_XC[C_1] = True
+            D_hat, XC = run_concurrently(executor, lambda: reachable_mask(c_indptr, c_indices, start_CX),
+                                         lambda: reachable_mask(r_indptr, r_indices, start_XC))
+            D_hat &= XC  # CX vertices intersected with XC vertices
+            del start_CX, start_XC, XC, C_0, C_1
+    except Exceptions.deadline_exceeded_exception:
+        # All sources, resp. all sinks, trivially cover X, then D_hat is the whole condensation
+        D_hat = np.ones(C.num_of_components, dtype=bool)
+        deadline.degraded = True
+        event('deadline', function='array_matching_augmentation', degraded=True)
+    del r_indptr, r_indices
+
+    if np.count_nonzero(D_hat) == 1:  # Marginal case, see bipartite_matching_augmentation
+        D_hat[np.flatnonzero(~D_hat)[0]] = True
+
+    with phase('eswaran_tarjan'):
+        hat_vertices = np.flatnonzero(D_hat)
+        hat_local = np.full(C.num_of_components, -1, dtype=np.int64)
+        hat_local[hat_vertices] = np.arange(len(hat_vertices), dtype=np.int64)
+        c_tails = np.repeat(np.arange(C.num_of_components, dtype=np.int64), np.diff(c_indptr))
+        mask = D_hat[c_tails] & D_hat[c_indices]
+        h_indptr, h_indices = edges_to_csr(len(hat_vertices), hat_local[c_tails[mask]], hat_local[c_indices[mask]])
+        del c_tails, mask
+        sources, sinks, isolated = C.sources, C.sinks, C.isolated
+        L_star: Set = eswaran_tarjan_arrays(h_indptr, h_indices, hat_local[sources[D_hat[sources]]],
+                                            hat_local[sinks[D_hat[sinks]]], hat_local[isolated[D_hat[isolated]]])
+
+    # Map arcs of the condensation to edges of G through a representative of each component
+    representative: List[int] = C.representative[hat_vertices].tolist()
+    mate: List[int] = C.mate.tolist()
+    labels = C.labels
+    return {(labels[representative[v]], labels[mate[representative[u]]]) for u, v in L_star}
+
+
+def critical_edges_of_condensation(C: ArrayCondensation) -> List:
+    """ Returns the critical edges (a, b) of the graph whose condensation C was computed by prepare_condensation. """
+    critical: List[int] = C.representative[C.X].tolist()
+    mate: List[int] = C.mate.tolist()
+    return [(C.labels[a], C.labels[mate[a]]) for a in critical]
+
+
+def remaining_critical(C: ArrayCondensation, L) -> int:
+    """ Returns the number of critical edges of G that remain critical after the edges L are added to G.
+
+    Parameters
+    ----------
+    C : ArrayCondensation
+        The condensation of D computed by prepare_condensation with keep_components=True.
+    L : Iterable
+        Edges (a, b), where a is from A and b from B, which need not be edges of G.
+
+    Returns
+    -------
+    int
+        Zero iff L is an augmenting set of G, that is G + L admits a perfect matching after removal
+        of any single edge.
+
+    Raises
+    ------
+    ValueError
+        If a vertex of L is not a vertex of G, or an edge of L does not join A and B.
+
+    Notes
+    -----
+    M remains a perfect matching of G + L, an edge (a, b) adds the arc M[b] -> a to D. A critical edge
+    stays critical iff its trivial strong component remains trivial after the arcs of L are added
+    to the condensation, which is checked by one strong components computation of the condensation.
+    """
+    if C.component is None:
+        raise ValueError("The strong components of vertices were not kept.")
+    tails, heads = [], []
+    for a, b in L:
+        if a not in C.index or b not in C.index:
+            raise ValueError("Edge {!r} is not between vertices of G.".format((a, b)))
+        a, b = C.index[a], C.index[b]
+        if C.component[a] < 0 or C.component[b] >= 0:
+            raise ValueError("Edge {!r} does not join A and B.".format((C.labels[a], C.labels[b])))
+        tails.append(C.component[C.mate[b]])
+        heads.append(C.component[a])
+    c_tails = np.repeat(np.arange(C.num_of_components, dtype=np.int64), np.diff(C.indptr))
+    _, merged = strong_components(C.num_of_components, np.concatenate((c_tails, np.asarray(tails, dtype=np.int64))),
+                                  np.concatenate((C.indices, np.asarray(heads, dtype=np.int64))))
+    return int(np.count_nonzero(C.X & (np.bincount(merged)[merged] == 1)))
+
+
+def array_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None, deadline: Deadline = None,
+                                validate: bool = False, executor: Executor = None, cover_method: str = 'greedy',
+                                cover_executor: Executor = None) -> Set:
+    """ Returns the same kind of augmenting set as bipartite_matching_augmentation, using NumPy arrays.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph G = (A + B, E), where G can be augmented, that is |A + B| >= 4.
+    A : Set
+        A bipartition of G, where |A| = |A + B| / 2
+    M: Dict = None
+        A perfect bipartite matching of G, for each edge {a, b} in M holds M[a] = b, M[b] = a.
+        If M is not given, it will be computed by the Hopcroft-Karp algorithm.
+    deadline: Deadline = None
+        An optional deadline or cancellation token, see bipartite_matching_augmentation.
+    validate: bool = False
+        If True, the instance is checked first, see prepare_condensation.
+    executor: Executor = None
+        An optional thread pool running the independent phases concurrently, see bipartite_matching_augmentation.
+    cover_method: str = 'greedy'
+        The set cover method of source_cover, see bipartite_matching_augmentation.
+    cover_executor: Executor = None
+        An optional pool splitting the rounds of the 'parallel' cover method, see bipartite_matching_augmentation.
+
+    Returns
+    -------
+    L : Set
+       Set of edges from E(G) - M such that G admits a perfect matching even after a single arbitrary
+       edge is removed. Edges are in form of (a, b), where a is from A and b from B
+
+    Raises
+    ------
+    NetworkXError
+        If M is not given and G does not admit a perfect matching.
+
+    Notes
+    -----
+    Follows bipartite_matching_augmentation step by step, vertices of D are the vertices of A renumbered
+    to 0..|A|-1 and vertices of the condensation are the strong components. The condensation is computed
+    by prepare_condensation and augmented by augment_condensation.
+    """
+    return augment_condensation(prepare_condensation(G, A, M, validate=validate), deadline, executor, cover_method,
+                                cover_executor)
+
+
+def augment_arrays(n: int, a: np.ndarray, b: np.ndarray, mate: np.ndarray = None,
+                   deadline: Deadline = None, validate: bool = False,
+                   executor: Executor = None, cover_method: str = 'greedy',
+                   cover_executor: Executor = None) -> (np.ndarray, np.ndarray):
+    """ Array-only entry point returning an augmenting set of a bipartite instance (n, a, b), without NetworkX.
+
+    Parameters
+    ----------
+    n : int
+        Number of vertices of each bipartition, A = 0..n-1 and B = n..2n-1, n >= 2.
+    a, b : np.ndarray
+        Edges {a[i], b[i]} of G, where a[i] is from A and b[i] from B, as produced by Generators.
+    mate : np.ndarray = None
+        A perfect matching as an array of length n, {i, mate[i]} are the matched edges. If None, it is computed
+        by the Hopcroft-Karp algorithm.
+    deadline: Deadline = None
+        An optional deadline or cancellation token, see bipartite_matching_augmentation.
+    validate: bool = False
+        If True, the instance is checked first by Validation.validate_bipartite_arrays.
+    executor: Executor = None
+        An optional thread pool running the independent phases concurrently, see bipartite_matching_augmentation.
+    cover_method: str = 'greedy'
+        The set cover method of source_cover, see bipartite_matching_augmentation.
+    cover_executor: Executor = None
+        An optional pool splitting the rounds of the 'parallel' cover method, see bipartite_matching_augmentation.
+
+    Returns
+    -------
+    (a, b) : (np.ndarray, np.ndarray)
+        Arrays of equal length, the augmenting set consists of edges (a[i], b[i]), the same kind of augmenting set
+        as bipartite_matching_augmentation returns.
+
+    Raises
+    ------
+    NetworkXError
+        If mate is not given and G does not admit a perfect matching.
+    bipartite_ghraph_not_augmentable_exception
+        If n <= 1.
+    invalid_instance_exception
+        If validate is True and the instance is not valid, its attribute problems lists all problems found.
+
+    Notes
+    -----
+    Neither this module nor the modules it depends on import NetworkX at import time, so that a worker process
+    using only this entry point starts quickly. NetworkX is imported only to raise one of the exceptions above.
+    """
+    if validate:
+        validate_bipartite_arrays(n, a, b, mate)
+    if n <= 1:  # Graph consisting of only one vertex at each bipartition cannot be augmented.
+        raise Exceptions.bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+    with phase('matching'):
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        indptr, indices = edges_to_csr(2 * n, np.concatenate((a, b)), np.concatenate((b, a)))
+        in_A = np.arange(2 * n) < n
+        if mate is None:
+            full_mate = perfect_matching_array(indptr, indices, in_A)
+        else:
+            full_mate = np.empty(2 * n, dtype=np.int64)
+            full_mate[:n] = mate
+            full_mate[mate] = np.arange(n, dtype=np.int64)
+    C = _condensation_of_csr(range(2 * n), None, indptr, indices, in_A, full_mate, False)
+    del indptr, indices, in_A
+    L = sorted(augment_condensation(C, deadline, executor, cover_method, cover_executor))
+    return np.array([u for u, _ in L], dtype=np.int64), np.array([v for _, v in L], dtype=np.int64)
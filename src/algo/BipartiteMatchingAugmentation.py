@@ -1,6 +1,6 @@
 """
 Author: Tomas Jelinek
-Last change: 12.9.2019
+Last change: 18.10.2026
 
 Description: Implementation of the bipartite matching augmentation algorithm
 due to Implementation is based on BINDEWALD, Viktor; HOMMELSHEIM, Felix; MÜHLENTHALER, Moritz; SCHAUDT, Oliver.
@@ -8,18 +8,147 @@ due to Implementation is based on BINDEWALD, Viktor; HOMMELSHEIM, Felix; MÜHLEN
         1805.01299
 """
 
-import networkx as nx
-from typing import Dict, Set
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from concurrent.futures import Executor
 from src.algo.EswaranTarjan import eswaran_tarjan
-from src.algo.SourceCover import source_cover
-from src.utils.AuxiliaryFunctions import fast_traversal
-from networkx.utils.decorators import not_implemented_for
-from src.exceptions.Exceptions import bipartite_ghraph_not_augmentable_exception
+from src.algo.SourceCover import source_cover, COVER_METHODS
+from src.algo.DenseBackend import dense_matching_augmentation, is_dense
+from src.algo.ArrayBackend import array_matching_augmentation
+from src.algo.FastPaths import early_exit
+from src.utils.ArrayFunctions import graph_to_csr, bipartite_csr_to_D_arcs, condensation_arrays
+from src.utils.AuxiliaryFunctions import bipartite_to_D
+from src.utils.ReachabilityIndex import ReachabilityIndex
+from src.utils.GraphMemo import GraphMemo
+from src.utils.ResultCache import ResultCache, instance_fingerprint
+from src.utils.Instrumentation import phase, increment, event
+from src.utils.Deadline import Deadline
+from src.utils.Validation import validate_instance
+from src.utils.Concurrency import run_concurrently
+from src.utils.BackendSelection import select_backend, prefers_arrays
+from src.utils.LazyImport import not_implemented_for
+from src.exceptions import Exceptions
+
+
+REDUCTION_THRESHOLD: float = 2.0  # Minimal arcs / vertices ratio of D_condensation for the automatic reduction
+
+
+def _construct_condensation(G: nx.Graph, A: Set, M: Dict) -> nx.DiGraph:
+    """ Returns the condensation of D of G with respect to M, an acyclic digraph. D is released on return. """
+    with phase('D'):
+        D: nx.DiGraph = bipartite_to_D(G, A, M)
+    with phase('condensation'):
+        D_condensation: nx.DiGraph = nx.algorithms.components.condensation(D)
+    return D_condensation
+
+
+def _condensation_of_arrays(labels, indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray,
+                            mate: np.ndarray) -> nx.DiGraph:
+    """ Returns the condensation of D as _construct_condensation does, computed from CSR arrays of G and the matching
+    left by the pre-check. D itself is never built as a NetworkX graph. """
+    with phase('D'):
+        tails, heads = bipartite_csr_to_D_arcs(indptr, indices, in_A, mate)
+        vertices = np.flatnonzero(in_A)  # Vertex i of D is vertices[i] of G
+        local = np.empty(len(labels), dtype=np.int64)
+        local[vertices] = np.arange(len(vertices), dtype=np.int64)
+    with phase('condensation'):
+        num_of_components, component, c_indptr, c_indices = condensation_arrays(len(vertices), local[tails],
+                                                                                 local[heads])
+        del tails, heads, local
+        members: List[Set] = [set() for _ in range(num_of_components)]
+        for vertex, c in zip(vertices.tolist(), component.tolist()):
+            members[c].add(labels[vertex])
+        D_condensation: nx.DiGraph = nx.DiGraph()
+        D_condensation.add_nodes_from((c, {'members': members[c]}) for c in range(num_of_components))
+        c_tails = np.repeat(np.arange(num_of_components, dtype=np.int64), np.diff(c_indptr))
+        D_condensation.add_edges_from(zip(c_tails.tolist(), c_indices.tolist()))
+    return D_condensation
+
+
+def _classify(D_condensation: nx.DiGraph) -> (Set, Set, Set, Set, Dict):
+    """ Returns trivial strong components X, sources, sinks and isolated vertices of D_condensation
+    and a representative member of each of its vertices. """
+    X: Set = set()  # A set of vertices of D_condensation corresponding to trivial strong components of D
+    isolated: Set = set()  # Set of isolated vertices
+    sources: Set = set()  # Set of vertices that are not isolated and have no ingoing arc
+    sinks: Set = set()  # Set of vertices that are not isolated and have no outgoing arc
+    representative: Dict = {}  # The only information about members needed by the later stages
+
+    # We do not use function sources, sinks, isolated for performance reasons
+    # Because we would either have to loop twice or check one more condition in the loop
+    # if we were to modify the function.
+    for vertex, members in D_condensation.nodes(data='members'):
+        inDegree: int = D_condensation.in_degree(vertex)
+        outDegree: int = D_condensation.out_degree(vertex)
+        representative[vertex] = next(iter(members))
+
+        if len(members) == 1:
+            # Each trivial strong component is incident to some critical edge
+            X.add(vertex)
+        if inDegree == 0 and outDegree == 0:
+            # Isolated: neither ingoing nor outgoing arc
+            isolated.add(vertex)
+        elif inDegree == 0:
+            # Source: no ingoing arc and not isolated
+            sources.add(vertex)
+            # Sink: no outgoing arc and not isolated
+        elif outDegree == 0:
+            sinks.add(vertex)
+
+    return X, sources, sinks, isolated, representative
+
+
+def _cover_and_sweep(index: ReachabilityIndex, X: Set, sources: Set, sinks: Set, isolated: Set,
+                     deadline: Deadline, executor: Executor = None, cover_method: str = 'greedy',
+                     cover_executor: Executor = None) -> Set:
+    """ Returns vertices of D_hat, i.e. vertices on paths from the source cover C_0 to X or from X to the sink
+    cover C_1. If the deadline expires, the covers consist of all sources and sinks and D_hat of all vertices.
+    The two covers, resp. the two sweeps, run concurrently on executor if given, cover_method and
+    cover_executor are passed to source_cover. """
+    reversed_index = index.reverse()
+    try:
+        if deadline is not None:
+            deadline.check()
+
+        # Use source_cover to choose ln(n) approximation of choice of sources that cover all sinks in C_0, resp. C_1
+        with phase('source_cover'):
+            C_0, C_1 = run_concurrently(
+                executor,
+                lambda: source_cover(None, X, (sources, sinks, isolated), index, backend='networkx', deadline=deadline,
+                                     method=cover_method, executor=cover_executor),
+                lambda: source_cover(None, X, (sinks, sources, isolated), reversed_index, backend='networkx',
+                                     deadline=deadline, method=cover_method, executor=cover_executor))
+            increment('cover_sources', len(C_0))
+            increment('cover_sinks', len(C_1))
+
+        # We now determine vertices that lie either on C_1X paths or XC_2 paths
+        # Vertices on C_1X paths are those visited when traveling from C_1 to X on
+        # D_condensation and from X to C_1 on D_condensation_reverse
+        with phase('sweeps'):
+            # Reachable from C_0 (search for X) and from X (search for C_2), intersected with vertices reachable
+            # from X (search for C_1) and from C_2
+            forward, backward = run_concurrently(executor,
+                                                 lambda: index.reachable_from(C_0 | X, deadline=deadline),
+                                                 lambda: reversed_index.reachable_from(C_1 | X, deadline=deadline))
+            D_hat_vertices: Set = forward & backward
+    except Exceptions.deadline_exceeded_exception:
+        # All sources, resp. all sinks, trivially cover X, then D_hat is the whole D_condensation
+        D_hat_vertices: Set = set(index.labels)
+        deadline.degraded = True
+        event('deadline', function='bipartite_matching_augmentation', degraded=True)
+
+    return D_hat_vertices
 
 
 @not_implemented_for('directed')
 @not_implemented_for('multigraph')
-def bipartite_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None):
+def bipartite_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None, cache: ResultCache = None,
+                                    memo: GraphMemo = None, backend: str = None, reduce_condensation: bool = None,
+                                    deadline: Deadline = None, validate: bool = False, executor: Executor = None,
+                                    cover_method: str = 'greedy', cover_executor: Executor = None):
     """Returns a set of edges A such that G(V, E + A) is strongly connected.
 
         Parameters
@@ -32,6 +161,42 @@ def bipartite_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None):
         M: Dict = None
             A perfect bipartite matching of G, for each edge {a, b} in M holds M[a] = b, M[b] = a.
             If M is not given, it will be computed using eppstein_matching(G, A)
+        cache: ResultCache = None
+            An optional on-disk cache of results. If given, L is looked up by the fingerprint of (G, A, M)
+            and computed and stored only if it is not cached yet. The key ignores backend, cover_method and
+            the other options, so that a cached L may have been computed with different ones.
+        memo: GraphMemo = None
+            An optional in-memory memoization of the matching and D_condensation. Useful when the function
+            is called repeatedly on the same G, the memoized structures are invalidated when G is mutated.
+        backend: str = None
+            'networkx' to build D as a NetworkX DiGraph, 'dense' to store rows of D as packed bitsets,
+            which is faster and smaller for dense graphs, 'array' to work on NumPy arrays, which is faster
+            for large graphs, sparse or dense. If None, 'networkx' is chosen if memo is given, whose structures are
+            NetworkX graphs, otherwise 'array' for large graphs, see BackendSelection.prefers_arrays, and 'dense'
+            for smaller graphs that are dense enough, see DenseBackend.is_dense.
+            The decision is recorded as a 'backend' event of the active Instrumentation collector.
+        reduce_condensation: bool = None
+            If True, arcs of D_condensation implied by other paths are removed before source_cover, so that
+            the later phases traverse fewer arcs, see ReachabilityIndex.reduce_transitive_arcs. If None, the
+            reduction is done if D_condensation has more than REDUCTION_THRESHOLD arcs per vertex.
+        deadline: Deadline = None
+            An optional deadline or cancellation token. It is checked between the phases and inside the traversals
+            of source_cover and of the CX/XC sweeps. If it expires there, the greedy source covers are replaced by
+            all sources and sinks, so that L is still valid, but possibly larger, and deadline.degraded is set.
+            The matching and the linear-time construction of D and D_condensation are always completed.
+        validate: bool = False
+            If True, G, A and M are checked by Validation.validate_instance before the augmentation. Results
+            found in the cache are not checked again. Otherwise an invalid input may produce an arbitrary result.
+        executor: Executor = None
+            An optional thread pool. If given, the source covers of sources and of sinks run concurrently,
+            and so do the forward and backward sweeps, see Concurrency.run_concurrently. It pays off on
+            free-threaded CPython and for the array backend, whose kernels release the interpreter lock.
+        cover_method: str = 'greedy'
+            The set cover method of source_cover, 'greedy' or 'parallel', see SourceCover.source_cover.
+            The dense backend always uses its own greedy cover on bitsets.
+        cover_executor: Executor = None
+            An optional pool, typically a ProcessPoolExecutor, over which each round of the 'parallel' cover method
+            is split. It must differ from executor, on which the covers themselves may run.
 
         Returns
         -------
@@ -43,9 +208,16 @@ def bipartite_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None):
         ------
         NetworkX.NotImplemented:
             If G is directed or a multigraph.
+        ValueError
+            If backend or cover_method is unknown.
+        invalid_instance_exception
+            If validate is True and G, A or M is not a valid input, its attribute problems lists all problems found.
 
         Notes
         -----
+        With the networkx backend and without memo, instances whose D has at most one trivial strong component are
+        resolved by a single strong component pass on arrays without D_condensation, see FastPaths.early_exit.
+        Otherwise D_condensation is built from the same arrays.
         Implementation is based on BINDEWALD, Viktor; HOMMELSHEIM, Felix; MÜHLENTHALER, Moritz; SCHAUDT, Oliver.
         How to Secure Matchings Against Edge Failures. CoRR. 2018, vol. abs/1805.01299. Available from arXiv:
         1805.01299
@@ -58,114 +230,110 @@ def bipartite_matching_augmentation(G: nx.Graph, A: Set, M: Dict = None):
 
         """
 
+    if cover_method not in COVER_METHODS:
+        raise ValueError("Unknown cover method {!r}.".format(cover_method))
     if len(A) <= 1:  # Graph consisting of only one vertex at each bipartition cannot be augmented.
-        raise bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+        raise Exceptions.bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+
+    if cache is not None:
+        key: str = instance_fingerprint(G, A, M)
+        L: Set = cache.get(key)
+        if L is None:
+            L = bipartite_matching_augmentation(G, A, M, memo=memo, backend=backend,
+                                                reduce_condensation=reduce_condensation, deadline=deadline,
+                                                validate=validate, executor=executor, cover_method=cover_method,
+                                                cover_executor=cover_executor)
+            if deadline is None or not deadline.degraded:  # Degraded results are not cached
+                cache.put(key, L)
+        return L
+
+    if memo is not None:  # Memoized structures are NetworkX graphs
+        automatic: str = 'networkx'
+    elif prefers_arrays(len(G), G.number_of_edges()):  # Faster than the bitsets also for dense graphs
+        automatic: str = 'array'
+    elif is_dense(G, A):
+        automatic: str = 'dense'
+    else:
+        automatic: str = 'networkx'
+    backend = select_backend('bipartite_matching_augmentation', backend, automatic, ('networkx', 'dense', 'array'))
+    if backend == 'array':
+        # Validated on its own arrays
+        return array_matching_augmentation(G, A, M, deadline, validate, executor, cover_method, cover_executor)
+    # G is converted to CSR arrays once for the validation, the pre-check and the condensation. The dense backend
+    # works on its own bitsets and memoized structures already amortize the condensation over the calls.
+    csr: tuple = None
+    if backend == 'networkx' and memo is None:
+        with phase('precheck'):
+            csr = graph_to_csr(G)
+    if validate:
+        validate_instance(G, A, M, csr)
 
     if M is None:  # User can specify her own matching for speed-up
-        M: Dict = nx.algorithms.bipartite.eppstein_matching(G, A)
-
-    D: nx.DiGraph = nx.DiGraph()
-
-    for u in M:  # Construction of D, iterate over all keys in M
-        if u in A:  # Add all edges from A to D
-            w = M[u]
-            D.add_node(u)
-
-            outgoing: int = 0
-            for uPrime in G.neighbors(w):  # Construct edges of D
-                if uPrime != u:
-                    D.add_edge(u, uPrime)
-
-    D_condensation: nx.DiGraph = nx.algorithms.components.condensation(D)  # Condensation - acyclic digraph
-
-    X: Set = set()  # A set of vertices of D_condensation corresponding to trivial strong components of D
-    isolated: Set = set()  # Set of isolated vertices
-    sources: Set = set()  # Set of vertices that are not isolated and have no ingoing arc
-    sinks: Set = set()  # Set of vertices that are not isolated and have no outgoing arc
-
-    # We do not use function sources, sinks, isolated for performance reasons
-    # Because we would either have to loop twice or check one more condition in the loop
-    # if we were to modify the function.
-    for vertex in D_condensation.nodes:
-        inDegree: int = D_condensation.in_degree(vertex)
-        outDegree: int = D_condensation.out_degree(vertex)
-
-        if len(D_condensation.nodes[vertex]['members']) == 1:
-            # Each trivial strong component is incident to some critical edge
-            X.add(vertex)
-        if inDegree == 0 and outDegree == 0:
-            # Isolated: neither ingoing nor outgoing arc
-            isolated.add(vertex)
-        elif inDegree == 0:
-            # Source: no ingoing arc and not isolated
-            sources.add(vertex)
-            # Sink: no outgoing arc and not isolated
-        elif outDegree == 0:
-            sinks.add(vertex)
-
-    A_0 = D_condensation
-    A_1 = D_condensation.reverse(copy=False)
+        with phase('matching'):
+            if memo is not None:
+                M: Dict = memo.matching(G, A)
+            else:
+                M: Dict = nx.algorithms.bipartite.eppstein_matching(G, A)
+
+    if backend == 'dense':
+        with phase('dense'):
+            return dense_matching_augmentation(G, A, M, deadline, executor)
+
+    # The pipeline runs in stages, each stage receives only the state it needs, so that the larger structures
+    # of the earlier stages (D, D_condensation, the covers, ...) are released before the later stages run
+    if memo is not None:
+        D_condensation: nx.DiGraph = memo.structures(G, A, M, _construct_condensation)
+    else:
+        # A single strong component pass decides robust instances and those with one critical edge, otherwise
+        # its arrays are reused to build D_condensation
+        with phase('precheck'):
+            L, arrays = early_exit(G, A, M, csr)
+        if L is not None:
+            return L
+        del csr
+        D_condensation: nx.DiGraph = _condensation_of_arrays(*arrays)
+        del arrays
+
+    with phase('classification'):
+        X, sources, sinks, isolated, representative = _classify(D_condensation)
 
     if len(X) == 0:  # If there is no trivial strong component, G admits a perfect matching after edge removal
         return set()
 
-    # Use source_cover to choose ln(n) approximation of choice of sources that cover all sinks in C_0, resp. C_1
-    C_0 = source_cover(A_0, X, (sources, sinks, isolated))
-    C_1 = source_cover(A_1, X, (sinks, sources, isolated))
-
-    # We now determine vertices that lie either on C_1X paths or XC_2 paths
-    # Vertices on C_1X paths are those visited when traveling from C_1 to X on
-    # D_condensation and from X to C_1 on D_condensation_reverse
-    CX_vertices = set()
-    XC_vertices = set()
-    D_condensation_reverse = D_condensation.reverse(copy=False)
-
-    # Now, specify arguments for the fast DFS traversal
-    def action_on_vertex_CX(current_vertex):
-        CX_vertices.add(current_vertex)  # We have reached it from C, so add it in
-        return True
-
-    def action_on_neighbor_CX(neighbor, current_vertex):
-        return neighbor not in CX_vertices
-
-    def action_on_vertex_XC(current_vertex):
-        XC_vertices.add(current_vertex)
-        return True
-
-    def action_on_neighbor_XC(neighbor, current_vertex):
-        return neighbor not in XC_vertices
-
-    for source in C_0:
-        # Reachable from C_0 (search for X)
-        fast_traversal(D_condensation, source, action_on_vertex_CX, action_on_neighbor_CX)
-
-    for critical in X:
-        # Reachable from X (search for C_2)
-        fast_traversal(D_condensation, critical, action_on_vertex_CX, action_on_neighbor_CX)
-        # Reachable from X (search for C_1)
-        fast_traversal(D_condensation_reverse, critical, action_on_vertex_XC, action_on_neighbor_XC)
+    # A single reachability index of D_condensation is shared by all of the following traversals
+    with phase('index'):
+        index = ReachabilityIndex(D_condensation)
+    num_of_arcs: int = D_condensation.number_of_edges()
+    del D_condensation  # From now on, only the index and the representatives are needed
 
-    for source in C_1:
-        # Reachable from C_2 (search for X)
-        fast_traversal(D_condensation_reverse, source, action_on_vertex_XC, action_on_neighbor_XC)
+    if reduce_condensation is None:
+        reduce_condensation = num_of_arcs > REDUCTION_THRESHOLD * len(index)
+    if reduce_condensation and (deadline is None or not deadline.expired()):
+        with phase('reduction'):  # Reachability, hence also sources, sinks and isolated vertices are preserved
+            increment('condensation_arcs', num_of_arcs)
+            increment('reduction_removed_arcs', index.reduce_transitive_arcs())
 
-    D_hat_vertices = CX_vertices & XC_vertices  # Intersection
+    D_hat_vertices: Set = _cover_and_sweep(index, X, sources, sinks, isolated, deadline, executor, cover_method,
+                                            cover_executor)
 
     # Marginal case when single vertex cannot be connected to form non-trivial strongly connected component.
     # We need to add another arbitrary vertex, which always exists as |V(D)| is guaranteed to be > 2 and contains
     # at least one trivial strong component.
     if len(D_hat_vertices) == 1:
         vert = next(iter(D_hat_vertices))
-        D_hat_vertices.add(next(iter(set(D_condensation.nodes) - {vert})))
+        D_hat_vertices.add(next(vertex for vertex in index.labels if vertex != vert))
 
     #  Update sources, sinks, isolated as intersection with D_hat_vertices
     sources &= D_hat_vertices
     sinks &= D_hat_vertices
     isolated &= D_hat_vertices
 
-    D_hat = nx.classes.function.induced_subgraph(D_condensation, D_hat_vertices)
-    L_star: Set = eswaran_tarjan(D_hat, is_condensation=True, sourcesSinksIsolated=(sources, sinks, isolated))
+    # D_hat is closed under paths between its vertices, hence the reduced arcs keep its reachability
+    with phase('eswaran_tarjan'):
+        D_hat = index.induced_subgraph(D_hat_vertices)
+        del index, D_hat_vertices
+        L_star: Set = eswaran_tarjan(D_hat, is_condensation=True, sourcesSinksIsolated=(sources, sinks, isolated),
+                                     backend='networkx')
 
     # Map vertices from L to vertices of L*
-    return set(map(lambda e: (next(iter(D_condensation.nodes[e[1]]['members'])),
-                              M[next(iter(D_condensation.nodes[e[0]]['members']))]), L_star))
+    return set(map(lambda e: (representative[e[1]], M[representative[e[0]]]), L_star))
@@ -0,0 +1,91 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Enumeration of critical edges of a bipartite graph, i.e. edges whose removal destroys
+every perfect matching, computed by a single pass of a strong components algorithm over D.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, Set
+from src.utils.LazyImport import not_implemented_for
+from src.utils.ArrayFunctions import graph_to_csr, matching_to_array, mask_from_set, labels_to_array, \
+    perfect_matching_array, bipartite_csr_to_D_arcs, strong_components
+
+
+def critical_vertices_from_arrays(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray,
+                                  mate: np.ndarray) -> np.ndarray:
+    """ Returns a boolean mask of vertices of A whose matched edge is critical.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        Symmetric CSR arrays of a bipartite graph G on vertices 0..n-1.
+    in_A : np.ndarray
+        Boolean mask of the bipartition A.
+    mate : np.ndarray
+        A perfect matching of G as an array of mates.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array of length n, True exactly for vertices a from A such that {a, mate[a]} is critical.
+
+    Notes
+    -----
+    An edge outside of the matching is avoided by the matching itself, so only matched edges can be critical.
+    A matched edge {a, mate[a]} is critical iff it lies on no M-alternating cycle, that is iff a forms
+    a trivial strong component of D.
+    """
+    n: int = len(indptr) - 1
+    tails, heads = bipartite_csr_to_D_arcs(indptr, indices, in_A, mate)
+    _, components = strong_components(n, tails, heads)
+    return in_A & (np.bincount(components, minlength=n)[components] == 1)
+
+
+@not_implemented_for('directed')
+@not_implemented_for('multigraph')
+def critical_edges(G: nx.Graph, A: Set, M: Dict = None) -> (np.ndarray, np.ndarray):
+    """Returns critical edges of G, i.e. edges contained in every perfect matching of G.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph G = (A + B, E) that admits a perfect matching.
+    A : Set
+        A bipartition of G, where |A| = |A + B| / 2
+    M: Dict = None
+        A perfect bipartite matching of G, for each edge {a, b} in M holds M[a] = b, M[b] = a.
+        If M is not given, it will be computed by the Hopcroft-Karp algorithm.
+
+    Returns
+    -------
+    (a, b) : (np.ndarray, np.ndarray)
+        Arrays of equal length, the critical edges are (a[i], b[i]), where a[i] is from A and b[i] from B.
+        The arrays are of integer dtype if all vertices of G are integers and of object dtype otherwise.
+
+    Raises
+    ------
+    NetworkX.NotImplemented:
+        If G is directed or a multigraph.
+    NetworkXError
+        If M is not given and G does not admit a perfect matching.
+
+    Notes
+    -----
+    G admits a perfect matching after removal of an arbitrary single edge iff it has no critical edge,
+    in which case bipartite_matching_augmentation(G, A, M) returns an empty set.
+    """
+    labels, index, indptr, indices = graph_to_csr(G)
+    in_A = mask_from_set(A, labels)
+    if M is None:
+        mate = perfect_matching_array(indptr, indices, in_A)
+    else:
+        mate = matching_to_array(M, labels, index)
+
+    critical = np.flatnonzero(critical_vertices_from_arrays(indptr, indices, in_A, mate))
+    labels = labels_to_array(labels)
+    return labels[critical], labels[mate[critical]]
@@ -0,0 +1,198 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Bitset backend of the bipartite matching augmentation algorithm for dense bipartite graphs.
+Rows of D are stored as packed bitsets instead of dict-of-dicts, so that D takes |A|^2 / 8 bytes and
+reachability is computed by word-parallel OR of rows instead of per-arc traversal.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from concurrent.futures import Executor
+from src.algo.EswaranTarjan import eswaran_tarjan
+from src.utils.Instrumentation import increment, event
+from src.utils.Deadline import Deadline
+from src.utils.Concurrency import run_concurrently
+from src.exceptions import Exceptions
+from src.utils.BitsetFunctions import popcount, bitset_from_mask, bitset_from_indices, bitset_indices, \
+    packed_rows_to_bitsets, transpose_packed, bitset_reach, bitset_strong_components
+
+DENSITY_THRESHOLD: float = 0.1  # Minimal |E| / (|A| * |B|) for which the dense backend is chosen automatically
+MIN_VERTICES: int = 64  # Minimal |A| for which the dense backend is chosen automatically
+
+
+def is_dense(G: nx.Graph, A: Set) -> bool:
+    """ Returns True if the bitset backend is expected to be faster than the NetworkX one for G. """
+    return len(A) >= MIN_VERTICES and G.number_of_edges() >= DENSITY_THRESHOLD * len(A) * (len(G) - len(A))
+
+
+def _bitset_source_cover(rows: List[int], n: int, critical: int, sources: List[int], masks: List[int],
+                         deadline: Deadline = None) -> List[int]:
+    """ Bitset counterpart of source_cover, returns the chosen sources.
+
+    Parameters
+    ----------
+    rows : List[int]
+        Out-neighborhoods of D (or of the reversed D) as bitsets.
+    critical : int
+        Bitset of critical vertices.
+    sources : List[int]
+        Components that are sources or isolated.
+    masks : List[int]
+        Bitset of members of each component.
+    deadline : Deadline = None
+        If given, it is checked before each search and each greedy round.
+    """
+    successors: int = 0
+    for vertex in bitset_indices(critical, n).tolist():
+        successors |= rows[vertex]
+    deleted: int = bitset_reach(rows, successors, ~0, n)  # Reachable by a non-trivial path from a critical vertex
+    weak_sinks: int = critical & ~deleted
+
+    children: Dict[int, int] = {}
+    for source in sources:
+        if deadline is not None:
+            deadline.check()
+        covered = bitset_reach(rows, masks[source], ~deleted, n) & weak_sinks
+        if covered:
+            children[source] = covered
+
+    cover: List[int] = []
+    uncovered: int = weak_sinks
+    while uncovered:  # Greedy set cover, each round picks the source covering most uncovered weak sinks
+        if deadline is not None:
+            deadline.check()
+        best = max(children, key=lambda source: popcount(children[source] & uncovered))
+        cover.append(best)
+        uncovered &= ~children.pop(best)
+
+    return cover
+
+
+def dense_matching_augmentation(G: nx.Graph, A: Set, M: Dict, deadline: Deadline = None,
+                                executor: Executor = None) -> Set:
+    """ Returns the same kind of augmenting set as bipartite_matching_augmentation, using bitset rows of D.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph G = (A + B, E), where G can be augmented, that is |A + B| >= 4.
+    A : Set
+        A bipartition of G, where |A| = |A + B| / 2
+    M: Dict
+        A perfect bipartite matching of G, for each edge {a, b} in M holds M[a] = b, M[b] = a.
+    deadline: Deadline = None
+        An optional deadline or cancellation token, see bipartite_matching_augmentation.
+    executor: Executor = None
+        An optional thread pool running the independent phases concurrently, see bipartite_matching_augmentation.
+
+    Returns
+    -------
+    L : Set
+       Set of edges from E(G) - M such that G admits a perfect matching even after a single arbitrary
+       edge is removed. Edges are in form of (a, b), where a is from A and b from B
+
+    Notes
+    -----
+    Follows bipartite_matching_augmentation step by step. Strong components are computed by Kosaraju's
+    algorithm on bitsets, source_cover and the CX/XC sweeps by bit-parallel breadth-first search.
+    Only the condensation of D_hat, which is typically small for dense graphs, is built as a NetworkX DiGraph
+    for eswaran_tarjan.
+    """
+    labels: List = [u for u in M if u in A]  # Vertices of D
+    index: Dict = {vertex: i for i, vertex in enumerate(labels)}
+    n: int = len(labels)
+
+    packed = np.zeros((n, (n + 7) // 8), dtype=np.uint8)  # Rows of D as a packed bit matrix
+    row = np.zeros(n, dtype=bool)
+    for i, u in enumerate(labels):
+        neighbors = np.fromiter((index[w] for w in G.neighbors(M[u])), dtype=np.int64)
+        row[neighbors] = True
+        row[i] = False  # Skip the matched edge
+        packed[i] = np.packbits(row, bitorder='little')
+        row[neighbors] = False
+    rows: List[int] = packed_rows_to_bitsets(packed)
+    cols: List[int] = packed_rows_to_bitsets(transpose_packed(packed, n))
+    del packed
+
+    num_of_components, component = bitset_strong_components(rows, cols, n)
+    order = np.argsort(component, kind='stable')
+    sizes = np.bincount(component, minlength=num_of_components)
+    starts = np.concatenate(([0], np.cumsum(sizes)))
+    members: List[np.ndarray] = [order[starts[c]:starts[c + 1]] for c in range(num_of_components)]
+    masks: List[int] = [bitset_from_indices(members[c], n) for c in range(num_of_components)]
+
+    X: Set = set(np.flatnonzero(sizes == 1).tolist())  # Trivial strong components
+    if len(X) == 0:  # If there is no trivial strong component, G admits a perfect matching after edge removal
+        increment('fast_path_robust')
+        return set()
+
+    sources: Set = set()
+    sinks: Set = set()
+    isolated: Set = set()
+    for c in range(num_of_components):
+        outgoing: int = 0
+        ingoing: int = 0
+        for vertex in members[c].tolist():
+            outgoing |= rows[vertex]
+            ingoing |= cols[vertex]
+        has_out: bool = (outgoing & ~masks[c]) != 0
+        has_in: bool = (ingoing & ~masks[c]) != 0
+        if not has_in and not has_out:
+            isolated.add(c)
+        elif not has_in:
+            sources.add(c)
+        elif not has_out:
+            sinks.add(c)
+
+    critical: int = bitset_from_indices([members[c][0] for c in X], n)
+    try:
+        if deadline is not None:
+            deadline.check()
+        C_0, C_1 = run_concurrently(
+            executor, lambda: _bitset_source_cover(rows, n, critical, sorted(sources | isolated), masks, deadline),
+            lambda: _bitset_source_cover(cols, n, critical, sorted(sinks | isolated), masks, deadline))
+        increment('cover_sources', len(C_0))
+        increment('cover_sinks', len(C_1))
+
+        start_CX: int = critical
+        for c in C_0:
+            start_CX |= masks[c]
+        start_XC: int = critical
+        for c in C_1:
+            start_XC |= masks[c]
+        CX, XC = run_concurrently(executor, lambda: bitset_reach(rows, start_CX, ~0, n),
+                                  lambda: bitset_reach(cols, start_XC, ~0, n))
+        D_hat_mask: int = CX & XC
+    except Exceptions.deadline_exceeded_exception:
+        # All sources, resp. all sinks, trivially cover X, then D_hat is the whole condensation
+        D_hat_mask: int = (1 << n) - 1
+        deadline.degraded = True
+        event('deadline', function='dense_matching_augmentation', degraded=True)
+
+    D_hat_vertices: Set = set(np.unique(component[bitset_indices(D_hat_mask, n)]).tolist())
+    if len(D_hat_vertices) == 1:  # Marginal case, see bipartite_matching_augmentation
+        vert = next(iter(D_hat_vertices))
+        other = next(c for c in range(num_of_components) if c != vert)
+        D_hat_vertices.add(other)
+        D_hat_mask |= masks[other]
+
+    D_hat: nx.DiGraph = nx.DiGraph()  # Condensation of D induced by D_hat_vertices
+    D_hat.add_nodes_from(D_hat_vertices)
+    for c in D_hat_vertices:
+        outgoing = 0
+        for vertex in members[c].tolist():
+            outgoing |= rows[vertex]
+        heads = bitset_indices(outgoing & D_hat_mask & ~masks[c], n)
+        D_hat.add_edges_from((c, d) for d in np.unique(component[heads]).tolist())
+
+    sources &= D_hat_vertices
+    sinks &= D_hat_vertices
+    isolated &= D_hat_vertices
+    L_star: Set = eswaran_tarjan(D_hat, is_condensation=True, sourcesSinksIsolated=(sources, sinks, isolated))
+
+    return set(map(lambda e: (labels[members[e[1]][0]], M[labels[members[e[0]][0]]]), L_star))
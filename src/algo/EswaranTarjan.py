@@ -9,15 +9,21 @@ RAGHAVAN, S. A note on Eswaran and Tarjan’s algorithm for the strong connectiv
 In: The Next Wave in Computing, Optimization, and Decision Technologies. Springer, 2005, pp. 19–26.
 """
 
-import networkx as nx
-from typing import List, Set
-from networkx.utils.decorators import not_implemented_for
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from src.utils.LazyImport import not_implemented_for
 from src.utils.AuxiliaryFunctions import get_sources_sinks_isolated
+from src.utils.ArrayFunctions import condensation_arrays, edges_to_csr, transpose_csr, sources_sinks_isolated_arrays
+from src.utils.BackendSelection import select_backend, prefers_arrays
 
 
 @not_implemented_for('undirected')
 @not_implemented_for('multigraph')
-def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIsolated=None) -> Set:
+def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIsolated=None,
+                   backend: str = None) -> Set:
     """Returns a set of edges A such that G(V, E + A) is strongly connected.
 
     Parameters
@@ -30,6 +36,10 @@ def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIso
         If False, strongly connected components will be computed.
     sourcesSinksIsolated : (Set, Set, Set)
         Sources, sinks and isolated vertices of G as defined in the original paper. If not provided, will be computed.
+    backend : str = None
+        'networkx' to work on G directly, 'array' to convert G to NumPy arrays first, which is faster
+        for large graphs. If None, the backend is chosen by the size of G, see BackendSelection.prefers_arrays.
+
     Returns
     -------
     A : Set
@@ -40,12 +50,20 @@ def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIso
     ------
     NetworkX.NotImplemented:
         If G is undirected or a multigraph.
+    ValueError
+        If backend is unknown.
+
     Notes
     -----
     Modified version of Eswaran and Tarjan's algorithm https://epubs.siam.org/doi/abs/10.1137/0205044
     and it's correction due to S. Raghavan https://link.springer.com/chapter/10.1007/0-387-23529-9_2
     """
 
+    backend = select_backend('eswaran_tarjan', backend,
+                             'array' if prefers_arrays(len(G), G.number_of_edges()) else 'networkx')
+    if backend == 'array':
+        return _eswaran_tarjan_networkx_to_arrays(G, is_condensation, sourcesSinksIsolated)
+
     G_condensation: nx.DiGraph
 
     if not is_condensation:
@@ -118,6 +136,21 @@ def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIso
         w_list = list(map(lambda x: next(iter(G_condensation.nodes[x]['members'])), w_list))
         x_list = list(map(lambda x: next(iter(G_condensation.nodes[x]['members'])), isolated))
 
+    A: Set = _close_cycle(v_list, w_list, x_list, p)
+
+    if is_reversed:
+        A = set(map(lambda e: (e[1], e[0]), A))  # We simply swap the edge direction
+
+    return A
+
+
+def _close_cycle(v_list: List, w_list: List, x_list: List, p: int) -> Set:
+    """ Returns the augmenting edges given the ordered sources v_list, sinks w_list and isolated vertices x_list,
+    where (v_list[i], w_list[i]) for i < p are the source-sink pairs of the maximal set of vertex-disjoint paths.
+    """
+    s: int = len(v_list)
+    t: int = len(w_list)
+    q: int = len(x_list)
     A: Set = set()
 
     for i in range(0, p - 1):  # Covers (w_0, v_1) ... (w_p-2, v_p-1)
@@ -149,7 +182,89 @@ def eswaran_tarjan(G: nx.DiGraph, is_condensation: bool = False, sourcesSinksIso
                 A.add((w_list[t - 1], x_list[0]))  # Covers (w_t-1, x_0)
                 A.add((x_list[q - 1], v_list[0]))  # Covers (x_q-1, v_0) closing the cycle
 
-    if is_reversed:
-        A = set(map(lambda e: (e[1], e[0]), A))  # We simply swap the edge direction
+    return A
+
+
+def eswaran_tarjan_arrays(indptr: np.ndarray, indices: np.ndarray, sources: np.ndarray, sinks: np.ndarray,
+                          isolated: np.ndarray) -> Set:
+    """ Array counterpart of eswaran_tarjan on an acyclic digraph given by CSR arrays.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        CSR arrays of an acyclic digraph on vertices 0..n-1.
+    sources, sinks, isolated : np.ndarray
+        Sources, sinks and isolated vertices of the digraph.
+
+    Returns
+    -------
+    A : Set
+       Set of arcs (u, v) of integers such that the digraph with A is strongly connected.
+    """
+    n: int = len(indptr) - 1
+    if n <= 1:  # The trivial case can be handled here
+        return set()
+
+    sources, sinks, isolated = (np.asarray(vertices, dtype=np.int64).tolist() for vertices in (sources, sinks, isolated))
+    is_reversed: bool = len(sources) > len(sinks)
+    if is_reversed:  # Work on the reversed digraph, see eswaran_tarjan
+        indptr, indices = transpose_csr(indptr, indices)
+        sources, sinks = sinks, sources
 
+    starts: List[int] = indptr.tolist()
+    neighbors: List[int] = indices.tolist()
+    marked = bytearray(n)
+    is_sink = bytearray(n)
+    for w in sinks:
+        is_sink[w] = 1
+
+    v_list: List[int] = []
+    w_list: List[int] = []
+    for v in sources:  # Search for an unmarked path to a sink, marking all visited vertices
+        stack: List[int] = [v]
+        while stack:
+            y = stack.pop()
+            if marked[y]:
+                continue
+            marked[y] = 1
+            if is_sink[y]:
+                v_list.append(v)
+                w_list.append(y)
+                is_sink[y] = 0
+                break
+            stack.extend(z for z in neighbors[starts[y]:starts[y + 1]] if not marked[z])
+
+    p: int = len(v_list)
+    paired: Set[int] = set(v_list)
+    v_list.extend(v for v in sources if v not in paired)
+    w_list.extend(w for w in sinks if is_sink[w])
+
+    A: Set = _close_cycle(v_list, w_list, isolated, p)
+    if is_reversed:
+        A = set(map(lambda e: (e[1], e[0]), A))
     return A
+
+
+def _eswaran_tarjan_networkx_to_arrays(G: nx.DiGraph, is_condensation: bool, sourcesSinksIsolated) -> Set:
+    """ Runs eswaran_tarjan_arrays on G and maps the result back to vertices of G. """
+    labels: List = list(G.nodes)
+    position: Dict = {vertex: i for i, vertex in enumerate(labels)}
+    n: int = len(labels)
+    arcs = np.fromiter((position[w] for e in G.edges for w in e), dtype=np.int64, count=2 * G.number_of_edges())
+
+    if is_condensation:
+        representative = np.arange(n, dtype=np.int64)
+        indptr, indices = edges_to_csr(n, arcs[0::2], arcs[1::2])
+    else:  # Each strong component is represented by one of its members
+        num_of_components, component, indptr, indices = condensation_arrays(n, arcs[0::2], arcs[1::2])
+        representative = np.empty(num_of_components, dtype=np.int64)
+        representative[component] = np.arange(n, dtype=np.int64)
+
+    if is_condensation and sourcesSinksIsolated is not None:
+        sources, sinks, isolated = ([position[vertex] for vertex in vertices] for vertices in sourcesSinksIsolated)
+    else:
+        sources, sinks, isolated = sources_sinks_isolated_arrays(indptr, indices)
+
+    representative = representative.tolist()
+    return {(labels[representative[u]], labels[representative[v]])
+            for u, v in eswaran_tarjan_arrays(indptr, indices, sources, sinks, isolated)}
@@ -0,0 +1,329 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: External-memory mode of the bipartite matching augmentation for graphs larger than the main memory.
+Edges are read from a binary file, D is written to disk in CSR order by an external sort of chunks, its strong
+components are computed by a semi-external algorithm keeping only O(|V|) state in memory and the arcs of the
+condensation of D are sorted on disk the same way. The condensation has about as many arcs as D if D is mostly
+acyclic, so its arcs are memory-mapped rather than loaded. The in-memory phases source_cover, D_hat and
+eswaran_tarjan that follow still need memory growing with the arcs of the condensation.
+"""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from array import array
+from typing import Iterable, Iterator, List
+from src.algo.ArrayBackend import ArrayCondensation, augment_condensation
+from src.utils.ArrayFunctions import sources_sinks_isolated_arrays
+from src.utils.Instrumentation import phase, increment
+from src.utils.Deadline import Deadline
+from src.exceptions import Exceptions
+
+CHUNK_SIZE: int = 1 << 20  # Number of edges, resp. arcs, processed at once
+_BLOCK_SIZE: int = 64  # Number of successors read at once by the strong components algorithm
+
+
+def write_edge_file(path: str, a: np.ndarray, b: np.ndarray):
+    """ Writes edges {a[i], b[i]} of a bipartite instance (n, a, b) to a binary edge file.
+
+    Notes
+    -----
+    The file consists of pairs (a, b) of little-endian 64-bit integers, where a is from A = 0..n-1
+    and b from B = n..2n-1, as produced by Generators.
+    """
+    edges = np.empty((len(a), 2), dtype='<i8')
+    edges[:, 0] = a
+    edges[:, 1] = b
+    edges.tofile(path)
+
+
+def _edge_chunks(edges: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    for start in range(0, len(edges), chunk_size):
+        yield np.asarray(edges[start:start + chunk_size], dtype=np.int64)
+
+
+def _D_arcs(chunk: np.ndarray, n: int, matched_by: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns arcs of D given by a chunk of edges, the edge {a, b} gives the arc matched_by[b] -> a. """
+    a, b = chunk[:, 0], chunk[:, 1]
+    if len(a) > 0 and (a.min() < 0 or a.max() >= n or b.min() < n or b.max() >= 2 * n):
+        raise ValueError("Edges must join A = 0..n-1 with B = n..2n-1.")
+    tails = matched_by[b - n]
+    mask = tails != a  # The matched edge itself gives no arc
+    return tails[mask], a[mask]
+
+
+def _D_keys(edges: np.ndarray, n: int, mate: np.ndarray, chunk_size: int) -> Iterator[np.ndarray]:
+    """ Yields arcs of D as keys tail * n + head, one array per chunk of edges, and checks the matching. """
+    matched_by = np.empty(n, dtype=np.int64)  # matched_by[b - n] is the vertex of A matched to b
+    matched_by[mate - n] = np.arange(n, dtype=np.int64)
+    seen = np.zeros(n, dtype=bool)  # Whether the matched edge of a vertex of A is in the file
+    for chunk in _edge_chunks(edges, chunk_size):
+        tails, heads = _D_arcs(chunk, n, matched_by)
+        seen[chunk[mate[chunk[:, 0]] == chunk[:, 1], 0]] = True
+        increment('external_chunks')
+        yield tails * n + heads
+    if not seen.all():
+        raise nx.NetworkXError("M is not a perfect matching of G.")
+
+
+def _write_runs(chunks: Iterable[np.ndarray], path: str) -> List[int]:
+    """ Writes each chunk of keys sorted and without duplicates to path, returns the boundaries of these runs. """
+    boundaries: List[int] = [0]
+    with open(path, 'wb') as stream:
+        for keys in chunks:
+            keys = np.sort(keys)
+            if len(keys) > 0:
+                keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+            keys.tofile(stream)
+            boundaries.append(boundaries[-1] + len(keys))
+    return boundaries
+
+
+def _merge_runs(path: str, boundaries: List[int], block_size: int) -> Iterator[np.ndarray]:
+    """ Yields the keys of the sorted runs in path merged in ascending order and without duplicates, in blocks.
+
+    Notes
+    -----
+    A k-way merge reading at most block_size keys of each run at once. All keys up to the smallest last key
+    of the current blocks can be output, as every run continues with larger keys. The run attaining it
+    advances by a whole block, so that each step reads at least block_size keys.
+    """
+    if boundaries[-1] == 0:  # An empty file cannot be memory-mapped
+        return
+    keys = np.memmap(path, dtype=np.int64, mode='r')
+    positions, ends = boundaries[:-1], boundaries[1:]
+    previous: int = None
+    while True:
+        active = [i for i in range(len(positions)) if positions[i] < ends[i]]
+        if not active:
+            break
+        bound = min(int(keys[min(positions[i] + block_size, ends[i]) - 1]) for i in active)
+        parts = []
+        for i in active:
+            block = keys[positions[i]:min(positions[i] + block_size, ends[i])]
+            taken = int(np.searchsorted(block, bound, side='right'))
+            parts.append(block[:taken])
+            positions[i] += taken
+        merged = np.sort(np.concatenate(parts))
+        unique = np.empty(len(merged), dtype=bool)
+        unique[0] = previous is None or merged[0] != previous
+        np.not_equal(merged[1:], merged[:-1], out=unique[1:])
+        merged = merged[unique]
+        if len(merged) > 0:
+            previous = int(merged[-1])
+            yield merged
+    del keys
+
+
+def _write_sorted_arcs(chunks: Iterable[np.ndarray], k: int, path: str, chunk_size: int) -> np.ndarray:
+    """ Writes heads of arcs given by keys tail * k + head in CSR order to path, returns indptr.
+
+    Notes
+    -----
+    A chunked external sort: each chunk is sorted in memory and written as a run to a temporary file,
+    the runs are then merged on disk, so that besides one chunk only O(k) memory is used. Duplicate arcs
+    are removed.
+    """
+    runs_path = path + '.runs'
+    boundaries = _write_runs(chunks, runs_path)
+    block_size = max(chunk_size // max(len(boundaries) - 1, 1), _BLOCK_SIZE)
+    degree = np.zeros(k, dtype=np.int64)
+    with open(path, 'wb') as stream:
+        for keys in _merge_runs(runs_path, boundaries, block_size):
+            tails, counts = np.unique(keys // k, return_counts=True)
+            degree[tails] += counts
+            (keys % k).tofile(stream)
+            increment('external_chunks')
+    os.remove(runs_path)
+    indptr = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(degree, out=indptr[1:])
+    return indptr
+
+
+def _read_heads(path: str, indptr: np.ndarray) -> np.ndarray:
+    """ Returns the heads written by _write_sorted_arcs memory-mapped. """
+    if indptr[-1] == 0:  # An empty file cannot be memory-mapped
+        return np.empty(0, dtype=np.int64)
+    return np.memmap(path, dtype=np.int64, mode='r')
+
+
+def semi_external_strong_components(indptr: np.ndarray, heads: np.ndarray) -> (int, np.ndarray):
+    """ Returns the number of strong components and the component of each vertex of a disk-resident digraph.
+
+    Parameters
+    ----------
+    indptr : np.ndarray
+        Array of length n + 1, kept in memory.
+    heads : np.ndarray
+        Heads of arcs in CSR order, typically a np.memmap, successors of v are heads[indptr[v]:indptr[v + 1]].
+
+    Returns
+    -------
+    (num_of_components, component)
+        Components are numbered in a reverse topological order of the condensation.
+
+    Notes
+    -----
+    Iterative Tarjan's algorithm, whose state (DFS numbers, lowlinks, the stacks) takes O(n) memory.
+    The successors are read from heads in blocks of at most _BLOCK_SIZE arcs, so that the DFS stack
+    holds O(n) arcs at any time and the arcs of each vertex are read sequentially.
+    """
+    n: int = len(indptr) - 1
+    ends = array('q', indptr[1:].tolist())
+    number = array('q', bytes(8 * n))  # DFS number + 1, 0 for unvisited vertices
+    low = array('q', bytes(8 * n))
+    component = np.full(n, -1, dtype=np.int64)
+    on_stack = bytearray(n)
+    stack = []  # Tarjan's stack of vertices
+    counter: int = 0
+    num_of_components: int = 0
+
+    for root in range(n):
+        if number[root]:
+            continue
+        counter += 1
+        number[root] = low[root] = counter
+        stack.append(root)
+        on_stack[root] = 1
+        frames = [[root, [], 0, int(indptr[root])]]  # [vertex, block of successors, position in block, next arc]
+        while frames:
+            frame = frames[-1]
+            v, block, k, next_arc = frame
+            if k == len(block):
+                if next_arc == ends[v]:  # All successors of v are processed
+                    frames.pop()
+                    if low[v] == number[v]:  # v is the root of a strong component
+                        while True:
+                            w = stack.pop()
+                            on_stack[w] = 0
+                            component[w] = num_of_components
+                            if w == v:
+                                break
+                        num_of_components += 1
+                    if frames:
+                        u = frames[-1][0]
+                        if low[v] < low[u]:
+                            low[u] = low[v]
+                    continue
+                end = min(next_arc + _BLOCK_SIZE, ends[v])
+                block = heads[next_arc:end].tolist()
+                frame[1], frame[3], k = block, end, 0
+            w = block[k]
+            frame[2] = k + 1
+            if not number[w]:
+                counter += 1
+                number[w] = low[w] = counter
+                stack.append(w)
+                on_stack[w] = 1
+                frames.append([w, [], 0, int(indptr[w])])
+            elif on_stack[w] and number[w] < low[v]:
+                low[v] = number[w]
+    return num_of_components, component
+
+
+def _condensation_keys(indptr: np.ndarray, heads: np.ndarray, component: np.ndarray, num_of_components: int,
+                       chunk_size: int) -> Iterator[np.ndarray]:
+    """ Yields arcs of the condensation of D as keys tail * num_of_components + head, one array per chunk. """
+    n: int = len(indptr) - 1
+    start: int = 0
+    while start < n:
+        # A block of vertices with at most chunk_size arcs, but at least one vertex
+        end = max(start + 1, int(np.searchsorted(indptr, indptr[start] + chunk_size, side='right')) - 1)
+        end = min(end, n)
+        tails = component[np.repeat(np.arange(start, end, dtype=np.int64), np.diff(indptr[start:end + 1]))]
+        component_heads = component[np.asarray(heads[indptr[start]:indptr[end]], dtype=np.int64)]
+        mask = tails != component_heads
+        increment('external_chunks')
+        yield tails[mask] * num_of_components + component_heads[mask]
+        start = end
+
+
+def external_matching_augmentation(path: str, n: int, mate: np.ndarray = None, directory: str = None,
+                                   chunk_size: int = CHUNK_SIZE, deadline: Deadline = None) -> (np.ndarray,
+                                                                                                 np.ndarray):
+    """ Returns an augmenting set of a bipartite graph stored in a binary edge file.
+
+    Parameters
+    ----------
+    path : str
+        Binary edge file of a bipartite instance (n, a, b), see write_edge_file. It is memory-mapped, not loaded.
+    n : int
+        Number of vertices of each bipartition, A = 0..n-1 and B = n..2n-1, n >= 2.
+    mate : np.ndarray = None
+        A perfect matching as an array of length n, {a, mate[a]} are the matched edges.
+        If None, the matching {i, n + i} of Generators is assumed.
+    directory : str = None
+        Directory of the temporary files, the system default if None. The files are removed on return.
+    chunk_size : int = CHUNK_SIZE
+        Number of edges, resp. arcs, held in memory at once.
+    deadline: Deadline = None
+        An optional deadline or cancellation token, see bipartite_matching_augmentation.
+
+    Returns
+    -------
+    (a, b) : (np.ndarray, np.ndarray)
+        Arrays of equal length, the augmenting set consists of edges (a[i], b[i]), where a[i] is from A and b[i]
+        from B, the same kind of augmenting set as bipartite_matching_augmentation returns.
+
+    Raises
+    ------
+    ValueError
+        If an edge does not join A and B.
+    NetworkXError
+        If mate is not a perfect matching of the graph.
+    bipartite_ghraph_not_augmentable_exception
+        If n <= 1.
+
+    Notes
+    -----
+    Besides one chunk, the memory holds O(n) integers. D and the condensation are written in CSR order
+    to temporary files (8 bytes per arc each, and as much for the sorted runs while they are merged),
+    the condensation is then processed by augment_condensation with its arcs memory-mapped, whose working
+    memory grows with the arcs of the condensation.
+    """
+    if n <= 1:
+        raise Exceptions.bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+    mate = np.arange(n, 2 * n, dtype=np.int64) if mate is None else np.asarray(mate, dtype=np.int64)
+    if len(mate) != n or mate.min() < n or mate.max() >= 2 * n or \
+            np.count_nonzero(np.bincount(mate - n, minlength=n)) != n:
+        raise nx.NetworkXError("M is not a perfect matching of G.")
+
+    if os.path.getsize(path) > 0:
+        edges = np.memmap(path, dtype='<i8', mode='r').reshape(-1, 2)
+    else:  # An empty file cannot be memory-mapped
+        edges = np.empty((0, 2), dtype=np.int64)
+    with tempfile.TemporaryDirectory(dir=directory) as work:
+        with phase('D'):
+            D_path = os.path.join(work, 'D_heads.bin')
+            indptr = _write_sorted_arcs(_D_keys(edges, n, mate, chunk_size), n, D_path, chunk_size)
+            del edges
+            heads = _read_heads(D_path, indptr)
+
+        with phase('condensation'):
+            num_of_components, component = semi_external_strong_components(indptr, heads)
+            condensation_path = os.path.join(work, 'condensation.bin')
+            c_indptr = _write_sorted_arcs(_condensation_keys(indptr, heads, component, num_of_components, chunk_size),
+                                          num_of_components, condensation_path, chunk_size)
+            del heads, indptr
+            c_indices = _read_heads(condensation_path, c_indptr)
+
+        with phase('classification'):
+            X = np.bincount(component, minlength=num_of_components) == 1  # Trivial strong components
+            sources, sinks, isolated = sources_sinks_isolated_arrays(c_indptr, c_indices)
+            representative = np.empty(num_of_components, dtype=np.int64)
+            representative[component] = np.arange(n, dtype=np.int64)
+            del component
+            full_mate = np.empty(2 * n, dtype=np.int64)  # Mates of all vertices, as in ArrayCondensation
+            full_mate[:n] = mate
+            full_mate[mate] = np.arange(n, dtype=np.int64)
+
+        C = ArrayCondensation(range(2 * n), None, full_mate, num_of_components, c_indptr, c_indices, X, sources,
+                              sinks, isolated, representative)
+        L = sorted(augment_condensation(C, deadline))
+        del C, c_indices
+    return np.array([a for a, _ in L], dtype=np.int64), np.array([b for _, b in L], dtype=np.int64)
@@ -0,0 +1,90 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Early exits of the bipartite matching augmentation for instances that need no condensation.
+A single strong component pass on arrays finds the trivial strong components of D. If there is none, G is already
+robust, if there is exactly one, it is put on a cycle directly by one or two arcs, which is optimal.
+Each fast path is counted by the Instrumentation counters fast_path_robust and fast_path_single_trivial,
+a pre-check that falls through to the full algorithm is counted as fast_path_missed.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Optional, Set, Tuple
+from src.algo.CriticalEdges import critical_vertices_from_arrays
+from src.utils.ArrayFunctions import graph_to_csr, matching_to_array, mask_from_set
+from src.utils.Instrumentation import increment
+
+
+def close_single_trivial(x: int, successors: np.ndarray, predecessors: np.ndarray,
+                         other: int) -> List[Tuple[int, int]]:
+    """ Returns a minimum set of arcs putting the vertex x, the only trivial strong component, on a cycle.
+
+    Parameters
+    ----------
+    x : int
+        The only vertex of the digraph forming a trivial strong component.
+    successors, predecessors : np.ndarray
+        Heads of the arcs leaving x and tails of the arcs entering x.
+    other : int
+        An arbitrary vertex other than x, used only if x is isolated.
+
+    Returns
+    -------
+    List[Tuple[int, int]]
+        Arcs (u, v). A single arc y -> x, resp. x -> w, closes a cycle through a successor y, resp. a predecessor w
+        of x. An isolated x needs two arcs, as a single arc incident to it cannot lie on a cycle.
+
+    Notes
+    -----
+    The added arcs only merge strong components, so no other trivial strong component arises.
+    """
+    if len(successors) > 0:
+        return [(int(successors[0]), x)]
+    if len(predecessors) > 0:
+        return [(x, int(predecessors[0]))]
+    return [(x, other), (other, x)]
+
+
+def early_exit(G: nx.Graph, A: Set, M: Dict, csr: tuple = None) -> (Optional[Set], Optional[tuple]):
+    """ Returns the augmenting set of G if a fast path applies, otherwise the arrays computed on the way.
+
+    Parameters
+    ----------
+    G, A, M
+        See bipartite_matching_augmentation, M is a perfect matching of G and |A| > 1.
+    csr : tuple = None
+        The result of graph_to_csr(G) if already computed.
+
+    Returns
+    -------
+    (L, arrays)
+        L is an empty set if D has no trivial strong component, a set of one or two edges if it has exactly one,
+        otherwise None. In that case arrays are (labels, indptr, indices, in_A, mate) of G, so that the caller
+        continues without converting G again, otherwise arrays are None.
+    """
+    labels, index, indptr, indices = csr if csr is not None else graph_to_csr(G)
+    in_A = mask_from_set(A, labels)
+    mate = matching_to_array(M, labels, index)
+
+    trivial = np.flatnonzero(critical_vertices_from_arrays(indptr, indices, in_A, mate))
+    if len(trivial) == 0:  # In particular if D is strongly connected
+        increment('fast_path_robust')
+        return set(), None
+    if len(trivial) > 1:
+        increment('fast_path_missed')
+        return None, (labels, indptr, indices, in_A, mate)
+
+    increment('fast_path_single_trivial')
+    x = int(trivial[0])
+    # The arc u -> v of D corresponds to the edge {v, M[u]} of G, the successors of x are thus the neighbours
+    # of M[x] and the predecessors of x the mates of the neighbours of x, except x itself
+    successors = indices[indptr[mate[x]]:indptr[mate[x] + 1]]
+    predecessors = mate[indices[indptr[x]:indptr[x + 1]]]
+    first, second = np.flatnonzero(in_A)[:2].tolist()
+    other = second if first == x else first
+    arcs = close_single_trivial(x, successors[successors != x], predecessors[predecessors != x], other)
+    return {(labels[v], labels[mate[u]]) for u, v in arcs}, None
@@ -0,0 +1,131 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Augmentation of a single bipartite graph under many alternative perfect matchings in parallel.
+The graph is placed once in shared memory, so that the worker processes do not receive a pickled copy per task.
+"""
+
+from __future__ import annotations
+
+import os
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+import multiprocessing
+from multiprocessing import shared_memory
+from typing import Dict, List, Set
+from src.algo.ArrayBackend import condensation_of_csr, augment_condensation
+from src.utils.ArrayFunctions import graph_to_csr, matching_to_array, mask_from_set
+from src.exceptions import Exceptions
+
+# The shared block stays attached for the lifetime of the worker process, the arrays below are views of it
+_worker_block: shared_memory.SharedMemory = None
+_worker_arrays: (np.ndarray, np.ndarray, np.ndarray) = None  # indptr, indices and in_A of G
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    """ Attaches to a shared memory block owned by the parent process, which is also responsible for unlinking it.
+    """
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13, workers share the resource tracker of the parent, so tracking is harmless
+        return shared_memory.SharedMemory(name=name)
+
+
+def _initialize_worker(name: str, n: int, num_of_indices: int):
+    global _worker_block, _worker_arrays
+    _worker_block = _attach(name)
+    buffer = np.ndarray((2 * n + 1 + num_of_indices,), dtype=np.int64, buffer=_worker_block.buf)
+    buffer.flags.writeable = False  # The block is shared by all workers
+    _worker_arrays = (buffer[:n + 1], buffer[n + 1:n + 1 + num_of_indices], buffer[n + 1 + num_of_indices:] != 0)
+
+
+def _augment_arrays(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray, mate: np.ndarray) -> List:
+    """ Returns the augmenting set of G given by CSR arrays with respect to mate, as pairs of integer vertices. """
+    C = condensation_of_csr(indptr, indices, in_A, mate)
+    return list(augment_condensation(C))
+
+
+def _augment_worker(task: (int, np.ndarray)) -> (int, List):
+    i, mate = task
+    return i, _augment_arrays(*_worker_arrays, mate)
+
+
+def augment_under_matchings(G: nx.Graph, A: Set, matchings: List[Dict], processes: int = None,
+                            best_only: bool = False):
+    """ Computes an augmenting set of G with respect to each M in matchings in parallel.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph G = (A + B, E), where G can be augmented, that is |A + B| >= 4.
+    A : Set
+        A bipartition of G, where |A| = |A + B| / 2
+    matchings : List[Dict]
+        Perfect bipartite matchings of G, for each edge {a, b} in M holds M[a] = b, M[b] = a.
+    processes : int = None
+        Number of worker processes, os.cpu_count() if None. If 1, everything is computed in this process.
+    best_only : bool = False
+        If True, only the smallest augmenting set is returned.
+
+    Returns
+    -------
+    List[(int, Set)]
+        For each matching in the given order the pair (|L|, L), where L is an augmenting set of G, the same kind
+        of set as bipartite_matching_augmentation(G, A, M) returns. Empty if matchings is empty.
+    (int, Set)
+        If best_only is True, the pair (i, L), where L is the smallest augmenting set found,
+        computed with respect to matchings[i]. The first one is taken in case of a tie.
+        None if matchings is empty.
+
+    Raises
+    ------
+    bipartite_ghraph_not_augmentable_exception
+        If G cannot be augmented.
+
+    Notes
+    -----
+    G is stored once in a shared memory block as CSR arrays (indptr, indices) together with the membership in A.
+    Each worker attaches to the shared block once and receives only the matchings, each as a single array of
+    mates. It runs the array backend directly on views of the shared arrays, see ArrayBackend.condensation_of_csr,
+    so no worker holds a private copy of G. With a single process, the same arrays are used in this process.
+    """
+
+    if len(A) <= 1:  # Graph consisting of only one vertex at each bipartition cannot be augmented.
+        raise Exceptions.bipartite_ghraph_not_augmentable_exception("G cannot be augmented.")
+
+    if len(matchings) == 0:
+        return None if best_only else []
+    if processes is None:
+        processes = os.cpu_count() or 1
+    processes = max(1, min(processes, len(matchings)))
+
+    labels, index, indptr, indices = graph_to_csr(G)
+    in_A = mask_from_set(A, labels)
+    tasks = ((i, matching_to_array(M, labels, index)) for i, M in enumerate(matchings))
+    augmenting_sets: List[Set] = [set()] * len(matchings)
+    if processes == 1:
+        for i, mate in tasks:
+            augmenting_sets[i] = {(labels[a], labels[b]) for a, b in _augment_arrays(indptr, indices, in_A, mate)}
+    else:
+        n: int = len(labels)
+        block = shared_memory.SharedMemory(create=True, size=max(1, 8 * (2 * n + 1 + len(indices))))
+        try:
+            buffer = np.ndarray((2 * n + 1 + len(indices),), dtype=np.int64, buffer=block.buf)
+            buffer[:n + 1] = indptr
+            buffer[n + 1:n + 1 + len(indices)] = indices
+            buffer[n + 1 + len(indices):] = in_A
+            del buffer
+
+            with multiprocessing.Pool(processes, _initialize_worker, (block.name, n, len(indices))) as pool:
+                for i, L in pool.imap_unordered(_augment_worker, tasks):
+                    augmenting_sets[i] = {(labels[a], labels[b]) for a, b in L}
+        finally:
+            block.close()
+            block.unlink()
+
+    if best_only:
+        best: int = min(range(len(augmenting_sets)), key=lambda i: len(augmenting_sets[i]))
+        return best, augmenting_sets[best]
+
+    return [(len(L), L) for L in augmenting_sets]
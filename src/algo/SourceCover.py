@@ -1,6 +1,6 @@
 """
 Author: Tomas Jelinek
-Last change: 27.11.2019
+Last change: 18.10.2026
 
 Description: Implementation of the source cover algorithm proposed by
         BINDEWALD, Viktor; HOMMELSHEIM, Felix; MÜHLENTHALER, Moritz; SCHAUDT, Oliver.
@@ -8,14 +8,27 @@ Description: Implementation of the source cover algorithm proposed by
         1805.01299
 """
 
-import networkx as nx
-from typing import Dict, Set
-from src.utils.AuxiliaryFunctions import get_sources_sinks_isolated, fast_traversal, heap_delete, heap_increase_value
-from networkx.utils.heaps import PairingHeap
+from __future__ import annotations
+
+import os
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from concurrent.futures import Executor
+from src.utils.AuxiliaryFunctions import get_sources_sinks_isolated
+from src.utils.ArrayFunctions import edges_to_csr, successors_of, reachable_mask
+from src.utils.BackendSelection import select_backend, prefers_arrays
+from src.utils.ReachabilityIndex import ReachabilityIndex
+from src.utils.Deadline import Deadline
+
+COVER_METHODS = ('greedy', 'parallel')
+EPSILON: float = 0.25  # Tolerance of the parallel set cover, see _parallel_cover
 
 
 def source_cover(D: nx.DiGraph, critical_vertices: Set,
-                 sourcesSinksIsolated: (Set, Set, Set) = None) -> Set:
+                 sourcesSinksIsolated: (Set, Set, Set) = None, index: ReachabilityIndex = None,
+                 backend: str = None, deadline: Deadline = None, method: str = 'greedy',
+                 executor: Executor = None) -> Set:
     """
     Computes a log n approximation of the minimal cardinality set of sources such that each
     critical vertex is reachable.
@@ -23,17 +36,37 @@ def source_cover(D: nx.DiGraph, critical_vertices: Set,
     Parameters
     ----------
     D : NetworkX DiGraph
-        A directed acyclic graph.
+        A directed acyclic graph. May be None if both sourcesSinksIsolated and index are given.
     critical_vertices : Set
         Set of critical vertices of D
     sourcesSinksIsolated : (Set, Set, Set)
         Set of sources, weak_sinks and isolated vertices of D.
+    index : ReachabilityIndex
+        Reachability index of D used for all traversals. If not provided, will be computed.
+        Pass index.reverse() when D is a reversed view of the indexed graph.
+    backend : str = None
+        'networkx' to work with sets of vertices of D, 'array' to work on NumPy arrays, which is faster for
+        large graphs. If None, the backend is chosen by the size of D, see BackendSelection.prefers_arrays.
+    deadline : Deadline = None
+        If given, it is checked inside the traversals and the greedy loop.
+    method : str = 'greedy'
+        'greedy' to choose one best source at a time, 'parallel' to choose many nearly best sources in each round,
+        whose work can be split over executor, see _parallel_cover. Both are log n approximations.
+    executor : Executor = None
+        An optional thread or process pool for the 'parallel' method, ignored by the 'greedy' one.
 
     Returns
     -------
     cover : Set
         Set of sources that form a log n approximation cover of the critical vertices.
 
+    Raises
+    ------
+    ValueError
+        If backend or method is unknown.
+    deadline_exceeded_exception
+        If the deadline expires before the cover is found.
+
     References
     ----------
        [1]  BINDEWALD, Viktor; HOMMELSHEIM, Felix; MÜHLENTHALER, Moritz; SCHAUDT, Oliver.
@@ -47,78 +80,300 @@ def source_cover(D: nx.DiGraph, critical_vertices: Set,
     else:
         sources, sinks, isolated = sourcesSinksIsolated
     sources = sources | isolated  # We consider each isolated as a source
+    if method not in COVER_METHODS:
+        raise ValueError("Unknown method {!r}.".format(method))
 
-    deleted_vertices = set()  # All vertices reachable from a critical vertex
+    if backend is None:
+        size = (len(D), D.number_of_edges()) if D is not None else (len(index), index.num_of_arcs())
+        automatic: str = 'array' if prefers_arrays(*size) else 'networkx'
+    else:
+        automatic: str = backend
+    backend = select_backend('source_cover', backend, automatic)
+    if backend == 'array':
+        return _source_cover_networkx_to_arrays(D, critical_vertices, sources, index, deadline, method, executor)
 
-    children: Dict[object, Set] = {}  # Contains all reachable critical vertices from given source
+    if index is None:
+        index = ReachabilityIndex(D)
 
+    # All vertices reachable from a critical vertex by a non-trivial path
+    deleted_vertices: Set = index.reachable_from(critical_vertices, strict=True, deadline=deadline)
+    weak_sinks = critical_vertices - deleted_vertices
 
-    def action_on_vertex_delete_reachable(vertex):
-        return True
+    # Weak sinks reachable from sources[i] are stored by their positions in incidence[bounds[i]:bounds[i + 1]]
+    # Do not visit deleted vertices when searching for weak_sinks reachable from a source
+    deleted_mask = index.mask(deleted_vertices)
+    position: Dict = index.position
+    sources: List = list(sources)
+    incidence: List[int] = []
+    bounds: List[int] = [0]
+    for source in sources:
+        reached: Set = index.reachable_from((source,), deleted_mask, deadline=deadline)
+        incidence.extend(position[sink] for sink in reached if sink in weak_sinks)
+        bounds.append(len(incidence))
 
-    def action_on_neighbor_delete_reachable(vertex, parent):
-        neighbor_already_visited = vertex in deleted_vertices
-        deleted_vertices.add(vertex)
-        return not neighbor_already_visited
+    return {sources[i] for i in _cover(method, bounds, incidence, len(index), deadline, executor)}
 
-    for critical in critical_vertices:
-        fast_traversal(D, critical, action_on_vertex_delete_reachable, action_on_neighbor_delete_reachable)
 
-    weak_sinks = critical_vertices - deleted_vertices
+def _cover(method: str, bounds: List[int], incidence: List[int], n: int, deadline: Deadline,
+           executor: Executor) -> List[int]:
+    """ Returns indices of sets chosen by the set cover method, see _greedy_cover and _parallel_cover. """
+    if method == 'parallel':
+        return _parallel_cover(bounds, incidence, n, deadline, executor)
+    return _greedy_cover(bounds, incidence, n, deadline)
 
-    visited = set()
 
-    def action_on_vertex_add_sinks(vertex):
-        visited.add(vertex)
-        if vertex in weak_sinks:
-            children[source].add(vertex)
-        return True
+def _greedy_cover(bounds: List[int], incidence: List[int], n: int, deadline: Deadline = None) -> List[int]:
+    """ Returns indices of sets chosen by the greedy set cover, until all elements of all sets are covered.
 
-    def action_on_neighbor_add_sinks(vertex, parent):
-        # Avoid processing the same vertex twice, which makes this traversal a DFS
-        # Also, do not visit deleted vertices
-        return vertex not in visited and vertex not in deleted_vertices
+    Parameters
+    ----------
+    bounds, incidence : List[int]
+        Set i consists of elements incidence[bounds[i]:bounds[i + 1]], which are integers from 0..n-1.
+    deadline : Deadline = None
+        If given, it is checked in each round.
 
-    for source in sources:
-        visited = set()  # Set of visited vertices, to avoid processing twice
-        children[source] = set()
-        fast_traversal(D, source, action_on_vertex_add_sinks, action_on_neighbor_add_sinks)
-
-    # Inverts the children table, i.e. assigns each source pointer on its "father" source
-    fathers: Dict[object, Set] = {}
-    for source in children:
-        for sink in children[source]:
-            if sink not in fathers:
-                fathers[sink] = set()
-            fathers[sink].add(source)
-
-    cover: Set = set()  # Set of covered weak_sinks
-    covered = 0  # Number of covered weak_sinks
-
-    heap = PairingHeap()  # Minimum heap to choose the best vertex to be covered
-    max_value = len(weak_sinks)  # Maximum possible size of set, used to simulate max heap via min heap
-    for source in sources:  # Fill the heap, the value is number of weak_sinks it covers
-        heap.insert(source, max_value - len(children[source]))
-
-    while covered < len(weak_sinks):  # Until we cover all weak_sinks
-
-        best_source = heap.pop()[0]  # Pop source covering the most uncovered weak_sinks
-        cover.add(best_source)
-        covered += len(children[best_source])
-
-        updated_sources: Set = set()
-        for sink in children[best_source]:  # For each newly covered sink
-            for source in fathers[sink] - {best_source}:  # Update the info about sources containing covered sink
-                updated_sources.add(source)
-                children[source].remove(sink)  # Remove it from the set of weak_sinks it covers
-            fathers.pop(sink)  # Remove covered sink from the fathers set
-
-        children.pop(best_source)  # Remove best source from the source table
-
-        for source in updated_sources:  # Now update info about all updated sources
-            if len(children[source]) > 0:  # If still covers anything, update (increase) the value in min-heap
-                heap_increase_value(heap, source, max_value - len(children[source]))
-            else:  # If given source does not cover any new, delete it from the heap
-                heap_delete(heap, source)
+    Notes
+    -----
+    Each set keeps a live counter of its uncovered elements, elements keep a covered mask and the sets
+    containing each element are given by the transposed incidence. Sets are kept in buckets by their counters,
+    a set is moved to a lower bucket whenever one of its elements is covered and outdated entries are skipped.
+    Since counters only decrease, the highest non-empty bucket is found by a single downward scan, so that
+    the whole greedy runs in time linear in the size of the incidence, without allocating any set.
+    """
+    num_of_sets: int = len(bounds) - 1
+    sizes = np.diff(np.asarray(bounds, dtype=np.int64))
+    owners = np.repeat(np.arange(num_of_sets, dtype=np.int64), sizes)  # Transposed incidence
+    elements = np.asarray(incidence, dtype=np.int64)
+    fathers: List[int] = owners[np.argsort(elements, kind='stable')].tolist()
+    father_bounds = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(elements, minlength=n), out=father_bounds[1:])
+    father_bounds: List[int] = father_bounds.tolist()
+
+    live: List[int] = sizes.tolist()  # Number of uncovered elements of each set
+    top: int = max(live, default=0)
+    buckets: List[List[int]] = [[] for _ in range(top + 1)]
+    for i in range(num_of_sets):
+        if live[i] > 0:
+            buckets[live[i]].append(i)
+
+    covered = bytearray(n)
+    cover: List[int] = []
+    while top > 0:
+        if not buckets[top]:
+            top -= 1
+            continue
+        i = buckets[top].pop()
+        if live[i] != top:  # Outdated entry, the set is also in a lower bucket
+            continue
+        if deadline is not None:
+            deadline.tick()
+
+        cover.append(i)
+        for p in incidence[bounds[i]:bounds[i + 1]]:
+            if covered[p]:
+                continue
+            covered[p] = 1
+            for father in fathers[father_bounds[p]:father_bounds[p + 1]]:
+                live[father] -= 1
+                if live[father] > 0:
+                    buckets[live[father]].append(father)
 
     return cover
+
+
+def _chunk_wins(elements: np.ndarray, owners: np.ndarray, priority: np.ndarray) -> np.ndarray:
+    """ Returns the number of elements of the chunk won by each set, see _parallel_cover.
+
+    Elements are sorted and each element is won by the candidate containing it with the least priority, sets which
+    are not candidates have priority len(priority) and win nothing.
+    """
+    num_of_sets: int = len(priority)
+    if len(elements) == 0:
+        return np.zeros(num_of_sets, dtype=np.int64)
+    starts = np.flatnonzero(np.diff(elements, prepend=-1))
+    pair_priority = priority[owners]
+    best = np.minimum.reduceat(pair_priority, starts)
+    won = (pair_priority == np.repeat(best, np.diff(np.append(starts, len(elements))))) & (pair_priority < num_of_sets)
+    return np.bincount(owners[won], minlength=num_of_sets)
+
+
+def _chunk_cover(elements: np.ndarray, owners: np.ndarray,
+                 selected: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray):
+    """ Removes the elements of the chunk covered by the selected sets, see _parallel_cover.
+
+    Returns
+    -------
+    (elements, owners, live)
+        The remaining pairs of the chunk and the number of remaining elements of each set in the chunk.
+    """
+    if len(elements) > 0:
+        starts = np.flatnonzero(np.diff(elements, prepend=-1))
+        covered = np.logical_or.reduceat(selected[owners], starts)
+        keep = ~np.repeat(covered, np.diff(np.append(starts, len(elements))))
+        elements, owners = elements[keep], owners[keep]
+    return elements, owners, np.bincount(owners, minlength=len(selected))
+
+
+def _parallel_cover(bounds: List[int], incidence: List[int], n: int, deadline: Deadline = None,
+                    executor: Executor = None, chunks: int = None, epsilon: float = EPSILON,
+                    seed: int = 0) -> List[int]:
+    """ Returns indices of sets chosen by a randomized parallel set cover, until all elements are covered.
+
+    Parameters
+    ----------
+    bounds, incidence, n, deadline
+        See _greedy_cover.
+    executor : Executor = None
+        An optional thread or process pool, the work of each round is split into chunks mapped over it.
+    chunks : int = None
+        Number of chunks of each round, by default the number of processors if executor is given, otherwise 1.
+    epsilon : float = EPSILON
+        Tolerance of the selection, larger values need fewer rounds but may choose more sets.
+    seed : int = 0
+        Seed of the random priorities, the cover is deterministic for a fixed seed.
+
+    Notes
+    -----
+    Instead of a single best set, each round selects many sets at once [2]. If the largest number of uncovered
+    elements of a set is m, the candidates of the round are the sets with at least t uncovered elements, where t
+    is the power of (1 + epsilon) with t <= m < t * (1 + epsilon). Candidates draw random priorities and each
+    uncovered element is won by the candidate containing it with the least priority. A candidate which wins at
+    least a 1 / (1 + epsilon) fraction of its uncovered elements is selected, the candidate with the least
+    priority always is. The won elements are disjoint, so each selected set covers at least m / (1 + epsilon)^2
+    new elements, which gives the approximation ratio (1 + epsilon)^2 H(n) of the greedy set cover.
+    The incidence is sorted by elements and split into chunks of whole elements, which are processed
+    independently, only the counters of the sets are combined after each step. Rounds with the same t are
+    repeated until no candidate is left, which happens after O(log n) rounds with high probability.
+
+    References
+    ----------
+    [2]  BLELLOCH, Guy E.; PENG, Richard; TANGWONGSAN, Kanat. Linear-work greedy parallel approximate set cover
+        and variants. In: SPAA '11. 2011, pp. 23-32.
+    """
+    num_of_sets: int = len(bounds) - 1
+    sizes = np.diff(np.asarray(bounds, dtype=np.int64))
+    # Pairs sorted by elements, a single sort of packed keys is faster than an argsort
+    keys = np.asarray(incidence, dtype=np.int64) * max(num_of_sets, 1)
+    keys += np.repeat(np.arange(num_of_sets, dtype=np.int64), sizes)
+    keys.sort()
+    elements, owners = np.divmod(keys, max(num_of_sets, 1))
+    del keys
+
+    if chunks is None:
+        chunks = (os.cpu_count() or 1) if executor is not None else 1
+    # Chunks end at element boundaries, so that all sets containing an element are in the same chunk
+    cuts = np.searchsorted(elements, np.linspace(0, n, chunks + 1)[1:-1], side='left')
+    parts: List = list(zip(np.split(elements, cuts), np.split(owners, cuts)))
+    del elements, owners
+    apply = executor.map if executor is not None else map
+
+    rng = np.random.default_rng(seed)
+    live = sizes
+    cover: List[np.ndarray] = []
+    while True:
+        m: int = int(live.max(initial=0))
+        if m == 0:
+            break
+        if deadline is not None:
+            deadline.check()
+        threshold: float = min((1 + epsilon) ** np.floor(np.log(m) / np.log1p(epsilon)), m)
+        candidates = np.flatnonzero(live >= threshold)
+        priority = np.full(num_of_sets, num_of_sets, dtype=np.int64)
+        priority[candidates] = rng.permutation(len(candidates))
+
+        wins = sum(apply(_chunk_wins, *zip(*parts), [priority] * len(parts)))
+        selected = (priority < num_of_sets) & (wins * (1 + epsilon) >= live)
+        cover.append(np.flatnonzero(selected))
+        results = list(apply(_chunk_cover, *zip(*parts), [selected] * len(parts)))
+        parts = [(part_elements, part_owners) for part_elements, part_owners, _ in results]
+        live = sum(part_live for _, _, part_live in results)
+
+    return np.concatenate(cover).tolist() if cover else []
+
+
+def source_cover_arrays(indptr: np.ndarray, indices: np.ndarray, critical: np.ndarray,
+                        sources: np.ndarray, deadline: Deadline = None, method: str = 'greedy',
+                        executor: Executor = None) -> np.ndarray:
+    """ Array counterpart of source_cover on an acyclic digraph given by CSR arrays.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        CSR arrays of an acyclic digraph on vertices 0..n-1.
+    critical : np.ndarray
+        Boolean mask of critical vertices.
+    sources : np.ndarray
+        Sources and isolated vertices of the digraph.
+    deadline : Deadline = None
+        If given, it is checked inside the traversals and the greedy loop.
+    method : str = 'greedy'
+        The set cover method, see source_cover.
+    executor : Executor = None
+        An optional thread or process pool for the 'parallel' method.
+
+    Returns
+    -------
+    np.ndarray
+        Sources that form a log n approximation cover of the critical vertices.
+
+    Notes
+    -----
+    Vertices reachable from a critical vertex by a non-trivial path are found by a single breadth-first search
+    of SciPy. Weak sinks reachable from each source are stored as one flat incidence array for the greedy
+    set cover, see _greedy_cover and _parallel_cover.
+    """
+    if method not in COVER_METHODS:
+        raise ValueError("Unknown method {!r}.".format(method))
+    n: int = len(indptr) - 1
+    start = np.zeros(n, dtype=bool)
+    start[successors_of(indptr, indices, critical)] = True
+    deleted = reachable_mask(indptr, indices, start)  # Reachable from a critical vertex by a non-trivial path
+    weak_sinks = critical & ~deleted
+    if not weak_sinks.any():
+        return np.empty(0, dtype=np.int64)
+
+    starts: List[int] = indptr.tolist()
+    neighbors: List[int] = indices.tolist()
+    blocked: List[bool] = deleted.tolist()
+    is_weak_sink: List[bool] = weak_sinks.tolist()
+    sources: List[int] = np.asarray(sources, dtype=np.int64).tolist()
+
+    stamp: List[int] = [-1] * n  # Search in which the vertex was visited, avoids clearing a visited set
+    incidence: List[int] = []  # Weak sinks reachable from sources[i] are incidence[bounds[i]:bounds[i + 1]]
+    bounds: List[int] = [0]
+    for i, source in enumerate(sources):
+        stamp[source] = i
+        stack: List[int] = [source]
+        while stack:
+            p = stack.pop()
+            if deadline is not None:
+                deadline.tick()
+            if is_weak_sink[p]:
+                incidence.append(p)
+            for q in neighbors[starts[p]:starts[p + 1]]:
+                if stamp[q] != i and not blocked[q]:
+                    stamp[q] = i
+                    stack.append(q)
+        bounds.append(len(incidence))
+
+    return np.asarray(sources, dtype=np.int64)[_cover(method, bounds, incidence, n, deadline, executor)]
+
+
+def _source_cover_networkx_to_arrays(D: nx.DiGraph, critical_vertices: Set, sources: Set,
+                                     index: ReachabilityIndex, deadline: Deadline, method: str,
+                                     executor: Executor) -> Set:
+    """ Runs source_cover_arrays on D, or on the arcs stored in index if given, and maps the cover back. """
+    if index is not None:
+        labels, position = index.labels, index.position
+        indptr, indices = index.to_csr()
+    else:
+        labels = list(D.nodes)
+        position: Dict = {vertex: i for i, vertex in enumerate(labels)}
+        arcs = np.fromiter((position[w] for e in D.edges for w in e), dtype=np.int64, count=2 * D.number_of_edges())
+        indptr, indices = edges_to_csr(len(labels), arcs[0::2], arcs[1::2])
+
+    critical = np.zeros(len(labels), dtype=bool)
+    critical[[position[vertex] for vertex in critical_vertices]] = True
+    cover = source_cover_arrays(indptr, indices, critical, [position[vertex] for vertex in sources], deadline,
+                                 method, executor)
+    return {labels[p] for p in cover.tolist()}
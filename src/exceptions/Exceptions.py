@@ -1,12 +1,55 @@
 """
 Author: Tomas Jelinek
-Last change: 12.9.2019
+Last change: 18.10.2026
 
 Description: Implementation of exceptions relating to the bipartite matching augmentation algorithm.
+The exceptions of the algorithm derive from NetworkXException, they are defined on the first access, so that
+importing this module does not import NetworkX. Modules that may run without NetworkX refer to them as
+Exceptions.<name>.
 """
-import networkx as nx
+import threading
 
 
-class bipartite_ghraph_not_augmentable_exception(nx.NetworkXException):
-    """Exception raised if a bipartite graph cannot be augmented so that
-    the graph admits a perfect matching even after a single arbitrary edge is removed."""
+class unknown_instance_exception(KeyError):
+    """Exception raised by the augmentation server if no instance of the given id is loaded."""
+
+
+_lock = threading.Lock()
+_NAMES = ('bipartite_ghraph_not_augmentable_exception', 'deadline_exceeded_exception', 'invalid_instance_exception')
+
+
+def _define():
+    import networkx as nx
+
+    class bipartite_ghraph_not_augmentable_exception(nx.NetworkXException):
+        """Exception raised if a bipartite graph cannot be augmented so that
+        the graph admits a perfect matching even after a single arbitrary edge is removed."""
+
+    class deadline_exceeded_exception(nx.NetworkXException):
+        """Exception raised inside a long loop if the deadline of the computation has passed
+        or the computation has been cancelled."""
+
+    class invalid_instance_exception(nx.NetworkXException):
+        """Exception raised by the validation if A is not a bipartition of G into halves, M is not a perfect
+        matching of G or G is too small. Attribute problems is the list of all problems found."""
+
+        def __init__(self, problems):
+            super().__init__('; '.join(problems))
+            self.problems = list(problems)
+
+        def __reduce__(self):
+            return type(self), (self.problems,)
+
+    for exception in (bipartite_ghraph_not_augmentable_exception, deadline_exceeded_exception,
+                      invalid_instance_exception):
+        exception.__qualname__ = exception.__name__
+        globals()[exception.__name__] = exception
+
+
+def __getattr__(name: str):
+    if name not in _NAMES:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    with _lock:
+        if name not in globals():
+            _define()
+    return globals()[name]
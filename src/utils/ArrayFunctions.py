@@ -0,0 +1,398 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Contains auxiliary algorithms working on graphs represented by NumPy arrays.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+
+
+def graph_to_csr(G: nx.Graph) -> (List, Dict, np.ndarray, np.ndarray):
+    """ Transforms an undirected graph to the compressed sparse row (CSR) representation.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       An undirected graph.
+
+    Returns
+    -------
+    (labels, index, indptr, indices)
+        labels - list of vertices of G, vertex labels[i] is represented by integer i
+        index - dictionary inverse to labels, index[labels[i]] = i
+        indptr - array of length |V| + 1, neighbors of i are indices[indptr[i]:indptr[i + 1]]
+        indices - array of length 2|E| of neighbors, each edge is stored in both directions
+    """
+    labels: List = list(G.nodes)
+    index: Dict = {vertex: i for i, vertex in enumerate(labels)}
+    n: int = len(labels)
+
+    edges = np.fromiter((index[w] for e in G.edges for w in e), dtype=np.int64, count=2 * G.number_of_edges())
+    tails = np.concatenate((edges[0::2], edges[1::2]))
+    heads = np.concatenate((edges[1::2], edges[0::2]))
+    indptr, indices = edges_to_csr(n, tails, heads)
+    return labels, index, indptr, indices
+
+
+def edges_to_csr(n: int, tails: np.ndarray, heads: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns CSR arrays (indptr, indices) of the directed graph on vertices 0..n-1 with arcs tails[i] -> heads[i].
+    """
+    order = np.argsort(tails, kind='stable')
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(tails, minlength=n), out=indptr[1:])
+    return indptr, np.ascontiguousarray(heads[order], dtype=np.int64)
+
+
+def csr_to_graph(indptr: np.ndarray, indices: np.ndarray) -> nx.Graph:
+    """ Returns a NetworkX Graph on vertices 0..n-1 given by the symmetric CSR arrays indptr and indices. """
+    n: int = len(indptr) - 1
+    tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    mask = tails < indices  # Each edge is stored twice, keep a single copy
+    G: nx.Graph = nx.Graph()
+    G.add_nodes_from(range(n))
+    G.add_edges_from(zip(tails[mask].tolist(), indices[mask].tolist()))
+    return G
+
+
+def matching_to_array(M: Dict, labels: List, index: Dict) -> np.ndarray:
+    """ Returns array mate such that mate[i] = index[M[labels[i]]]. """
+    return np.fromiter((index[M[vertex]] for vertex in labels), dtype=np.int64, count=len(labels))
+
+
+def mask_from_set(S: Set, labels: List) -> np.ndarray:
+    """ Returns a boolean array mask such that mask[i] is True iff labels[i] is in S. """
+    return np.fromiter((vertex in S for vertex in labels), dtype=bool, count=len(labels))
+
+
+def labels_to_array(labels: List) -> np.ndarray:
+    """ Returns labels as a NumPy array, of integer dtype if all labels are integers and of object dtype otherwise. """
+    if all(type(vertex) is int for vertex in labels):
+        return np.asarray(labels, dtype=np.int64)
+    array = np.empty(len(labels), dtype=object)
+    array[:] = labels
+    return array
+
+
+def perfect_matching_array(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray) -> np.ndarray:
+    """ Returns a perfect matching of the bipartite graph given by symmetric CSR arrays as an array of mates.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        Symmetric CSR arrays of a bipartite graph on vertices 0..n-1.
+    in_A : np.ndarray
+        Boolean mask of the bipartition A.
+
+    Returns
+    -------
+    np.ndarray
+        Array mate of length n, where {i, mate[i]} is a matched edge for every vertex i.
+
+    Raises
+    ------
+    NetworkXError
+        If the graph does not admit a perfect matching.
+    """
+    if 2 * np.count_nonzero(in_A) != len(in_A):
+        raise nx.NetworkXError("G does not admit a perfect matching.")
+    mate = maximum_matching_array(indptr, indices, in_A)
+    if np.any(mate < 0):
+        raise nx.NetworkXError("G does not admit a perfect matching.")
+    return mate
+
+
+def maximum_matching_array(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray) -> np.ndarray:
+    """ Returns a maximum matching of the bipartite graph given by symmetric CSR arrays as an array of mates.
+
+    Returns
+    -------
+    np.ndarray
+        Array mate of length n, where {i, mate[i]} is a matched edge, mate[i] = -1 for unmatched vertices i.
+
+    Notes
+    -----
+    Uses the Hopcroft-Karp implementation of SciPy on the biadjacency matrix, see perfect_matching_array.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import maximum_bipartite_matching
+
+    n: int = len(indptr) - 1
+    A_vertices = np.flatnonzero(in_A)
+    B_vertices = np.flatnonzero(~in_A)
+    local = np.empty(n, dtype=np.int64)  # Position of each vertex within its bipartition
+    local[A_vertices] = np.arange(len(A_vertices))
+    local[B_vertices] = np.arange(len(B_vertices))
+
+    degrees = np.diff(indptr)
+    row_indptr = np.zeros(len(A_vertices) + 1, dtype=np.int64)
+    np.cumsum(degrees[A_vertices], out=row_indptr[1:])
+    starts = np.repeat(indptr[A_vertices] - row_indptr[:-1], degrees[A_vertices])
+    columns = local[indices[starts + np.arange(row_indptr[-1])]]
+    biadjacency = csr_matrix((np.ones(len(columns), dtype=np.int8), columns, row_indptr),
+                             shape=(len(A_vertices), len(B_vertices)))
+
+    matched = maximum_bipartite_matching(biadjacency, perm_type='column')
+    mate = np.full(n, -1, dtype=np.int64)
+    is_matched = matched >= 0
+    mate[A_vertices[is_matched]] = B_vertices[matched[is_matched]]
+    mate[B_vertices[matched[is_matched]]] = A_vertices[is_matched]
+    return mate
+
+
+def bipartite_csr_to_D_arcs(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray,
+                            mate: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns arcs (tails, heads) of D on vertices 0..n-1, where only vertices of A are incident to an arc.
+
+    Notes
+    -----
+    For each edge {a', b} of G, where b is from B and a' is not matched to b, D contains the arc mate[b] -> a'.
+    This is the same D as constructed by bipartite_to_D.
+    """
+    n: int = len(indptr) - 1
+    tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    mask = ~in_A[tails]  # Edges leaving B
+    tails, heads = mate[tails[mask]], indices[mask]
+    mask = tails != heads  # Skip the matched edges
+    return tails[mask], heads[mask]
+
+
+def default_matching_array(k: int) -> np.ndarray:
+    """ Returns the array of mates of the perfect matching {i, k + i} of a bipartite graph on vertices 0..2k-1.
+
+    Notes
+    -----
+    Array counterpart of default_matching_from_D, the partner of vertex i of D is k + i instead of -i.
+    """
+    return np.concatenate((np.arange(k, 2 * k, dtype=np.int64), np.arange(k, dtype=np.int64)))
+
+
+def _sorted_unique(values: np.ndarray) -> np.ndarray:
+    """ Sorting and a difference mask is considerably faster than np.unique. """
+    values = np.sort(values)
+    return values[np.concatenate(([True], values[1:] != values[:-1]))] if len(values) > 0 else values
+
+
+def simple_arcs(n: int, tails: np.ndarray, heads: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns the arcs of the digraph on 0..n-1 without loops and parallel arcs, sorted by tails and heads. """
+    tails = np.asarray(tails, dtype=np.int64)
+    heads = np.asarray(heads, dtype=np.int64)
+    mask = tails != heads
+    keys = _sorted_unique(tails[mask] * n + heads[mask])
+    return keys // n, keys % n
+
+
+def D_arcs_to_bipartite_edges(k: int, tails: np.ndarray, heads: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns the edges (a[i], b[i]) of the bipartite graph G whose D has the arcs tails[i] -> heads[i].
+
+    Parameters
+    ----------
+    k : int
+        Number of vertices of D, which are 0..k-1.
+    tails, heads : np.ndarray
+        Arcs of D.
+
+    Returns
+    -------
+    (a, b) : (np.ndarray, np.ndarray)
+        Edges of G on A = 0..k-1 and B = k..2k-1 sorted by a and b, including the perfect matching {i, k + i}.
+
+    Notes
+    -----
+    Array counterpart of D_to_bipartite, the arc u -> v corresponds to the edge {v, k + u}. Loops and parallel
+    arcs are dropped, since they do not change G.
+    """
+    tails = np.asarray(tails, dtype=np.int64)
+    heads = np.asarray(heads, dtype=np.int64)
+    keys = _sorted_unique(np.concatenate((heads * k + tails, np.arange(k, dtype=np.int64) * (k + 1))))
+    return keys // k, keys % k + k
+
+
+def _compress_ids(tails: np.ndarray, heads: np.ndarray, ids: np.ndarray = None) -> (np.ndarray, np.ndarray,
+                                                                                    np.ndarray):
+    """ Returns sorted unique ids and the arcs renumbered to positions in ids, see D_arcs_to_bipartite_csr.
+
+    Notes
+    -----
+    If the ids span a range not much larger than their number, the positions are prefix sums of a mask over
+    the range. Otherwise all ids are ranked by a single sort, binary search of each endpoint would be several
+    times slower on large arrays due to cache misses.
+    """
+    m: int = len(tails)
+    values = np.concatenate((tails, heads) if ids is None else (ids, tails, heads))
+    if len(values) == 0:
+        return values, tails, heads
+    low, high = int(values.min()), int(values.max())
+    if high - low < 4 * len(values):
+        present = np.zeros(high - low + 1, dtype=bool)
+        present[(values if ids is None else ids) - low] = True
+        if ids is not None and not present[values - low].all():
+            raise ValueError("An arc of D is incident to a vertex that is not in ids.")
+        position = np.cumsum(present, dtype=np.int64) - 1
+        return np.flatnonzero(present) + low, position[tails - low], position[heads - low]
+
+    shift: int = len(values).bit_length()
+    if (high - low).bit_length() + shift <= 63:  # Sorting values packed with their indices beats argsort
+        keys = np.sort(((values - low) << shift) | np.arange(len(values), dtype=np.int64))
+        order, ordered = keys & ((1 << shift) - 1), (keys >> shift) + low
+        del keys
+    else:
+        order = np.argsort(values)
+        ordered = values[order]
+    new = np.concatenate(([True], ordered[1:] != ordered[:-1]))
+    rank = np.empty(len(values), dtype=np.int64)
+    rank[order] = np.cumsum(new, dtype=np.int64) - 1
+    if ids is not None and np.count_nonzero(new) != len(ids):
+        raise ValueError("An arc of D is incident to a vertex that is not in ids.")
+    offset: int = 0 if ids is None else len(ids)
+    return ordered[new], rank[offset:offset + m], rank[offset + m:]
+
+
+def D_arcs_to_bipartite_csr(tails: np.ndarray, heads: np.ndarray,
+                            ids: np.ndarray = None) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+    """ Returns the bipartite graph G and its perfect matching whose D has the arcs tails[i] -> heads[i].
+
+    Parameters
+    ----------
+    tails, heads : np.ndarray
+        Arcs of D between arbitrary integer ids, e.g. 1..n or negative ids.
+    ids : np.ndarray = None
+        All vertices of D, needed if D has vertices without arcs. By default the ids occurring in the arcs.
+
+    Returns
+    -------
+    (ids, indptr, indices, mate)
+        ids - sorted array of the k vertices of D, vertex ids[i] of D is the vertex i of A = 0..k-1 of G
+        indptr, indices - symmetric CSR arrays of G on vertices 0..2k-1, B = k..2k-1
+        mate - the perfect matching {i, k + i} of G as an array of mates, see default_matching_array
+
+    Raises
+    ------
+    ValueError
+        If an arc is incident to a vertex that is not in ids.
+
+    Notes
+    -----
+    The edges are given by D_arcs_to_bipartite_edges, sorted by the vertex of A, a second sort of the edges
+    as integer keys gives the rows of B, without a general sort of the CSR entries.
+    """
+    tails = np.asarray(tails, dtype=np.int64)
+    heads = np.asarray(heads, dtype=np.int64)
+    ids, u, v = _compress_ids(tails, heads, None if ids is None else _sorted_unique(np.asarray(ids, dtype=np.int64)))
+    k: int = len(ids)
+
+    a, A_neighbors = D_arcs_to_bipartite_edges(k, u, v)
+    A_counts = np.bincount(a, minlength=k)
+    keys = np.sort(A_neighbors * k + a)  # The same edges as (k + u, v), ordered by the vertex of B
+    del a
+    B_counts = np.bincount(keys // k - k, minlength=k)
+    indptr = np.zeros(2 * k + 1, dtype=np.int64)
+    np.cumsum(np.concatenate((A_counts, B_counts)), out=indptr[1:])
+    return ids, indptr, np.concatenate((A_neighbors, keys % k)), default_matching_array(k)
+
+
+def bipartite_csr_to_D(indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray, mate: np.ndarray,
+                       labels: np.ndarray = None) -> (np.ndarray, np.ndarray, np.ndarray):
+    """ Returns D of a bipartite graph with its vertices numbered 0..|A|-1.
+
+    Parameters
+    ----------
+    indptr, indices : np.ndarray
+        Symmetric CSR arrays of a bipartite graph G on vertices 0..n-1.
+    in_A : np.ndarray
+        Boolean mask of the bipartition A.
+    mate : np.ndarray
+        A perfect matching of G as an array of mates.
+    labels : np.ndarray = None
+        Ids of the vertices of G. By default, the vertex i of G has id i.
+
+    Returns
+    -------
+    (ids, tails, heads)
+        ids - array of length |A|, the vertex i of D is the vertex of A with id ids[i]
+        tails, heads - arcs tails[i] -> heads[i] of D on vertices 0..|A|-1
+
+    Notes
+    -----
+    Array counterpart of bipartite_to_D, inverse to D_arcs_to_bipartite_csr up to the ids of B.
+    """
+    vertices = np.flatnonzero(in_A)
+    local = np.empty(len(in_A), dtype=np.int64)
+    local[vertices] = np.arange(len(vertices), dtype=np.int64)
+    tails, heads = bipartite_csr_to_D_arcs(indptr, indices, in_A, mate)
+    ids = vertices if labels is None else np.asarray(labels)[vertices]
+    return ids, local[tails], local[heads]
+
+
+def strong_components(n: int, tails: np.ndarray, heads: np.ndarray) -> (int, np.ndarray):
+    """ Returns the number of strong components and the component of each vertex of the digraph on 0..n-1. """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import connected_components
+
+    adjacency = csr_matrix((np.ones(len(tails), dtype=bool), (tails, heads)), shape=(n, n))
+    return connected_components(adjacency, directed=True, connection='strong')
+
+
+def transpose_csr(indptr: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray):
+    """ Returns CSR arrays of the reversed directed graph. """
+    n: int = len(indptr) - 1
+    tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    return edges_to_csr(n, indices, tails)
+
+
+def condensation_arrays(n: int, tails: np.ndarray,
+                        heads: np.ndarray) -> (int, np.ndarray, np.ndarray, np.ndarray):
+    """ Returns the condensation of the digraph on 0..n-1 with arcs tails[i] -> heads[i].
+
+    Returns
+    -------
+    (num_of_components, component, indptr, indices)
+        component - array of length n, the strong component of each vertex
+        indptr, indices - CSR arrays of the condensation on vertices 0..num_of_components-1 without parallel arcs
+    """
+    num_of_components, component = strong_components(n, tails, heads)
+    component = component.astype(np.int64, copy=False)
+    indptr, indices = edges_to_csr(num_of_components, *simple_arcs(num_of_components, component[tails],
+                                                                   component[heads]))
+    return num_of_components, component, indptr, indices
+
+
+def sources_sinks_isolated_arrays(indptr: np.ndarray, indices: np.ndarray) -> (np.ndarray, np.ndarray, np.ndarray):
+    """ Returns arrays of sources, sinks and isolated vertices of a directed graph given by CSR arrays. """
+    n: int = len(indptr) - 1
+    out_degree = np.diff(indptr)
+    in_degree = np.bincount(indices, minlength=n)
+    return (np.flatnonzero((in_degree == 0) & (out_degree > 0)),
+            np.flatnonzero((out_degree == 0) & (in_degree > 0)),
+            np.flatnonzero((in_degree == 0) & (out_degree == 0)))
+
+
+def successors_of(indptr: np.ndarray, indices: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """ Returns heads of all arcs leaving vertices in mask, possibly with repetitions. """
+    return indices[np.repeat(mask, np.diff(indptr))]
+
+
+def reachable_mask(indptr: np.ndarray, indices: np.ndarray, start: np.ndarray) -> np.ndarray:
+    """ Returns a boolean mask of vertices reachable from any vertex in the boolean mask start.
+
+    Notes
+    -----
+    A single breadth-first search of SciPy from an auxiliary vertex with an arc to each starting vertex.
+    """
+    from scipy.sparse import csr_matrix
+    from scipy.sparse.csgraph import breadth_first_order
+
+    n: int = len(indptr) - 1
+    starts = np.flatnonzero(start)
+    reached = np.zeros(n + 1, dtype=bool)
+    if len(starts) == 0:
+        return reached[:n]
+    indptr = np.append(indptr, indptr[-1] + len(starts))
+    indices = np.concatenate((indices, starts))
+    graph = csr_matrix((np.ones(len(indices), dtype=np.int8), indices, indptr), shape=(n + 1, n + 1))
+    reached[breadth_first_order(graph, n, directed=True, return_predecessors=False)] = True
+    return reached[:n]
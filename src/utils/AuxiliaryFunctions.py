@@ -5,10 +5,14 @@ Last change: 18.9.2019
 Description: Contains various auxiliary algorithms.
 """
 
-import networkx as nx
-from typing import Set, Dict
-from networkx.utils.decorators import not_implemented_for
-from networkx.utils.heaps import PairingHeap
+from __future__ import annotations
+
+from src.utils.LazyImport import networkx as nx
+from typing import Set, Dict, TYPE_CHECKING
+from src.utils.LazyImport import not_implemented_for
+
+if TYPE_CHECKING:
+    from networkx.utils.heaps import PairingHeap
 
 
 @not_implemented_for('undirected')
@@ -138,7 +142,7 @@ def heap_increase_value(heap: PairingHeap, key, new_value):
     -----
     Serves as a wrap-up of the increase key operation. For decrease, use just insert with new key
     """
-    min_value = heap.min()
+    min_value = heap.min()[1]
     heap.insert(key, min_value - 1)
     heap.pop()
     heap.insert(key, new_value)
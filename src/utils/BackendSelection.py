@@ -0,0 +1,45 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Selection between the NetworkX implementation and the array-based implementation of the algorithms.
+The NetworkX implementation has a small constant overhead and wins on small graphs, the array-based one converts
+the graph to NumPy arrays once and wins on large graphs.
+"""
+
+from typing import Iterable
+from src.utils.Instrumentation import event
+
+BACKENDS = ('networkx', 'array')
+ARRAY_MIN_VERTICES: int = 200  # Minimal number of vertices for which the array backend is chosen automatically
+ARRAY_MIN_EDGES: int = 500  # Minimal number of edges for which the array backend is chosen automatically
+
+
+def prefers_arrays(num_of_vertices: int, num_of_edges: int) -> bool:
+    """ Returns True if the array-based implementation is expected to be faster on a graph of the given size. """
+    return num_of_vertices >= ARRAY_MIN_VERTICES or num_of_edges >= ARRAY_MIN_EDGES
+
+
+def select_backend(function: str, backend: str, automatic: str, allowed: Iterable[str] = BACKENDS) -> str:
+    """ Returns the backend to be used by function and records the decision.
+
+    Parameters
+    ----------
+    function : str
+        Name of the function choosing its backend.
+    backend : str
+        Backend requested by the caller, None for the automatic choice.
+    automatic : str
+        Backend chosen by the function from the size of the instance, used if backend is None.
+    allowed : Iterable[str]
+        Backends implemented by the function.
+
+    Raises
+    ------
+    ValueError
+        If backend is neither None nor an allowed backend.
+    """
+    if backend is not None and backend not in allowed:
+        raise ValueError("Unknown backend {!r}.".format(backend))
+    event('backend', function=function, backend=backend or automatic, automatic=backend is None)
+    return backend or automatic
@@ -0,0 +1,126 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Contains auxiliary algorithms working on digraphs whose adjacency rows are packed bitsets.
+A bitset over vertices 0..n-1 is a Python int, vertex i being present iff bit i is set. Python ints
+are arbitrary-precision, so OR, AND and NOT of whole rows run word-parallel in C.
+"""
+
+import numpy as np
+from typing import List
+
+
+def popcount(x: int) -> int:
+    """ Returns the number of vertices in bitset x. """
+    return x.bit_count() if hasattr(x, 'bit_count') else bin(x).count('1')
+
+
+def bitset_from_mask(mask: np.ndarray) -> int:
+    """ Returns the bitset of a boolean array mask. """
+    return int.from_bytes(np.packbits(mask, bitorder='little').tobytes(), 'little')
+
+
+def bitset_from_indices(indices, n: int) -> int:
+    """ Returns the bitset containing the given vertices from 0..n-1. """
+    mask = np.zeros(n, dtype=bool)
+    mask[np.asarray(indices, dtype=np.int64)] = True
+    return bitset_from_mask(mask)
+
+
+def bitset_indices(x: int, n: int) -> np.ndarray:
+    """ Returns the sorted array of vertices in bitset x over 0..n-1. """
+    if x == 0:
+        return np.zeros(0, dtype=np.int64)
+    data = np.frombuffer(x.to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(data, bitorder='little')[:n])
+
+
+def packed_rows_to_bitsets(packed: np.ndarray) -> List[int]:
+    """ Returns the bitsets of rows of a matrix packed by np.packbits(..., axis=1, bitorder='little'). """
+    return [int.from_bytes(row.tobytes(), 'little') for row in packed]
+
+
+def transpose_packed(packed: np.ndarray, n: int, chunk: int = 1024) -> np.ndarray:
+    """ Returns the transpose of an n x n bit matrix packed along rows with little bit order.
+
+    Notes
+    -----
+    The matrix is unpacked in chunks of rows, so that at most chunk * n bytes are unpacked at once.
+    """
+    transposed = np.zeros((n, (n + 7) // 8), dtype=np.uint8)
+    for start in range(0, n, chunk):
+        block = np.unpackbits(packed[start:start + chunk], axis=1, count=n, bitorder='little')  # rows x n
+        packed_block = np.packbits(block.T, axis=1, bitorder='little')  # n x ceil(rows / 8)
+        transposed[:, start // 8:start // 8 + packed_block.shape[1]] |= packed_block
+    return transposed
+
+
+def bitset_reach(rows: List[int], start: int, allowed: int, n: int) -> int:
+    """ Returns the bitset of vertices reachable from bitset start using only vertices in bitset allowed.
+
+    Notes
+    -----
+    Breadth-first search, each vertex is expanded once and the whole frontier is expanded by OR of its rows.
+    Vertices of start are always included, even if they are not allowed.
+    """
+    visited: int = start
+    frontier: int = start
+    while frontier:
+        successors: int = 0
+        for vertex in bitset_indices(frontier, n).tolist():
+            successors |= rows[vertex]
+        frontier = successors & allowed & ~visited
+        visited |= frontier
+    return visited
+
+
+def bitset_strong_components(rows: List[int], cols: List[int], n: int) -> (int, np.ndarray):
+    """ Returns the number of strong components and the component of each vertex.
+
+    Parameters
+    ----------
+    rows : List[int]
+        Out-neighborhoods of vertices 0..n-1 as bitsets.
+    cols : List[int]
+        In-neighborhoods of vertices 0..n-1 as bitsets.
+
+    Notes
+    -----
+    Kosaraju's algorithm. The next unvisited neighbor of a vertex is the lowest bit of its row masked
+    by the bitset of unvisited vertices, hence the search does O(n) word-parallel operations and never
+    iterates over arcs. Components are numbered in a topological order of the condensation.
+    """
+    unvisited: int = (1 << n) - 1
+    order: List[int] = []
+    for root in range(n):  # First pass, vertices by increasing finishing time
+        if not (unvisited >> root) & 1:
+            continue
+        unvisited ^= 1 << root
+        stack: List[int] = [root]
+        while stack:
+            remaining = rows[stack[-1]] & unvisited
+            if remaining:
+                vertex = (remaining & -remaining).bit_length() - 1
+                unvisited ^= 1 << vertex
+                stack.append(vertex)
+            else:
+                order.append(stack.pop())
+
+    component = np.empty(n, dtype=np.int64)
+    num_of_components: int = 0
+    unvisited = (1 << n) - 1
+    for root in reversed(order):  # Second pass on the reversed digraph
+        if not (unvisited >> root) & 1:
+            continue
+        unvisited ^= 1 << root
+        stack = [root]
+        while stack:
+            vertex = stack.pop()
+            component[vertex] = num_of_components
+            remaining = cols[vertex] & unvisited
+            unvisited &= ~remaining
+            stack.extend(bitset_indices(remaining, n).tolist())
+        num_of_components += 1
+
+    return num_of_components, component
@@ -0,0 +1,61 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Concurrent execution of independent phases of a single computation. The source cover of the sources
+and that of the sinks do not depend on each other, neither do the forward CX and the backward XC sweeps.
+Given an executor, all but the last of such calls run on it while the calling thread runs the last one.
+The phases are reentrant, they keep all their state in local variables and only read the shared structures.
+NumPy and SciPy release the global interpreter lock in their kernels, on free-threaded CPython the pure Python
+phases run in parallel as well.
+"""
+
+import sys
+import contextvars
+from concurrent.futures import Executor, Future, wait
+from typing import Any, Callable, List
+
+
+def gil_enabled() -> bool:
+    """ Returns False on free-threaded CPython with the global interpreter lock disabled. """
+    is_gil_enabled = getattr(sys, '_is_gil_enabled', None)
+    return is_gil_enabled() if is_gil_enabled is not None else True
+
+
+def run_concurrently(executor: Executor, *calls: Callable[[], Any]) -> List:
+    """ Returns the results of the calls without arguments, computed concurrently if executor is given.
+
+    Parameters
+    ----------
+    executor : Executor
+        A thread pool, or None to run the calls one after another in the calling thread. It must not be
+        the pool the caller itself runs on, otherwise the calls may wait for each other's workers.
+    calls : Callable[[], Any]
+        Independent calls.
+
+    Returns
+    -------
+    List
+        Results of the calls in the given order.
+
+    Raises
+    ------
+    Exception
+        The exception of the first failing call in the given order, raised after all calls have finished,
+        so that no call outlives the phase.
+
+    Notes
+    -----
+    Each call submitted to the executor runs in a copy of the context of the caller, so that the active
+    Instrumentation collector records its counters and events.
+    """
+    if executor is None or len(calls) <= 1:
+        return [call() for call in calls]
+    futures: List[Future] = [executor.submit(contextvars.copy_context().run, call) for call in calls[:-1]]
+    last = Future()
+    try:
+        last.set_result(calls[-1]())
+    except BaseException as exception:
+        last.set_exception(exception)
+    wait(futures)
+    return [future.result() for future in futures + [last]]
@@ -0,0 +1,66 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: A deadline and cancellation token checked between phases and inside long loops of the algorithms.
+"""
+
+from __future__ import annotations
+
+import time
+from src.exceptions import Exceptions
+
+CHECK_INTERVAL: int = 1024  # Number of tick() calls between two reads of the clock
+
+
+class Deadline:
+    """ Deadline and cancellation token of a single computation.
+
+    Parameters
+    ----------
+    seconds : float = None
+        Time budget measured from the construction of the token. If None, the token expires only when cancelled.
+
+    Attributes
+    ----------
+    degraded : bool
+        Set by the algorithm if the token expired and a valid, but possibly larger, result was returned.
+
+    Notes
+    -----
+    The token may be cancelled from another thread, the computation notices it at the next check. Concurrent
+    phases of one computation share the token, a tick lost by a race only delays the next read of the clock.
+    """
+
+    def __init__(self, seconds: float = None):
+        self._end: float = None if seconds is None else time.monotonic() + seconds
+        self._cancelled: bool = False
+        self._ticks: int = 0
+        self.degraded: bool = False
+
+    def cancel(self):
+        """ Expires the token immediately. """
+        self._cancelled = True
+
+    def remaining(self) -> float:
+        """ Returns the remaining time in seconds, None if there is no time budget. """
+        if self._cancelled:
+            return 0.0
+        return None if self._end is None else max(0.0, self._end - time.monotonic())
+
+    def expired(self) -> bool:
+        """ Returns True if the token was cancelled or its time budget is exhausted. """
+        return self._cancelled or (self._end is not None and time.monotonic() >= self._end)
+
+    def check(self):
+        """ Raises deadline_exceeded_exception if the token expired. """
+        if self.expired():
+            raise Exceptions.deadline_exceeded_exception("The deadline of the computation has passed.")
+
+    def tick(self):
+        """ Cheap check to be called in each iteration of a long loop, reads the clock once per CHECK_INTERVAL calls.
+        """
+        self._ticks += 1
+        if self._ticks >= CHECK_INTERVAL:
+            self._ticks = 0
+            self.check()
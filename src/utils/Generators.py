@@ -0,0 +1,198 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Fast generators of random instances for benchmarks and load tests. Instances are produced directly
+as NumPy arrays, without creating NetworkX objects.
+
+A digraph D on vertices 0..n-1 is represented by arrays (tails, heads) of its arcs tails[i] -> heads[i].
+A bipartite instance is represented by (n, a, b), where A = {0, ..., n-1}, B = {n, ..., 2n-1} and
+(a[i], b[i]) are the edges of G. Each instance contains the perfect matching {i, n + i}, which is its known
+perfect matching; D of G with respect to this matching is exactly the D the instance was generated from.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, Set
+from src.utils.ArrayFunctions import simple_arcs, D_arcs_to_bipartite_edges
+
+
+def _rng(seed) -> np.random.Generator:
+    return np.random.default_rng(seed)
+
+
+def random_D_erdos_renyi(n: int, p: float = None, m: int = None, seed=None) -> (np.ndarray, np.ndarray):
+    """ Returns a random digraph on n vertices with arc probability p, or with approximately m arcs.
+
+    Notes
+    -----
+    The number of arcs is drawn from the binomial distribution and arcs are sampled uniformly.
+    Loops and parallel arcs are removed afterwards, so that sparse graphs are generated in O(m log m) time
+    instead of O(n^2). For dense graphs, the resulting number of arcs is slightly lower than expected.
+    """
+    rng = _rng(seed)
+    if m is None:
+        m = int(rng.binomial(n * (n - 1), p))
+    return simple_arcs(n, rng.integers(0, n, m), rng.integers(0, n, m))
+
+
+def _power_law_sample(rng: np.random.Generator, n: int, m: int, alpha: float) -> np.ndarray:
+    """ Samples m integers from 0..n-1, i with probability approximately proportional to (i + 1) ^ (-alpha).
+
+    Notes
+    -----
+    Uses the inverse of the distribution function of the continuous density x ^ (-alpha) on [1, n + 1),
+    which avoids a binary search over the cumulative weights for each sample.
+    """
+    u = rng.random(m)
+    if abs(alpha - 1) < 1e-9:
+        x = (n + 1.0) ** u
+    else:
+        x = (((n + 1.0) ** (1 - alpha) - 1) * u + 1) ** (1 / (1 - alpha))
+    return np.minimum(x.astype(np.int64) - 1, n - 1)
+
+
+def random_D_power_law(n: int, m: int, exponent: float = 2.5, seed=None) -> (np.ndarray, np.ndarray):
+    """ Returns a random digraph on n vertices with approximately m arcs and power-law degree distribution.
+
+    Notes
+    -----
+    Chung-Lu model: the endpoints of each arc are chosen independently, vertex i with probability approximately
+    proportional to (i + 1) ^ (-1 / (exponent - 1)), which yields expected degrees following a power law
+    with the given exponent.
+    Vertices are randomly permuted, so that the degree is not correlated with the label.
+    """
+    rng = _rng(seed)
+    permutation = rng.permutation(n)
+    tails = permutation[_power_law_sample(rng, n, m, 1 / (exponent - 1))]
+    heads = permutation[_power_law_sample(rng, n, m, 1 / (exponent - 1))]
+    return simple_arcs(n, tails, heads)
+
+
+def random_D_planted_sccs(n: int, num_of_components: int, inter_arcs: int, internal_arcs: int = 0,
+                          trivial_fraction: float = 0.5, seed=None) -> (np.ndarray, np.ndarray, np.ndarray):
+    """ Returns a random digraph with exactly num_of_components strong components.
+
+    Parameters
+    ----------
+    n : int
+        Number of vertices.
+    num_of_components : int
+        Number of strong components, round(trivial_fraction * num_of_components) of them are trivial.
+        Each non-trivial component has at least two vertices.
+    inter_arcs : int
+        Number of arcs sampled between components, they always go from a lower to a higher component,
+        so that the condensation is acyclic. Parallel arcs are removed.
+    internal_arcs : int
+        Number of additional arcs sampled inside non-trivial components, each of which
+        is made strongly connected by a Hamiltonian cycle.
+    trivial_fraction : float
+        Fraction of trivial components.
+
+    Returns
+    -------
+    (tails, heads, component)
+        Arcs of the digraph and the planted component of each vertex. Components are numbered in a topological order.
+    """
+    rng = _rng(seed)
+    num_of_trivial = int(round(trivial_fraction * num_of_components))
+    num_of_nontrivial = num_of_components - num_of_trivial
+    if num_of_trivial + 2 * num_of_nontrivial > n or (num_of_nontrivial == 0 and num_of_trivial != n):
+        raise ValueError("Components cannot be planted into {} vertices.".format(n))
+
+    sizes = np.ones(num_of_components, dtype=np.int64)
+    if num_of_nontrivial > 0:
+        nontrivial_sizes = 2 + rng.multinomial(n - num_of_trivial - 2 * num_of_nontrivial,
+                                               np.full(num_of_nontrivial, 1 / num_of_nontrivial))
+        sizes[rng.permutation(num_of_components)[:num_of_nontrivial]] = nontrivial_sizes
+    starts = np.zeros(num_of_components, dtype=np.int64)
+    np.cumsum(sizes[:-1], out=starts[1:])
+
+    vertices = rng.permutation(n)  # Vertices of component c are vertices[starts[c]:starts[c] + sizes[c]]
+    component = np.empty(n, dtype=np.int64)
+    component[vertices] = np.repeat(np.arange(num_of_components), sizes)
+
+    # Hamiltonian cycle of each non-trivial component, position i points to position i + 1 or to the start
+    positions = np.arange(n)
+    successors = positions + 1
+    ends = starts + sizes
+    successors[ends - 1] = starts
+    cycle = np.repeat(sizes > 1, sizes)
+    tails, heads = [vertices[positions[cycle]]], [vertices[successors[cycle]]]
+
+    nontrivial = np.flatnonzero(sizes > 1)
+    if internal_arcs > 0 and len(nontrivial) > 0:
+        chosen = nontrivial[rng.integers(0, len(nontrivial), internal_arcs)]
+        tails.append(vertices[starts[chosen] + rng.integers(0, sizes[chosen])])
+        heads.append(vertices[starts[chosen] + rng.integers(0, sizes[chosen])])
+
+    if inter_arcs > 0 and num_of_components > 1:
+        first = rng.integers(0, num_of_components, inter_arcs)
+        second = rng.integers(0, num_of_components, inter_arcs)
+        mask = first != second
+        lower, higher = np.minimum(first, second)[mask], np.maximum(first, second)[mask]
+        tails.append(vertices[starts[lower] + rng.integers(0, sizes[lower])])
+        heads.append(vertices[starts[higher] + rng.integers(0, sizes[higher])])
+
+    tails, heads = simple_arcs(n, np.concatenate(tails), np.concatenate(heads))
+    return tails, heads, component
+
+
+def gadget_family(num_of_gadgets: int) -> (int, np.ndarray, np.ndarray):
+    """ Returns the bipartite instance of Example.example1 with the given number of gadgets.
+
+    Notes
+    -----
+    The instance has 6 * num_of_gadgets + 3 vertices in each bipartition and its optimal augmenting set is of size 1,
+    which makes it suitable for checking the approximation of source_cover. Vertex s_k of the example is mapped to
+    k - 1 and t_j to 2 * num_of_gadgets + 1 + j, vertices s'_k and t'_j are their partners in B.
+    """
+    g: int = num_of_gadgets
+    n: int = 6 * g + 3
+    s = np.arange(2 * g + 2)  # s_1, ..., s_{2g+2}
+    t = np.arange(2 * g + 2, n)  # t_1, ..., t_{4g+1}
+    a, b = [np.arange(n)], [np.arange(n) + n]  # The perfect matching
+
+    odd, even = s[0::2], s[1::2]  # s_{2i-1}, s_{2i}
+    a += [even, odd, np.full(len(odd), t[0])]  # s_{2i} - s'_{2i-1}, s_{2i-1} - s'_{2i}, t_1 - s'_{2i-1}
+    b += [odd + n, even + n, odd + n]
+
+    i = np.arange(1, g + 1)
+    first = t[4 * i - 3]  # t_{4i-2}, gadget i consists of t_{4i-2}, ..., t_{4i+1}
+    a += [first, first + 1, first + 2, first + 3]  # Cross edges inside the gadget
+    b += [first + 1 + n, first + n, first + 3 + n, first + 2 + n]
+    a += [first + 1, first + 3]  # t_{4i-1} - s'_{2i+1}, t_{4i+1} - s'_{2i+2}
+    b += [s[2 * i] + n, s[2 * i + 1] + n]
+    return n, np.concatenate(a), np.concatenate(b)
+
+
+def D_arcs_to_bipartite(n: int, tails: np.ndarray, heads: np.ndarray) -> (int, np.ndarray, np.ndarray):
+    """ Returns the bipartite instance (n, a, b) whose D with respect to the matching {i, n + i} has the given arcs.
+
+    Notes
+    -----
+    The edges are given by ArrayFunctions.D_arcs_to_bipartite_edges, the arc u -> v corresponds to the edge
+    {v, n + u}.
+    """
+    a, b = D_arcs_to_bipartite_edges(n, tails, heads)
+    return n, a, b
+
+
+def bipartite_to_networkx(n: int, a: np.ndarray, b: np.ndarray) -> (nx.Graph, Set, Dict):
+    """ Returns (G, A, M) of the bipartite instance (n, a, b) for bipartite_matching_augmentation. """
+    G: nx.Graph = nx.Graph()
+    G.add_nodes_from(range(2 * n))
+    G.add_edges_from(zip(a.tolist(), b.tolist()))
+    M: Dict = {i: n + i for i in range(n)}
+    M.update({n + i: i for i in range(n)})
+    return G, set(range(n)), M
+
+
+def D_to_networkx(n: int, tails: np.ndarray, heads: np.ndarray) -> nx.DiGraph:
+    """ Returns the NetworkX DiGraph with vertices 0..n-1 and the given arcs. """
+    D: nx.DiGraph = nx.DiGraph()
+    D.add_nodes_from(range(n))
+    D.add_edges_from(zip(tails.tolist(), heads.tolist()))
+    return D
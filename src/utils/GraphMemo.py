@@ -0,0 +1,164 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: In-process memoization of the matching and the condensation of D across calls on the same graph.
+"""
+
+from __future__ import annotations
+
+import weakref
+import threading
+from src.utils.LazyImport import networkx as nx
+from collections import OrderedDict
+from typing import Dict, Set
+
+_VERSION_KEY = 'bipartite_matching_augmentation_version'
+
+
+class _Version:
+    """ A token identifying one structure version of a graph. """
+    __slots__ = ('__weakref__',)
+
+
+class GraphMemo:
+    """ A bounded in-memory cache of M and D_condensation, keyed by graph identity and structure version.
+
+    Parameters
+    ----------
+    max_graphs : int
+        Maximal number of graphs whose structures are kept, least recently used graphs are dropped first.
+    max_variants : int
+        Maximal number of different (A, M) pairs kept per graph.
+
+    Notes
+    -----
+    Graphs are referenced weakly, so memoized structures do not prevent a graph from being garbage-collected.
+    The structure version is a token stored in G.__networkx_cache__, which NetworkX clears on every mutation
+    through the Graph API (add_edge, remove_node, ...). A missing token thus means that G was mutated and
+    D_condensation is recomputed. A computed matching survives a mutation as long as all its edges
+    are still present and the vertex set is unchanged, which is the case after adding an augmenting set L.
+    Mutations that bypass the Graph API (e.g. writing to G._adj directly) are not detected.
+    For NetworkX versions without __networkx_cache__, the pair (|V|, |E|) is used as the version instead.
+    """
+
+    def __init__(self, max_graphs: int = 8, max_variants: int = 4):
+        self.max_graphs: int = max_graphs
+        self.max_variants: int = max_variants
+        self.hits: int = 0
+        self.misses: int = 0
+        self.invalidations: int = 0
+
+        self._lock = threading.RLock()
+        self._graphs: OrderedDict = OrderedDict()  # id(G) -> _GraphEntry, ordered from least recently used
+
+    def _version(self, G: nx.Graph):
+        cache = getattr(G, '__networkx_cache__', None)
+        if cache is None:  # Older NetworkX, fall back to a cheap structural signature
+            return G.number_of_nodes(), G.number_of_edges()
+        version = cache.get(_VERSION_KEY)
+        if version is None:
+            version = _Version()
+            cache[_VERSION_KEY] = version
+        return version
+
+    def _entry(self, G: nx.Graph) -> '_GraphEntry':
+        """ Returns the valid entry of G, creating or invalidating it if needed. """
+        key = id(G)
+        entry: _GraphEntry = self._graphs.get(key)
+        if entry is not None and entry.graph() is not G:  # A dead graph whose id was reused
+            entry = None
+        version = self._version(G)
+
+        if entry is None:
+            graph_key = key
+
+            def drop(_, memo=weakref.ref(self)):
+                memo = memo()
+                if memo is not None:
+                    with memo._lock:
+                        current = memo._graphs.get(graph_key)
+                        if current is not None and current.graph() is None:
+                            del memo._graphs[graph_key]
+
+            entry = _GraphEntry(weakref.ref(G, drop), version)
+            self._graphs[key] = entry
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+        elif entry.version != version:
+            self.invalidations += 1
+            entry.invalidate(version)
+
+        self._graphs.move_to_end(key)
+        return entry
+
+    def matching(self, G: nx.Graph, A: Set) -> Dict:
+        """ Returns a perfect matching of G, computed by eppstein_matching(G, A) only if not memoized. """
+        with self._lock:
+            entry = self._entry(G)
+            key = frozenset(A)
+            M = entry.matchings.get(key)
+            if M is not None and entry.matchings_checked.get(key) is not entry.version:
+                # G was mutated since M was computed, M is still valid if all its edges remain
+                if len(M) == G.number_of_nodes() and all(G.has_edge(u, M[u]) for u in M):
+                    entry.matchings_checked[key] = entry.version
+                else:
+                    M = None
+            if M is not None:
+                self.hits += 1
+                return M
+            self.misses += 1
+
+        M = nx.algorithms.bipartite.eppstein_matching(G, A)
+        with self._lock:
+            entry = self._entry(G)
+            entry.store(entry.matchings, key, M, self.max_variants)
+            entry.matchings_checked[key] = entry.version
+        return M
+
+    def structures(self, G: nx.Graph, A: Set, M: Dict, build):
+        """ Returns memoized structures for G, A and M, computed by build(G, A, M) if not memoized. """
+        key = (frozenset(A), frozenset(M.items()))
+        with self._lock:
+            entry = self._entry(G)
+            structures = entry.structures.get(key)
+            if structures is not None:
+                self.hits += 1
+                return structures
+            self.misses += 1
+
+        structures = build(G, A, M)
+        with self._lock:
+            entry = self._entry(G)
+            entry.store(entry.structures, key, structures, self.max_variants)
+        return structures
+
+    def clear(self):
+        """ Drops all memoized structures, the counters are kept. """
+        with self._lock:
+            self._graphs.clear()
+
+    def __len__(self) -> int:
+        return len(self._graphs)
+
+
+class _GraphEntry:
+    """ Memoized structures of a single graph. """
+
+    def __init__(self, graph: weakref.ref, version):
+        self.graph: weakref.ref = graph
+        self.version = version
+        self.matchings: OrderedDict = OrderedDict()  # frozenset(A) -> M
+        self.matchings_checked: Dict = {}  # frozenset(A) -> version in which M was verified
+        self.structures: OrderedDict = OrderedDict()  # (frozenset(A), frozenset(M)) -> D_condensation, not D
+
+    def invalidate(self, version):
+        self.version = version
+        self.structures.clear()  # D_condensation depends on all edges, matchings are verified lazily
+
+    @staticmethod
+    def store(table: OrderedDict, key, value, max_variants: int):
+        table[key] = value
+        table.move_to_end(key)
+        while len(table) > max_variants:
+            table.popitem(last=False)
@@ -0,0 +1,170 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Lightweight instrumentation of the algorithms. Phases are timed and counters recorded
+only while a Statistics collector is active, otherwise every call is a cheap no-op. If requested and tracemalloc
+is tracing, the memory allocated by each phase is recorded as well.
+"""
+
+import os
+import sys
+import time
+import threading
+import tracemalloc
+import contextvars
+from contextlib import contextmanager
+from typing import Dict, List
+
+_active = contextvars.ContextVar('active_statistics', default=None)
+
+
+class Statistics:
+    """ Collected statistics of one or more calls.
+
+    Attributes
+    ----------
+    timings : Dict[str, float]
+        Total wall time in seconds spent in each phase.
+    counters : Dict[str, int]
+        Values of counters, e.g. the number of arcs removed by a pre-pass.
+    events : List[(str, Dict)]
+        Recorded decisions, e.g. the chosen backend, in the order they were taken.
+    memory : Dict[str, Dict[str, int]]
+        Only if memory=True and tracemalloc is tracing. For each phase, 'peak' is the maximal number of bytes
+        allocated above the level at the start of the phase, 'retained' the number of bytes still allocated at
+        its end, and 'rss' the resident set size of the process at its end, or None if unknown.
+        A phase run repeatedly keeps the maximal peak and the total retained memory.
+    """
+
+    def __init__(self, memory: bool = False):
+        self.timings: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.events: List = []
+        self.memory: Dict[str, Dict[str, int]] = {}
+        self.track_memory: bool = memory
+        self._frames: List[List[int]] = []  # [allocated at the start, peak of finished nested phases] of open phases
+        self._lock = threading.Lock()  # Counters and events may be recorded by concurrent phases, see Concurrency
+
+
+@contextmanager
+def collect(statistics: Statistics = None):
+    """ Activates a collector for the enclosed block in the current thread or task and yields it. """
+    statistics = statistics if statistics is not None else Statistics()
+    token = _active.set(statistics)
+    try:
+        yield statistics
+    finally:
+        _active.reset(token)
+
+
+def active() -> Statistics:
+    """ Returns the active collector or None. """
+    return _active.get()
+
+
+@contextmanager
+def phase(name: str):
+    """ Times the enclosed block as phase name of the active collector. """
+    statistics = _active.get()
+    if statistics is None:
+        yield
+        return
+    tracked: bool = statistics.track_memory and tracemalloc.is_tracing()
+    if tracked:
+        _enter_memory_frame(statistics)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        with statistics._lock:
+            statistics.timings[name] = statistics.timings.get(name, 0.0) + time.perf_counter() - start
+        if tracked:
+            _exit_memory_frame(statistics, name)
+
+
+def _enter_memory_frame(statistics: Statistics):
+    current, peak = tracemalloc.get_traced_memory()
+    if statistics._frames:  # The peak of the enclosing phase so far is kept in its frame before the reset
+        statistics._frames[-1][1] = max(statistics._frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    statistics._frames.append([current, current])
+
+
+def _exit_memory_frame(statistics: Statistics, name: str):
+    current, peak = tracemalloc.get_traced_memory()
+    start, nested_peak = statistics._frames.pop()
+    peak = max(peak, nested_peak)
+    if statistics._frames:
+        statistics._frames[-1][1] = max(statistics._frames[-1][1], peak)
+    record = statistics.memory.setdefault(name, {'peak': 0, 'retained': 0, 'rss': None})
+    record['peak'] = max(record['peak'], peak - start)
+    record['retained'] += current - start
+    record['rss'] = resident_memory()
+
+
+def increment(name: str, value: int = 1):
+    """ Increments counter name of the active collector by value. """
+    statistics = _active.get()
+    if statistics is not None:
+        with statistics._lock:
+            statistics.counters[name] = statistics.counters.get(name, 0) + value
+
+
+def event(name: str, **details):
+    """ Records a decision of the algorithm in the active collector. """
+    statistics = _active.get()
+    if statistics is not None:
+        with statistics._lock:
+            statistics.events.append((name, details))
+
+
+def resident_memory() -> int:
+    """ Returns the current resident set size of the process in bytes, or None if it cannot be determined. """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # Only the peak is available, in kB on Linux
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+class ResidentMemorySampler:
+    """ Context manager sampling the resident set size in a background thread, the maximum is kept in peak.
+
+    Parameters
+    ----------
+    interval : float = 0.005
+        Time between two samples in seconds.
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval: float = interval
+        self.peak: int = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread = None
+
+    def _sample(self):
+        rss = resident_memory()
+        if rss is not None:
+            self.peak = rss if self.peak is None else max(self.peak, rss)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self) -> 'ResidentMemorySampler':
+        self._sample()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exception):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
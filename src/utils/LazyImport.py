@@ -0,0 +1,68 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Deferred import of NetworkX. Importing NetworkX takes a large part of the startup time of a worker
+process, while the array-based code never needs it. Modules refer to NetworkX through the lazy module below,
+which imports NetworkX on the first access of one of its attributes.
+"""
+
+import sys
+import types
+import functools
+import importlib
+import threading
+
+
+class _LazyModule(types.ModuleType):
+    """ A stand-in for a module that is imported on the first access of one of its attributes.
+
+    Notes
+    -----
+    After the import, the attributes of the module are copied to the stand-in, so that later accesses
+    do not pass through __getattr__. Attributes defined by the module later are still found by __getattr__.
+    The stand-in is not registered in sys.modules, so that 'networkx' in sys.modules tells whether NetworkX
+    has actually been imported.
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__['_lock'] = threading.Lock()
+        self.__dict__['_module'] = None
+
+    def _load(self) -> types.ModuleType:
+        with self._lock:
+            if self._module is None:
+                module = importlib.import_module(self.__name__)
+                self.__dict__.update(module.__dict__)
+                self.__dict__['_module'] = module
+        return self._module
+
+    def __getattr__(self, attribute: str):
+        return getattr(self._load(), attribute)
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """ Returns the module of the given name if it is already imported, otherwise a stand-in importing it lazily. """
+    module = sys.modules.get(name)
+    return module if module is not None else _LazyModule(name)
+
+
+def not_implemented_for(*graph_types: str):
+    """ Lazy counterpart of networkx.utils.decorators.not_implemented_for, which imports NetworkX on the first call.
+    """
+    def decorator(function):
+        decorated = None
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            nonlocal decorated
+            if decorated is None:
+                from networkx.utils.decorators import not_implemented_for as networkx_not_implemented_for
+                decorated = networkx_not_implemented_for(*graph_types)(function)
+            return decorated(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+networkx = lazy_import('networkx')
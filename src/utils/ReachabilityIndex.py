@@ -0,0 +1,251 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: A reachability index of a directed acyclic graph, built once and shared by all phases
+of the bipartite matching augmentation that traverse the condensation.
+"""
+
+from __future__ import annotations
+
+import threading
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, Iterable, List, Set
+from src.utils.Deadline import Deadline
+
+_labels_lock = threading.Lock()
+
+
+class ReachabilityIndex:
+    """ Reachability index of a directed acyclic graph.
+
+    Parameters
+    ----------
+    D : NetworkX DiGraph
+        A directed acyclic graph, typically a condensation.
+
+    Notes
+    -----
+    Vertices are renumbered by their position in a topological order and the adjacency is stored as lists
+    of positions, so that traversals run on plain integers instead of NetworkX adjacency views. This is all
+    that set queries (reachable_from) gain from the index, they are plain searches on these lists.
+    Each vertex u also has an interval label [low[u], post[u]] of a DFS spanning forest, used by single-pair
+    queries (reaches) and by reduce_transitive_arcs. If post[v] lies in the interval of u, v is reachable from u,
+    which answers most single-pair queries without a search. Otherwise, v is reachable only through a non-tree
+    arc, and the search is pruned by the topological position. The labels of each direction are computed
+    on their first use, as set queries, which are all the pipeline needs by default, do not read them.
+
+    The reversed index, obtained by reverse(), shares all arrays, including the labels, with the original one.
+    Queries only read the index, so that an index and its reversed index can be traversed by concurrent threads.
+    """
+
+    def __init__(self, D: nx.DiGraph = None):
+        if D is None:  # Used by reverse()
+            return
+        order: List = list(nx.topological_sort(D))
+        position: Dict = {vertex: i for i, vertex in enumerate(order)}
+
+        self.labels: List = order  # Vertex at each topological position
+        self.position: Dict = position
+        self.successors: List[List[int]] = [[position[w] for w in D.successors(v)] for v in order]
+        self.predecessors: List[List[int]] = [[position[w] for w in D.predecessors(v)] for v in order]
+        self.is_reversed: bool = False
+        self._intervals: List = [None, None]  # (low, post) of the forward and of the reversed DFS forest
+
+    @staticmethod
+    def _interval_labels(successors: List[List[int]], roots: Iterable[int]) -> (List[int], List[int]):
+        """ Returns post-order numbers and the minimal post-order number in the subtree of a DFS spanning forest. """
+        k: int = len(successors)
+        low: List[int] = [0] * k
+        post: List[int] = [-1] * k
+        visited = bytearray(k)
+        counter: int = 0
+        for root in roots:
+            if visited[root]:
+                continue
+            visited[root] = 1
+            low[root] = counter
+            stack = [(root, iter(successors[root]))]
+            while stack:
+                vertex, neighbors = stack[-1]
+                for neighbor in neighbors:
+                    if not visited[neighbor]:
+                        visited[neighbor] = 1
+                        low[neighbor] = counter
+                        stack.append((neighbor, iter(successors[neighbor])))
+                        break
+                else:
+                    stack.pop()
+                    post[vertex] = counter
+                    counter += 1
+        return low, post
+
+    def _labels(self, reversed_direction: bool) -> (List[int], List[int]):
+        """ Returns the interval labels (low, post) of the forward or of the reversed graph, computing them
+        on the first call. """
+        intervals = self._intervals
+        if intervals[reversed_direction] is None:
+            with _labels_lock:  # The index may be shared by concurrent calls, e.g. through GraphMemo
+                if intervals[reversed_direction] is None:
+                    successors = self.predecessors if reversed_direction != self.is_reversed else self.successors
+                    k: int = len(self.labels)  # Roots in the topological order of the direction
+                    roots = range(k - 1, -1, -1) if reversed_direction else range(k)
+                    intervals[reversed_direction] = self._interval_labels(successors, roots)
+        return intervals[reversed_direction]
+
+    def reverse(self) -> 'ReachabilityIndex':
+        """ Returns the index of the reversed graph, sharing the data with this index. """
+        reversed_index = ReachabilityIndex()
+        reversed_index.labels = self.labels
+        reversed_index.position = self.position
+        reversed_index.successors = self.predecessors
+        reversed_index.predecessors = self.successors
+        reversed_index.is_reversed = not self.is_reversed
+        reversed_index._intervals = self._intervals
+        return reversed_index
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def num_of_arcs(self) -> int:
+        """ Returns the number of arcs currently stored in the index. """
+        return sum(map(len, self.successors))
+
+    def reduce_transitive_arcs(self) -> int:
+        """ Removes arcs implied by other paths, keeping the reachability, returns the number of removed arcs.
+
+        Notes
+        -----
+        The arc u -> w is removed if w is reachable from another successor v of u, which is detected
+        either by the interval labels (w lies in the DFS subtree of v) or by a path u -> v -> w of length two.
+        The interval labels are laminar, so the first test is a sweep over the successors of u sorted by low.
+        This is a cheap approximation of the transitive reduction; every removed arc is redundant in the original
+        graph, hence in a DAG, removing all of them preserves reachability and thus sources, sinks and isolated
+        vertices. The interval labels stay valid as they only certify reachability.
+        """
+        successors, predecessors = self.successors, self.predecessors
+        low, post = self._labels(False)
+        if self.is_reversed:  # Labels are kept for the forward direction
+            successors, predecessors = predecessors, successors
+
+        removed: int = 0
+        for u in range(len(successors)):
+            if len(successors[u]) <= 1:
+                continue
+            redundant: Set[int] = set()
+            max_post: int = -1
+            for w in sorted(successors[u], key=lambda v: (low[v], -post[v])):
+                if max_post >= post[w]:  # Interval of an earlier successor contains w
+                    redundant.add(w)
+                max_post = max(max_post, post[w])
+
+            for v in successors[u]:
+                if v not in redundant:
+                    redundant.update(successors[v])
+
+            kept = [w for w in successors[u] if w not in redundant]
+            if len(kept) < len(successors[u]):
+                removed += len(successors[u]) - len(kept)
+                for w in successors[u]:
+                    if w in redundant:
+                        predecessors[w].remove(u)
+                successors[u] = kept
+
+        return removed
+
+    def to_csr(self) -> (np.ndarray, np.ndarray):
+        """ Returns CSR arrays (indptr, indices) of the stored arcs over topological positions, in the direction
+        of this index. """
+        indptr = np.zeros(len(self.successors) + 1, dtype=np.int64)
+        np.cumsum(np.fromiter(map(len, self.successors), dtype=np.int64, count=len(self.successors)), out=indptr[1:])
+        indices = np.fromiter((q for successors in self.successors for q in successors), dtype=np.int64,
+                              count=indptr[-1])
+        return indptr, indices
+
+    def induced_subgraph(self, vertices: Set) -> nx.DiGraph:
+        """ Returns a NetworkX DiGraph induced by vertices on the stored arcs, in the direction of this index. """
+        labels = self.labels
+        subgraph: nx.DiGraph = nx.DiGraph()
+        subgraph.add_nodes_from(vertices)
+        subgraph.add_edges_from((vertex, labels[q]) for vertex in vertices
+                                for q in self.successors[self.position[vertex]] if labels[q] in vertices)
+        return subgraph
+
+    def mask(self, vertices: Iterable) -> bytearray:
+        """ Returns a mask over topological positions of the given vertices, usable as blocked. """
+        mask = bytearray(len(self.labels))
+        for vertex in vertices:
+            mask[self.position[vertex]] = 1
+        return mask
+
+    def reachable_from(self, vertices: Iterable, blocked: bytearray = None, strict: bool = False,
+                       deadline: Deadline = None) -> Set:
+        """ Returns the set of vertices reachable from any of the given vertices.
+
+        Parameters
+        ----------
+        vertices : Iterable
+            Starting vertices.
+        blocked : bytearray = None
+            Mask created by mask(), blocked vertices are neither reported nor traversed, unless they are starting.
+        strict : bool = False
+            If True, only vertices reachable by a path of at least one arc are reported.
+        deadline : Deadline = None
+            If given, the search raises deadline_exceeded_exception once the deadline expires.
+
+        Notes
+        -----
+        A depth-first search on the adjacency lists of positions, the interval labels are not used. Each reached
+        vertex has to be reported and its arcs scanned anyway, and a blocked vertex inside a DFS subtree would
+        make the intervals report vertices that are not reachable.
+        """
+        successors = self.successors
+        visited: Set[int] = set()  # Proportional to the explored part, many searches explore only a few vertices
+        stack: List[int] = []
+        for vertex in vertices:
+            p = self.position[vertex]
+            if strict:
+                stack.extend(successors[p])
+            elif p not in visited:
+                visited.add(p)
+                stack.append(p)
+
+        if strict:  # Starting positions are reported only if reached by an arc
+            stack = [p for p in stack if blocked is None or not blocked[p]]
+            visited.update(stack)
+
+        while stack:
+            p = stack.pop()
+            if deadline is not None:
+                deadline.tick()
+            for q in successors[p]:
+                if q not in visited and (blocked is None or not blocked[q]):
+                    visited.add(q)
+                    stack.append(q)
+
+        labels = self.labels
+        return {labels[p] for p in visited}
+
+    def reaches(self, u, v) -> bool:
+        """ Returns True iff there is a directed path from u to v. """
+        pu, pv = self.position[u], self.position[v]
+        low, post = self._labels(self.is_reversed)
+        if low[pu] <= post[pv] <= post[pu]:  # v lies in the DFS subtree of u
+            return True
+        if (pv < pu) != self.is_reversed or pu == pv:  # Topological order excludes the path
+            return pu == pv
+
+        successors = self.successors
+        visited = {pu}
+        stack = [pu]
+        while stack:
+            p = stack.pop()
+            for q in successors[p]:
+                if q in visited or ((q > pv) != self.is_reversed and q != pv):
+                    continue  # Vertices behind v in the topological order cannot reach v
+                if low[q] <= post[pv] <= post[q]:
+                    return True
+                visited.add(q)
+                stack.append(q)
+        return False
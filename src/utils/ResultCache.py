@@ -0,0 +1,242 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: A persistent on-disk cache of augmenting sets keyed by a canonical fingerprint of the instance.
+"""
+
+from __future__ import annotations
+
+import os
+import ast
+import json
+import zlib
+import hashlib
+import threading
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from collections import OrderedDict
+from typing import Dict, Set
+
+_HASH_BITS = 128
+_HASH_MASK = (1 << _HASH_BITS) - 1
+_FILE_SUFFIX = '.bin'
+_MAGIC = b'BMAL1'  # Format and version of an entry
+_INTEGERS, _LITERALS = b'i', b'r'  # Kinds of the payload of an entry
+# Errors of reading an entry removed, truncated, corrupted or written by a different version, counted as a miss
+_UNREADABLE = (OSError, EOFError, ValueError, TypeError, AttributeError, SyntaxError, MemoryError, RecursionError,
+               zlib.error)
+
+
+def _encode(L: Set):
+    """ Returns the bytes of an entry storing L, or None if a vertex of L cannot be stored.
+
+    Notes
+    -----
+    An entry consists of _MAGIC, the kind of the payload and the zlib compressed payload. If all vertices are
+    integers fitting 64 bits, the payload is the packed array a_1, b_1, a_2, b_2, ... of the edges (a_i, b_i).
+    Otherwise it is a JSON list of the reprs of the vertices, which are read back by ast.literal_eval, so only
+    vertices built from literals (numbers, strings, tuples, ...) are stored. Unlike a pickle, reading an entry
+    never executes code, so the directory may be shared.
+    """
+    vertices = [vertex for edge in L for vertex in edge]
+    if all(type(vertex) is int and -2 ** 63 <= vertex < 2 ** 63 for vertex in vertices):
+        return _MAGIC + _INTEGERS + zlib.compress(np.asarray(vertices, dtype='<i8').tobytes())
+    literals = [repr(vertex) for vertex in vertices]
+    try:
+        if any(ast.literal_eval(literal) != vertex for literal, vertex in zip(literals, vertices)):
+            return None
+    except _UNREADABLE:
+        return None
+    return _MAGIC + _LITERALS + zlib.compress(json.dumps(literals).encode())
+
+
+def _decode(data: bytes) -> Set:
+    """ Returns L stored in an entry by _encode, raises one of _UNREADABLE if the entry is not valid. """
+    if not data.startswith(_MAGIC):
+        raise ValueError('Not an entry of ResultCache.')
+    kind, payload = data[len(_MAGIC):len(_MAGIC) + 1], zlib.decompress(data[len(_MAGIC) + 1:])
+    if kind == _INTEGERS:
+        vertices = np.frombuffer(payload, dtype='<i8').tolist()
+    elif kind == _LITERALS:
+        vertices = [ast.literal_eval(literal) for literal in json.loads(payload.decode())]
+    else:
+        raise ValueError('Unknown kind of entry {!r}.'.format(kind))
+    if len(vertices) % 2 != 0:
+        raise ValueError('Truncated entry.')
+    return set(zip(vertices[0::2], vertices[1::2]))
+
+
+def _element_hash(element) -> int:
+    """ Returns a stable (not randomized between processes) 128-bit hash of a hashable element. """
+    return int.from_bytes(hashlib.blake2b(repr(element).encode(), digest_size=_HASH_BITS // 8).digest(), 'little')
+
+
+def instance_fingerprint(G: nx.Graph, A: Set, M: Dict = None) -> str:
+    """ Returns a fingerprint of the instance (G, A, M) that does not depend on the order of vertices or edges.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph.
+    A : Set
+        A bipartition of G.
+    M : Dict = None
+        A perfect bipartite matching of G or None.
+
+    Returns
+    -------
+    str
+        A hexadecimal digest identifying (G, A, M).
+
+    Notes
+    -----
+    Each element is hashed separately and the hashes are summed modulo 2^128, which makes the fingerprint
+    independent of the iteration order. Edges are oriented from A to B before hashing, so that (u, v) and (v, u)
+    yield the same hash. The whole computation is linear in |V| + |E|, which is cheaper than computing a matching.
+    """
+    nodes_sum: int = 0
+    for vertex in G.nodes:
+        nodes_sum = (nodes_sum + _element_hash((vertex in A, vertex))) & _HASH_MASK
+
+    edges_sum: int = 0
+    for u, v in G.edges:
+        if v in A:  # Orient the edge from A to B
+            u, v = v, u
+        edges_sum = (edges_sum + _element_hash((u, v))) & _HASH_MASK
+
+    matching_sum: int = 0
+    if M is not None:
+        for u in M:
+            if u in A:
+                matching_sum = (matching_sum + _element_hash((u, M[u]))) & _HASH_MASK
+
+    digest = hashlib.blake2b(digest_size=_HASH_BITS // 8)
+    digest.update(repr((G.number_of_nodes(), G.number_of_edges(), M is None)).encode())
+    for value in (nodes_sum, edges_sum, matching_sum):
+        digest.update(value.to_bytes(_HASH_BITS // 8, 'little'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """ An on-disk least-recently-used cache of augmenting sets.
+
+    Parameters
+    ----------
+    directory : str
+        Directory where the entries are stored, created if it does not exist.
+        Entries already present in the directory are reused.
+    max_bytes : int
+        Maximal total size of the entries in the directory. When exceeded, least recently used entries are evicted.
+
+    Notes
+    -----
+    Each entry is stored in its own file in a compact binary form, see _encode. Sets with vertices that
+    cannot be stored in it are not cached.
+    The recency of an entry is kept in the modification time of its file, so that the LRU order
+    survives between processes. The directory may be shared by several processes: get reads the file of the key
+    whether or not this process has seen it, and put rescans the directory before evicting, so that the size cap
+    counts the entries of all processes. An entry evicted by another process is a miss.
+    Counters hits, misses and evictions are exposed as attributes.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 256 * 1024 * 1024):
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()  # Key -> size in bytes, ordered from least recently used
+        self._total_bytes: int = 0
+
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self._scan()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _FILE_SUFFIX)
+
+    def _scan(self):
+        """ Rebuilds the index of the entries from the directory, called with the lock held.
+        Modification times may be coarser than the accesses, ties keep the order of the previous index. """
+        rank: Dict[str, int] = {key: i for i, key in enumerate(self._entries)}
+        existing = []
+        for name in os.listdir(self.directory):
+            if name.endswith(_FILE_SUFFIX):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except OSError:  # Evicted by another process meanwhile
+                    continue
+                key = name[:-len(_FILE_SUFFIX)]
+                existing.append((stat.st_mtime_ns, rank.get(key, -1), key, stat.st_size))
+        self._entries = OrderedDict((key, size) for _, _, key, size in sorted(existing))
+        self._total_bytes = sum(self._entries.values())
+
+    def get(self, key: str):
+        """ Returns the stored augmenting set for key, or None if the key is not cached. """
+        with self._lock:
+            try:
+                with open(self._path(key), 'rb') as file:
+                    data = file.read()
+                L: Set = _decode(data)
+                os.utime(self._path(key))  # Mark as recently used also for other processes
+            except _UNREADABLE:  # Not cached, or removed or corrupted by someone else
+                self._total_bytes -= self._entries.pop(key, 0)
+                self.misses += 1
+                return None
+            self._total_bytes += len(data) - self._entries.pop(key, 0)  # Possibly written by another process
+            self._entries[key] = len(data)
+            self.hits += 1
+            return L
+
+    def put(self, key: str, L: Set):
+        """ Stores the augmenting set L under key and evicts least recently used entries if needed. """
+        data = _encode(L)
+        if data is None:  # A vertex cannot be stored without pickling
+            return
+        with self._lock:
+            temporary_path = '{}.{}.tmp'.format(self._path(key), os.getpid())  # Unique among processes
+            with open(temporary_path, 'wb') as file:
+                file.write(data)
+            os.replace(temporary_path, self._path(key))  # Atomic, readers never see a partial entry
+
+            self._entries.pop(key, None)
+            self._entries[key] = len(data)  # The most recently used one
+            self._scan()
+            while self._total_bytes > self.max_bytes and len(self._entries) > 1:
+                evicted, size = self._entries.popitem(last=False)
+                self._total_bytes -= size
+                self.evictions += 1
+                try:
+                    os.remove(self._path(evicted))
+                except OSError:
+                    pass
+
+    def clear(self):
+        """ Removes all entries from the cache, the counters are kept. """
+        with self._lock:
+            self._scan()
+            for key in self._entries:
+                try:
+                    os.remove(self._path(key))
+                except OSError:
+                    pass
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._scan()
+            return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isfile(self._path(key))
+
+    @property
+    def size_bytes(self) -> int:
+        """ Total size of the entries in the directory in bytes. """
+        with self._lock:
+            self._scan()
+            return self._total_bytes
@@ -0,0 +1,177 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: Validation of the input of the bipartite matching augmentation. A and M are converted to arrays
+over the CSR representation of G and all conditions are checked by vectorized operations, all problems found
+are reported together with examples of the offending vertices and edges.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from src.utils.LazyImport import networkx as nx
+from typing import Dict, List, Set
+from src.utils.ArrayFunctions import graph_to_csr, edges_to_csr
+from src.utils.Instrumentation import phase
+from src.exceptions import Exceptions
+
+MAX_EXAMPLES: int = 5  # Number of offending vertices or edges listed for each problem
+
+
+def _problem(count: int, description: str, items: List) -> str:
+    """ Returns a report of count offending items, of which the first MAX_EXAMPLES are listed. """
+    text = ', '.join(map(repr, items[:MAX_EXAMPLES]))
+    return '{} {}: {}'.format(count, description, text + (', ...' if count > MAX_EXAMPLES else ''))
+
+
+def validate_arrays(labels, indptr: np.ndarray, indices: np.ndarray, in_A: np.ndarray,
+                    mate: np.ndarray = None) -> List[str]:
+    """ Returns the list of problems of a bipartite instance given by arrays, empty if the instance is valid.
+
+    Parameters
+    ----------
+    labels : Sequence
+        Label of each vertex 0..n-1, used in the reports.
+    indptr, indices : np.ndarray
+        Symmetric CSR arrays of G on vertices 0..n-1.
+    in_A : np.ndarray
+        Boolean mask of the bipartition A.
+    mate : np.ndarray = None
+        Array of mates of the matching M, -1 for vertices without a mate. Not checked if None.
+
+    Notes
+    -----
+    Checks that G has at least 4 vertices, that A is a half of them, that no edge joins two vertices of the same
+    side and, if mate is given, that M is a perfect matching consisting of edges of G. Each check is a constant
+    number of passes over the arrays.
+    """
+    n: int = len(indptr) - 1
+    problems: List[str] = []
+    if n < 4:
+        problems.append('|A + B| = {} < 4, G cannot be augmented'.format(n))
+    size_of_A: int = int(np.count_nonzero(in_A))
+    if 2 * size_of_A != n:
+        problems.append('|A| = {} is not |A + B| / 2 = {}'.format(size_of_A, n / 2))
+
+    tails = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+    wrong = np.flatnonzero((tails < indices) & (in_A[tails] == in_A[indices]))  # Each edge once
+    if len(wrong) > 0:
+        problems.append(_problem(len(wrong), 'edges do not join A and B',
+                                 [(labels[tails[i]], labels[indices[i]]) for i in wrong[:MAX_EXAMPLES].tolist()]))
+    loops = np.flatnonzero(tails == indices)
+    if len(loops) > 0:
+        problems.append(_problem(len(loops), 'vertices have a loop',
+                                 [labels[tails[i]] for i in loops[:MAX_EXAMPLES].tolist()]))
+
+    if mate is None:
+        return problems
+    unmatched = np.flatnonzero(mate < 0)
+    if len(unmatched) > 0:
+        problems.append(_problem(len(unmatched), 'vertices are not matched by M',
+                                 [labels[v] for v in unmatched[:MAX_EXAMPLES].tolist()]))
+    vertices = np.flatnonzero(mate >= 0)
+    partners = mate[vertices]
+    asymmetric = vertices[mate[partners] != vertices]
+    if len(asymmetric) > 0:
+        problems.append(_problem(len(asymmetric), 'vertices v have M[M[v]] != v',
+                                 [labels[v] for v in asymmetric[:MAX_EXAMPLES].tolist()]))
+    once = (vertices <= partners) | (mate[partners] != vertices)  # Each matched edge is reported once
+    same_side = vertices[once & (in_A[vertices] == in_A[partners])]
+    if len(same_side) > 0:
+        problems.append(_problem(len(same_side), 'edges of M do not join A and B',
+                                 [(labels[v], labels[mate[v]]) for v in same_side[:MAX_EXAMPLES].tolist()]))
+    has_matched_edge = np.zeros(n, dtype=bool)
+    has_matched_edge[tails[indices == mate[tails]]] = True
+    missing = vertices[once & ~has_matched_edge[vertices]]
+    if len(missing) > 0:
+        problems.append(_problem(len(missing), 'edges of M are not edges of G',
+                                 [(labels[v], labels[mate[v]]) for v in missing[:MAX_EXAMPLES].tolist()]))
+    return problems
+
+
+def validate_instance(G: nx.Graph, A: Set, M: Dict = None, csr: tuple = None) -> (np.ndarray, np.ndarray):
+    """ Checks that (G, A, M) is a valid input of bipartite_matching_augmentation.
+
+    Parameters
+    ----------
+    G : NetworkX Graph
+       A bipartite graph G = (A + B, E) with |A + B| >= 4.
+    A : Set
+        A bipartition of G, where |A| = |A + B| / 2
+    M: Dict = None
+        A perfect bipartite matching of G, for each edge {a, b} in M holds M[a] = b, M[b] = a. Not checked if None.
+    csr : tuple = None
+        (labels, index, indptr, indices) of G as returned by graph_to_csr, computed if None.
+
+    Returns
+    -------
+    (in_A, mate) : (np.ndarray, np.ndarray)
+        Boolean mask of A and the array of mates of M over the labels of csr, mate is None if M is None.
+
+    Raises
+    ------
+    invalid_instance_exception
+        If any of the conditions does not hold, its attribute problems lists all problems found.
+
+    Notes
+    -----
+    Vertices of A or M that are not vertices of G are reported as well. Most of the cost is the conversion of G
+    to CSR arrays, the array backend passes its own conversion and reuses the returned arrays.
+    """
+    with phase('validation'):
+        labels, index, indptr, indices = csr if csr is not None else graph_to_csr(G)
+        problems: List[str] = []
+        foreign = [vertex for vertex in A if vertex not in index]
+        if foreign:
+            problems.append(_problem(len(foreign), 'vertices of A are not in G', foreign))
+        in_A = np.fromiter((vertex in A for vertex in labels), dtype=bool, count=len(labels))
+
+        mate = None
+        if M is not None:
+            foreign = [vertex for vertex, partner in M.items() if vertex not in index or partner not in index]
+            if foreign:
+                problems.append(_problem(len(foreign), 'vertices of M are not in G or matched outside of G',
+                                         foreign))
+            mate = np.fromiter((index.get(M[vertex], -1) if vertex in M else -1 for vertex in labels),
+                               dtype=np.int64, count=len(labels))
+        problems.extend(validate_arrays(labels, indptr, indices, in_A, mate))
+    if problems:
+        raise Exceptions.invalid_instance_exception(problems)
+    return in_A, mate
+
+
+def validate_bipartite_arrays(n: int, a: np.ndarray, b: np.ndarray, mate: np.ndarray = None):
+    """ Checks that a bipartite instance (n, a, b) with the matching mate is a valid input of augment_arrays.
+
+    Raises
+    ------
+    invalid_instance_exception
+        If an edge does not join A = 0..n-1 and B = n..2n-1, mate is not a perfect matching of G
+        or n < 2, its attribute problems lists all problems found.
+    """
+    with phase('validation'):
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        outside = np.flatnonzero((a < 0) | (a >= n) | (b < n) | (b >= 2 * n))
+        if len(outside) > 0:
+            raise Exceptions.invalid_instance_exception([_problem(
+                len(outside), 'edges do not join A = 0..n-1 and B = n..2n-1',
+                list(zip(a[outside[:MAX_EXAMPLES]].tolist(), b[outside[:MAX_EXAMPLES]].tolist())))])
+        indptr, indices = edges_to_csr(2 * n, np.concatenate((a, b)), np.concatenate((b, a)))
+        full_mate = None
+        problems: List[str] = []
+        if mate is not None:
+            mate = np.asarray(mate, dtype=np.int64)
+            outside = np.flatnonzero((mate < n) | (mate >= 2 * n))
+            if len(mate) != n:
+                problems.append('mate has length {} instead of n = {}'.format(len(mate), n))
+            elif len(outside) > 0:
+                problems.append(_problem(len(outside), 'vertices of A are not matched to B',
+                                         [(v, int(mate[v])) for v in outside[:MAX_EXAMPLES].tolist()]))
+            else:
+                full_mate = np.full(2 * n, -1, dtype=np.int64)
+                full_mate[:n] = mate
+                full_mate[mate] = np.arange(n, dtype=np.int64)  # A vertex of B matched twice keeps one mate
+        problems.extend(validate_arrays(range(2 * n), indptr, indices, np.arange(2 * n) < n, full_mate))
+    if problems:
+        raise Exceptions.invalid_instance_exception(problems)
@@ -0,0 +1,90 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the array backend and the backend selection
+"""
+
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.ArrayBackend import array_matching_augmentation
+from src.algo.EswaranTarjan import eswaran_tarjan
+from src.algo.SourceCover import source_cover
+from src.utils.Generators import random_D_erdos_renyi, random_D_power_law, random_D_planted_sccs, gadget_family, \
+    D_arcs_to_bipartite, bipartite_to_networkx, D_to_networkx
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.utils.Instrumentation import collect
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_set_equal, assert_raises
+
+
+def is_strongly_connected_with(G: nx.DiGraph, A: set) -> bool:
+    H: nx.DiGraph = G.copy()
+    H.add_edges_from(A)
+    return nx.is_strongly_connected(H)
+
+
+class TestArrayBackend:
+
+    def test_simple(self):
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        assert_set_equal(array_matching_augmentation(G, {0, 2}), {(0, 3), (2, 1)})
+        G.add_edges_from({(0, 3), (2, 1)})
+        assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, backend='array'), set())
+
+    def test_same_size_as_networkx(self):
+        # Both backends follow the same algorithm, hence given the same matching, the sizes of L agree
+        instances = [random_D_erdos_renyi(500, m=600, seed=1), random_D_power_law(500, 1000, seed=2),
+                     random_D_planted_sccs(500, 120, 2000, internal_arcs=500, seed=3)[:2]]
+        for tails, heads in instances:
+            G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(500, tails, heads))
+            L = bipartite_matching_augmentation(G, A, M, backend='array')
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(len(L), len(bipartite_matching_augmentation(G, A, M, backend='networkx')))
+            assert_true(is_correctly_augmented(G, A, array_matching_augmentation(G, A)))  # Own matching
+
+    def test_labels(self):
+        # Arbitrary hashable labels, the tree has the optimal augmenting set of size max(s, t) + q
+        D = nx.balanced_tree(2, 7, nx.DiGraph())
+        D.remove_node(0)
+        G, A, M = D_to_bipartite(D)
+        G = nx.relabel_nodes(G, lambda v: 'v' + str(v))
+        A = {'v' + str(v) for v in A}
+        M = {'v' + str(u): 'v' + str(v) for u, v in M.items()}
+        L = bipartite_matching_augmentation(G, A, M, backend='array')
+        assert_true(is_correctly_augmented(G, A, L))
+        assert_equal(len(L), 128)
+        n, a, b = gadget_family(100)
+        G, A, M = bipartite_to_networkx(n, a, b)
+        assert_equal(len(bipartite_matching_augmentation(G, A, M, backend='array')), 1)
+
+    def test_eswaran_tarjan(self):
+        for seed in range(3):
+            D = D_to_networkx(300, *random_D_erdos_renyi(300, m=350, seed=seed))
+            A = eswaran_tarjan(D, backend='array')
+            assert_true(is_strongly_connected_with(D, A))
+            assert_equal(len(A), len(eswaran_tarjan(D, backend='networkx')))
+        assert_set_equal(eswaran_tarjan(nx.path_graph(3, nx.DiGraph()), backend='array'), {(2, 0)})
+        assert_set_equal(eswaran_tarjan(nx.DiGraph(), backend='array'), set())
+
+    def test_source_cover(self):
+        for seed in range(3):
+            C = nx.condensation(D_to_networkx(300, *random_D_erdos_renyi(300, m=350, seed=seed)))
+            X = {c for c in C if len(C.nodes[c]['members']) == 1}
+            cover = source_cover(C, X, backend='array')
+            assert_true(X <= set(cover).union(*(nx.descendants(C, c) for c in cover)))
+            assert_true(all(C.in_degree(c) == 0 for c in cover))
+
+    def test_selection(self):
+        # The automatic choice depends on the size and is recorded, unknown backends are rejected
+        small = D_to_networkx(20, *random_D_erdos_renyi(20, m=25, seed=0))
+        large = D_to_networkx(1000, *random_D_erdos_renyi(1000, m=1200, seed=0))
+        with collect() as statistics:
+            eswaran_tarjan(small)
+            eswaran_tarjan(large)
+            eswaran_tarjan(large, backend='networkx')
+        assert_equal([details['backend'] for _, details in statistics.events], ['networkx', 'array', 'networkx'])
+        assert_equal([details['automatic'] for _, details in statistics.events], [True, True, False])
+        assert_raises(ValueError, eswaran_tarjan, small, False, None, 'unknown')
+        assert_raises(ValueError, source_cover, small, set(), None, None, 'unknown')
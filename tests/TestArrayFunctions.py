@@ -0,0 +1,54 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the array converters between D and bipartite graphs
+"""
+
+import numpy as np
+import networkx as nx
+from src.utils.ArrayFunctions import D_arcs_to_bipartite_csr, bipartite_csr_to_D, default_matching_array, \
+    csr_to_graph
+from src.utils.AuxiliaryFunctions import D_to_bipartite, bipartite_to_D, default_matching_from_D
+from src.utils.Generators import random_D_erdos_renyi
+from nose.tools import assert_equal, assert_true, assert_raises, assert_set_equal
+
+
+class TestArrayFunctions:
+
+    def test_same_as_networkx(self):
+        # Vertex i of A is the vertex ids[i] of D_to_bipartite and k + i is its partner -ids[i]
+        tails, heads = random_D_erdos_renyi(300, m=900, seed=5)
+        D = nx.DiGraph(zip((tails + 1).tolist(), (heads + 1).tolist()))
+        G, A, M = D_to_bipartite(D)
+        ids, indptr, indices, mate = D_arcs_to_bipartite_csr(tails + 1, heads + 1)
+        k = len(ids)
+        label = np.concatenate((ids, -ids))
+        H = nx.relabel_nodes(csr_to_graph(indptr, indices), dict(enumerate(label.tolist())))
+        assert_set_equal({frozenset(e) for e in H.edges}, {frozenset(e) for e in G.edges})
+        assert_equal({label[i]: label[mate[i]] for i in range(2 * k)}, default_matching_from_D(D))
+        assert_equal(set(ids.tolist()), A)
+
+        vertices, D_tails, D_heads = bipartite_csr_to_D(indptr, indices, np.arange(2 * k) < k, mate, label)
+        assert_set_equal(set(zip(vertices[D_tails].tolist(), vertices[D_heads].tolist())),
+                         set(bipartite_to_D(G, A, M).edges))
+
+    def test_arbitrary_ids(self):
+        rng = np.random.default_rng(1)
+        for span in (10 ** 3, 10 ** 12, 2 ** 62):  # Lookup table, packed sort and argsort
+            ids = rng.choice(span, 500, replace=False) - span // 2
+            tails, heads = ids[rng.integers(0, 500, 2000)], ids[rng.integers(0, 500, 2000)]
+            result, indptr, indices, mate = D_arcs_to_bipartite_csr(tails, heads, ids)
+            assert_true(np.array_equal(result, np.sort(ids)))
+            vertices, D_tails, D_heads = bipartite_csr_to_D(indptr, indices, np.arange(1000) < 500, mate)
+            assert_set_equal(set(zip(result[vertices[D_tails]].tolist(), result[vertices[D_heads]].tolist())),
+                             {(u, v) for u, v in zip(tails.tolist(), heads.tolist()) if u != v})
+            assert_raises(ValueError, D_arcs_to_bipartite_csr, tails, heads, ids[1:])
+
+    def test_isolated_and_empty(self):
+        ids, indptr, indices, mate = D_arcs_to_bipartite_csr([7, 7], [8, 8], [9, 8, 7])
+        assert_equal(ids.tolist(), [7, 8, 9])
+        assert_equal(np.diff(indptr).tolist(), [1, 2, 1, 2, 1, 1])  # Parallel arcs yield a single edge
+        assert_equal(mate.tolist(), default_matching_array(3).tolist())
+        ids, indptr, indices, mate = D_arcs_to_bipartite_csr([], [])
+        assert_equal((len(ids), indptr.tolist(), len(indices)), (0, [0], 0))
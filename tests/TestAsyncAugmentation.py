@@ -0,0 +1,86 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the awaitable entry points of the bipartite matching augmentation
+"""
+
+import asyncio
+from src.AsyncAugmentation import AsyncAugmenter
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.Generators import random_D_planted_sccs, random_D_erdos_renyi, D_arcs_to_bipartite, \
+    bipartite_to_networkx
+from src.utils.Instrumentation import collect
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises
+
+
+def planted_instance(seed: int, n: int = 600):
+    tails, heads, _ = random_D_planted_sccs(n, n // 2, 3 * n, internal_arcs=n // 2, seed=seed)
+    return bipartite_to_networkx(*D_arcs_to_bipartite(n, tails, heads))
+
+
+class TestAsyncAugmentation:
+
+    def test_augment(self):
+        instances = [planted_instance(seed) for seed in range(3)]
+
+        async def run():
+            async with AsyncAugmenter(max_concurrency=2) as augmenter:
+                return await asyncio.gather(*(augmenter.augment(G, A, M, backend='networkx')
+                                              for G, A, M in instances))
+
+        for (G, A, M), L in zip(instances, asyncio.run(run())):
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(L, bipartite_matching_augmentation(G, A, M, backend='networkx'))
+
+    def test_processes(self):
+        G, A, M = planted_instance(0)
+
+        async def run():
+            async with AsyncAugmenter(max_concurrency=1, processes=True) as augmenter:
+                return await augmenter.augment(G, A, M, backend='array', timeout=1000)
+
+        assert_equal(asyncio.run(run()), bipartite_matching_augmentation(G, A, M, backend='array'))
+
+    def test_coalescing(self):
+        # Concurrent identical requests share one computation, each caller gets its own copy of L
+        G, A, M = planted_instance(1)
+        augmenter = AsyncAugmenter(max_concurrency=1)
+
+        async def run():
+            with collect() as statistics:
+                results = await asyncio.gather(*(augmenter.augment(G, A, M) for _ in range(3)))
+            return results, statistics
+
+        results, statistics = asyncio.run(run())
+        augmenter.close()
+        assert_equal(augmenter.coalesced, 2)
+        assert_equal(statistics.counters['coalesced'], 2)
+        assert_equal(results[0], results[1])
+        assert_true(results[0] is not results[1])
+        assert_equal(augmenter.pending(), 0)
+
+    def test_cancellation(self):
+        # A cancelled request withdraws the computation, the augmenter stays usable
+        G, A, M = planted_instance(2, 4000)
+        small = bipartite_to_networkx(*D_arcs_to_bipartite(50, *random_D_erdos_renyi(50, m=60, seed=0)))
+
+        async def run():
+            async with AsyncAugmenter(max_concurrency=1) as augmenter:
+                task = asyncio.ensure_future(augmenter.augment(G, A, M, backend='networkx'))
+                waiting = asyncio.ensure_future(augmenter.augment(*small))  # Waits for the only slot
+                await asyncio.sleep(0.01)
+                task.cancel()
+                waiting.cancel()
+                with assert_raises(asyncio.CancelledError):
+                    await task
+                with assert_raises(asyncio.CancelledError):
+                    await waiting
+                assert_equal(augmenter.pending(), 0)
+                return await augmenter.augment(*small)
+
+        assert_true(is_correctly_augmented(small[0], small[1], asyncio.run(run())))
+
+    def test_invalid(self):
+        assert_raises(ValueError, AsyncAugmenter, 0)
@@ -0,0 +1,152 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the resident augmentation server
+"""
+
+import os
+import json
+import socket
+import tempfile
+import threading
+import http.client
+from src.AugmentationServer import AugmentationService, make_server
+from src.algo.ArrayBackend import array_matching_augmentation
+from src.algo.CriticalEdges import critical_edges
+from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+from src.exceptions.Exceptions import unknown_instance_exception
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_false, assert_raises, assert_in, assert_not_in
+
+
+def planted_record(seed: int):
+    tails, heads, _ = random_D_planted_sccs(300, 150, 900, internal_arcs=150, seed=seed)
+    G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(300, tails, heads))
+    record = {'edges': [[a, b] if a in A else [b, a] for a, b in G.edges],
+              'A': sorted(A), 'M': [[a, M[a]] for a in sorted(A)]}
+    return record, (G, A, M)
+
+
+class _UnixConnection(http.client.HTTPConnection):
+
+    def __init__(self, path: str):
+        super().__init__('localhost')
+        self.unix_path: str = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.unix_path)
+
+
+def request(connection: http.client.HTTPConnection, method: str, path: str, body=None):
+    connection.request(method, path, json.dumps(body) if body is not None else None,
+                       {'Content-Type': 'application/json'})
+    response = connection.getresponse()
+    return response.status, json.loads(response.read())
+
+
+class TestAugmentationServer:
+
+    def test_service(self):
+        service = AugmentationService(workers=2)
+        try:
+            record, (G, A, M) = planted_record(0)
+            summary = service.load('g', record)
+            assert_equal(summary['vertices'], len(G))
+            assert_true(summary['critical'] > 0)
+
+            L = {tuple(edge) for edge in service.augment('g')['L']}
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(len(L), len(array_matching_augmentation(G, A, M)))
+            result = service.augment('g', sizes_only=True)
+            assert_equal(result['size'], len(L))
+            assert_not_in('L', result)
+
+            a, b = critical_edges(G, A, M)
+            assert_equal(service.critical('g')['critical'], sorted(zip(a.tolist(), b.tolist()), key=repr))
+
+            assert_true(service.verify('g', L)['valid'])
+            partial = service.verify('g', sorted(L)[1:])
+            assert_false(partial['valid'])
+            assert_true(partial['remaining_critical'] > 0)
+            assert_raises(ValueError, service.verify, 'g', [(next(iter(A)), next(iter(A)))])
+
+            assert_equal(list(service.memory()['instances']), ['g'])
+            service.unload('g')
+            assert_equal(service.instances(), [])
+            assert_raises(unknown_instance_exception, service.augment, 'g')
+            assert_raises(unknown_instance_exception, service.unload, 'g')
+        finally:
+            service.close()
+
+    def test_http(self):
+        record, (G, A, M) = planted_record(1)
+        service = AugmentationService(workers=2)
+        server = make_server(service)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        connection = http.client.HTTPConnection(*server.server_address)
+        try:
+            assert_equal(request(connection, 'PUT', '/instances/g', record)[0], 200)
+            status, result = request(connection, 'POST', '/instances/g/augment', {'sizes_only': True})
+            assert_equal(status, 200)
+            assert_equal(result['size'], len(array_matching_augmentation(G, A, M)))
+            status, result = request(connection, 'POST', '/instances/g/augment', {'deadline': 0})
+            assert_true(result['degraded'])
+            L = result['L']
+            assert_true(request(connection, 'POST', '/instances/g/verify', {'L': L})[1]['valid'])
+            assert_equal(request(connection, 'GET', '/instances/g/critical')[0], 200)
+            assert_equal(request(connection, 'GET', '/instances')[1]['instances'][0]['id'], 'g')
+            assert_in('rss', request(connection, 'GET', '/memory')[1])
+            assert_equal(request(connection, 'PUT', '/instances/h', {'nodes': []})[0], 400)
+            # A KeyError of a bad vertex is an invalid request, not an unknown instance
+            status, result = request(connection, 'PUT', '/instances/h', {'edges': [[0, 1], [2, 3]], 'M': [[0, 5]]})
+            assert_equal(status, 400)
+            assert_equal(request(connection, 'POST', '/instances/g/verify', {'L': [[-1, -2]]})[0], 400)
+            assert_equal(request(connection, 'PUT', '/instances/h', {'path': 'instance.jsonl'})[0], 400)
+            assert_equal(request(connection, 'DELETE', '/instances/g')[0], 200)
+            assert_equal(request(connection, 'GET', '/instances/g/critical')[0], 404)
+        finally:
+            connection.close()
+            server.shutdown()
+            server.server_close()
+            service.close()
+
+    def test_unix_socket_and_path(self):
+        record, (G, A, M) = planted_record(2)
+        with tempfile.TemporaryDirectory() as directory:
+            data = os.path.join(directory, 'data')
+            os.mkdir(data)
+            path = os.path.join(data, 'instance.jsonl')
+            with open(path, 'w') as stream:
+                stream.write(json.dumps(record) + '\n')
+            with open(os.path.join(data, 'malformed.txt'), 'w') as stream:
+                stream.write('0 1\nsecret line of the file\n')
+            with open(os.path.join(directory, 'outside.jsonl'), 'w') as stream:
+                stream.write(json.dumps(record) + '\n')
+            service = AugmentationService(workers=1, data_directory=data)
+            server = make_server(service, unix=os.path.join(directory, 'socket'))
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            connection = _UnixConnection(os.path.join(directory, 'socket'))
+            try:
+                status, summary = request(connection, 'PUT', '/instances/g', {'path': 'instance.jsonl'})
+                assert_equal(status, 200)
+                assert_equal(summary['edges'], G.number_of_edges())
+                assert_equal(request(connection, 'PUT', '/instances/h', {'path': path})[0], 200)
+
+                # Files outside the data directory are rejected, the content of a malformed file is not echoed
+                for outside in ('../outside.jsonl', os.path.join(directory, 'outside.jsonl'), '/etc/passwd', '..'):
+                    status, result = request(connection, 'PUT', '/instances/x', {'path': outside})
+                    assert_equal((status, result['error']), (400, 'ValueError: No such file in the data directory.'))
+                status, result = request(connection, 'PUT', '/instances/x', {'path': 'malformed.txt'})
+                assert_equal(status, 400)
+                assert_not_in('secret', result['error'])
+                result = request(connection, 'POST', '/instances/g/augment', {})[1]
+                assert_true(is_correctly_augmented(G, A, {tuple(edge) for edge in result['L']}))
+            finally:
+                connection.close()
+                server.shutdown()
+                server.server_close()
+                service.close()
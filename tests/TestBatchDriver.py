@@ -0,0 +1,99 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the command-line batch driver
+"""
+
+import io
+import os
+import json
+import tempfile
+from src.BatchDriver import main, read_edgelist
+from nose.tools import assert_equal, assert_true, assert_in
+
+
+def run(argv, text: str = ''):
+    """ Runs the driver on the given standard input, returns the exit code and the parsed output records. """
+    output = io.StringIO()
+    code = main(argv, stdin=io.StringIO(text), stdout=output)
+    return code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestBatchDriver:
+
+    def test_jsonl_stdin(self):
+        text = '\n'.join([
+            json.dumps({'id': 'two', 'edges': [[0, 1], [2, 3]], 'A': [0, 2]}),
+            json.dumps({'id': 'robust', 'edges': [[0, 1], [0, 3], [2, 1], [2, 3]], 'M': [[0, 1], [2, 3]]}),
+            json.dumps({'edges': [['a', 'b']]}),
+        ])
+        code, results = run([], text)
+        assert_equal(code, 1)  # The last instance cannot be augmented
+        assert_equal([result['id'] for result in results], ['two', 'robust', '<stdin>:3'])
+        assert_equal(sorted(map(tuple, results[0]['L'])), [(0, 3), (2, 1)])
+        assert_equal(results[1]['size'], 0)
+        assert_true(results[0]['seconds'] >= 0)
+        assert_in('error', results[2])
+
+    def test_edgelist(self):
+        text = '# first instance\n0 1 *\n2 3 *\n\n# second instance\nx y\nx z\nw y\nw z\n'
+        instances = list(read_edgelist(io.StringIO(text), 'f'))
+        assert_equal([instance['id'] for instance in instances], ['f:1', 'f:2'])
+        assert_equal(instances[0]['M'], [(0, 1), (2, 3)])
+
+        code, results = run(['--format', 'edgelist', '--sizes-only'], text)
+        assert_equal(code, 0)
+        assert_equal([result['size'] for result in results], [2, 0])
+        assert_true('L' not in results[0])
+
+    def test_files_workers_and_cache(self):
+        # Several files processed by a pool, output written to a file in the input order
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for i in range(4):
+                paths.append(os.path.join(directory, 'instance{}.txt'.format(i)))
+                with open(paths[-1], 'w') as file:
+                    file.write(''.join('{} {}\n'.format(2 * j, 2 * j + 1) for j in range(i + 2)))
+            output = os.path.join(directory, 'out.jsonl')
+            cache = os.path.join(directory, 'cache')
+            argv = ['--workers', '2', '--output', output, '--cache', cache] + paths
+            assert_equal(main(argv), 0)
+            assert_equal(main(argv), 0)  # Second run is answered from the cache
+            with open(output) as file:
+                results = [json.loads(line) for line in file]
+            assert_equal([result['id'] for result in results], [path + ':1' for path in paths])
+            assert_equal([result['size'] for result in results], [2, 3, 4, 5])
+
+    def test_deadline(self):
+        # An exhausted time budget still yields a valid augmenting set, marked as degraded
+        text = '\n'.join('{} {}'.format(2 * j, 2 * j + 1) for j in range(10)) + '\n'
+        code, results = run(['--format', 'edgelist', '--deadline', '0'], text)
+        assert_equal(code, 0)
+        assert_equal(results[0]['size'], 10)
+        assert_true(results[0]['degraded'])
+        code, results = run(['--format', 'edgelist', '--deadline', '100'], text)
+        assert_true('degraded' not in results[0])
+
+    def test_validate(self):
+        text = json.dumps({'id': 'bad', 'edges': [[0, 1], [2, 3], [0, 2]], 'A': [0, 2]}) + '\n'
+        code, results = run(['--validate'], text)
+        assert_equal(code, 1)
+        assert_equal(results[0]['error'], 'invalid_instance_exception: 1 edges do not join A and B: (0, 2)')
+
+    def test_malformed_input(self):
+        # A malformed line yields an error record, the following instances are still solved
+        text = json.dumps({'id': 'ok', 'edges': [[0, 1], [2, 3]]}) + '\nnot json\n{"id": "no edges"}\n' + \
+            json.dumps({'edges': [[0, 1], [2, 3]]}) + '\n'
+        code, results = run([], text)
+        assert_equal(code, 1)
+        assert_equal([result['id'] for result in results], ['ok', '<stdin>:2', 'no edges', '<stdin>:4'])
+        assert_equal([result.get('size') for result in results], [2, None, None, 2])
+        assert_in('JSONDecodeError', results[1]['error'])
+
+        text = '0 1\n2 3\n\n0 1 2 3\n4 5\n\n0 1\n2 3\n'
+        code, results = run(['--format', 'edgelist'], text)
+        assert_equal(code, 1)
+        assert_equal([result['id'] for result in results], ['<stdin>:1', '<stdin>:2', '<stdin>:3'])
+        assert_equal(results[1]['error'], 'ValueError: Malformed line 4 in <stdin>')
+        assert_equal(results[2]['size'], 2)
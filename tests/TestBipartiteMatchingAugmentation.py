@@ -214,3 +214,18 @@ class TestBipartiteMatchingAugmentation:
 
 
 
+
+    def test_transitive_reduction(self):
+        # The reduction pre-pass of the condensation must not change the validity nor the size of L
+        from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+        from src.utils.Instrumentation import collect
+
+        for seed in range(3):
+            tails, heads, _ = random_D_planted_sccs(1000, 300, 3000, internal_arcs=500, seed=seed)
+            G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(1000, tails, heads))
+            with collect() as statistics:
+                L = bipartite_matching_augmentation(G, A, M, backend='networkx', reduce_condensation=True)
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_true(statistics.counters['reduction_removed_arcs'] > 0)
+            L_unreduced = bipartite_matching_augmentation(G, A, M, backend='networkx', reduce_condensation=False)
+            assert_equal(len(L), len(L_unreduced))
@@ -0,0 +1,58 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the concurrent execution of independent phases
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.ArrayBackend import augment_arrays
+from src.utils.Concurrency import run_concurrently, gil_enabled
+from src.utils.Deadline import Deadline
+from src.utils.Instrumentation import collect, increment
+from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises, assert_in
+
+
+class TestConcurrency:
+
+    def test_run_concurrently(self):
+        with ThreadPoolExecutor(2) as executor:
+            threads = run_concurrently(executor, threading.get_ident, threading.get_ident)
+            assert_equal(threads[1], threading.get_ident())  # The last call runs in the calling thread
+            assert_true(threads[0] != threads[1])
+            assert_equal(run_concurrently(None, lambda: 1, lambda: 2), [1, 2])
+
+            # Counters of the submitted calls are recorded by the collector of the caller
+            with collect() as statistics:
+                run_concurrently(executor, *[lambda: increment('calls')] * 3)
+            assert_equal(statistics.counters, {'calls': 3})
+
+            def failing():
+                raise KeyError('first')
+            assert_raises(KeyError, run_concurrently, executor, failing, lambda: 2)
+        assert_in(gil_enabled(), (True, False))
+
+    def test_same_result(self):
+        # The phases are reentrant, concurrent calls with a shared pool return the same sets as sequential ones
+        tails, heads, _ = random_D_planted_sccs(800, 300, 2400, internal_arcs=400, seed=4)
+        n, a, b = D_arcs_to_bipartite(800, tails, heads)
+        G, A, M = bipartite_to_networkx(n, a, b)
+        with ThreadPoolExecutor(4) as executor, ThreadPoolExecutor(3) as callers:
+            for backend in ('networkx', 'dense', 'array'):
+                expected = bipartite_matching_augmentation(G, A, M, backend=backend)
+                results = list(callers.map(lambda _: bipartite_matching_augmentation(
+                    G, A, M, backend=backend, executor=executor), range(3)))
+                for L in results:
+                    assert_equal(L, expected)
+                assert_true(is_correctly_augmented(G, A, expected))
+            L = augment_arrays(n, a, b, executor=executor)
+            assert_equal(len(L[0]), len(augment_arrays(n, a, b)[0]))
+
+            deadline = Deadline(0)
+            L = bipartite_matching_augmentation(G, A, M, backend='networkx', deadline=deadline, executor=executor)
+            assert_true(deadline.degraded)
+            assert_true(is_correctly_augmented(G, A, L))
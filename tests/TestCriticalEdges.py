@@ -0,0 +1,67 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the critical_edges(G, A, M) function
+"""
+
+import networkx as nx
+from src.algo.CriticalEdges import critical_edges
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from nose.tools import assert_equal, assert_set_equal, assert_raises, assert_true
+from typing import Set
+
+
+def critical_edges_brute_force(G: nx.Graph, A: Set) -> Set:
+    """ Returns the set of edges (a, b) of G such that G - (a, b) does not admit a perfect matching. """
+    critical = set()
+    for u, v in list(G.edges):
+        G.remove_edge(u, v)
+        if len(nx.algorithms.bipartite.hopcroft_karp_matching(G, A)) < G.number_of_nodes():
+            critical.add((u, v) if u in A else (v, u))
+        G.add_edge(u, v)
+    return critical
+
+
+class TestCriticalEdges:
+
+    def test_unsupported(self):
+        assert_raises(nx.NetworkXNotImplemented, critical_edges, nx.DiGraph(), set())
+        assert_raises(nx.NetworkXNotImplemented, critical_edges, nx.MultiGraph(), set())
+
+    def test_no_perfect_matching(self):
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 1)})
+        G.add_node(3)
+        assert_raises(nx.NetworkXError, critical_edges, G, {0, 2})
+
+    def test_simple(self):
+        # Two disjoint edges are both critical, a 4-cycle has no critical edge
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        a, b = critical_edges(G, {0, 2})
+        assert_set_equal(set(zip(a.tolist(), b.tolist())), {(0, 1), (2, 3)})
+
+        G.add_edges_from({(0, 3), (2, 1)})
+        a, b = critical_edges(G, {0, 2})
+        assert_equal((len(a), len(b)), (0, 0))
+
+    def test_string_labels(self):
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({('a1', 'b1'), ('a2', 'b2'), ('a1', 'b2'), ('a2', 'b1'), ('a3', 'b3'), ('a3', 'b1')})
+        a, b = critical_edges(G, {'a1', 'a2', 'a3'})
+        assert_set_equal(set(zip(a, b)), {('a3', 'b3')})
+
+    def test_random_graphs(self):
+        # Compare with the brute force on random instances, with and without a given matching
+        for seed in range(5):
+            D: nx.DiGraph = nx.generators.random_graphs.erdos_renyi_graph(40, 0.05, directed=True, seed=seed)
+            D.remove_node(0)
+            G, A, M = D_to_bipartite(D)
+            expected = critical_edges_brute_force(G, A)
+            a, b = critical_edges(G, A, M)
+            assert_set_equal(set(zip(a.tolist(), b.tolist())), expected)
+            a, b = critical_edges(G, A)
+            assert_set_equal(set(zip(a.tolist(), b.tolist())), expected)
+            assert_true((len(expected) == 0) == (len(bipartite_matching_augmentation(G, A, M)) == 0))
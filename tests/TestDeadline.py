@@ -0,0 +1,71 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the deadline and cancellation of the bipartite matching augmentation
+"""
+
+import tempfile
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.Deadline import Deadline, CHECK_INTERVAL
+from src.utils.ResultCache import ResultCache
+from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+from src.exceptions.Exceptions import deadline_exceeded_exception
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_false, assert_raises
+
+
+def planted_instance(seed: int):
+    tails, heads, _ = random_D_planted_sccs(600, 300, 1500, internal_arcs=300, seed=seed)
+    return bipartite_to_networkx(*D_arcs_to_bipartite(600, tails, heads))
+
+
+class TestDeadline:
+
+    def test_token(self):
+        deadline = Deadline()
+        assert_false(deadline.expired())
+        assert_equal(deadline.remaining(), None)
+        deadline.check()
+        deadline.cancel()
+        assert_true(deadline.expired())
+        assert_raises(deadline_exceeded_exception, deadline.check)
+
+        deadline = Deadline(0)
+        assert_true(deadline.expired())
+        for _ in range(CHECK_INTERVAL - 1):  # The clock is read only once per CHECK_INTERVAL ticks
+            deadline.tick()
+        assert_raises(deadline_exceeded_exception, deadline.tick)
+        assert_true(Deadline(1000).remaining() > 999)
+
+    def test_not_expired(self):
+        for backend in ('networkx', 'array'):
+            G, A, M = planted_instance(0)
+            deadline = Deadline(1000)
+            L = bipartite_matching_augmentation(G, A, M, backend=backend, deadline=deadline)
+            assert_false(deadline.degraded)
+            assert_equal(L, bipartite_matching_augmentation(G, A, M, backend=backend))
+
+    def test_expired(self):
+        # An expired token yields a valid, but possibly larger, augmenting set
+        instances = [(planted_instance(seed), backend) for seed in range(2) for backend in ('networkx', 'array')]
+        tails, heads, _ = random_D_planted_sccs(200, 100, 8000, internal_arcs=200, seed=1)
+        instances.append((bipartite_to_networkx(*D_arcs_to_bipartite(200, tails, heads)), 'dense'))
+        for (G, A, M), backend in instances:
+            deadline = Deadline()
+            deadline.cancel()
+            L = bipartite_matching_augmentation(G, A, M, backend=backend, deadline=deadline)
+            assert_true(deadline.degraded)
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_true(len(L) >= len(bipartite_matching_augmentation(G, A, M, backend=backend)))
+
+    def test_degraded_not_cached(self):
+        G, A, M = planted_instance(1)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            deadline = Deadline(0)
+            bipartite_matching_augmentation(G, A, M, cache=cache, deadline=deadline)
+            assert_true(deadline.degraded)
+            assert_equal(len(cache), 0)
+            bipartite_matching_augmentation(G, A, M, cache=cache, deadline=Deadline(1000))
+            assert_equal(len(cache), 1)
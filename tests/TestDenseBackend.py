@@ -0,0 +1,102 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the bitset backend of the bipartite matching augmentation
+"""
+
+import numpy as np
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.DenseBackend import dense_matching_augmentation, is_dense
+from src.utils.BitsetFunctions import bitset_strong_components, bitset_reach, bitset_from_indices, bitset_indices
+from src.utils.Generators import random_D_erdos_renyi, random_D_planted_sccs, gadget_family, D_arcs_to_bipartite, \
+    bipartite_to_networkx, D_to_networkx
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.utils.Instrumentation import collect
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_false, assert_set_equal, assert_raises
+
+
+def bitset_rows(n: int, tails: np.ndarray, heads: np.ndarray) -> (list, list):
+    rows, cols = [0] * n, [0] * n
+    for u, v in zip(tails.tolist(), heads.tolist()):
+        rows[u] |= 1 << v
+        cols[v] |= 1 << u
+    return rows, cols
+
+
+class TestDenseBackend:
+
+    def test_strong_components(self):
+        # Components must equal those of NetworkX and be numbered topologically
+        for seed in range(5):
+            tails, heads, _ = random_D_planted_sccs(300, 40, 500, internal_arcs=300, seed=seed)
+            rows, cols = bitset_rows(300, tails, heads)
+            num_of_components, component = bitset_strong_components(rows, cols, 300)
+            expected = nx.strongly_connected_components(D_to_networkx(300, tails, heads))
+            assert_equal(num_of_components, 40)
+            assert_set_equal({frozenset(np.flatnonzero(component == c).tolist()) for c in range(40)},
+                             set(map(frozenset, expected)))
+            assert_true(np.all(component[tails] <= component[heads]))
+
+    def test_reach(self):
+        tails, heads = random_D_erdos_renyi(200, 0.01, seed=1)
+        rows, _ = bitset_rows(200, tails, heads)
+        D = D_to_networkx(200, tails, heads)
+        reached = bitset_indices(bitset_reach(rows, bitset_from_indices([0, 5], 200), ~0, 200), 200)
+        assert_set_equal(set(reached.tolist()), nx.descendants(D, 0) | nx.descendants(D, 5) | {0, 5})
+
+    def test_auto_selection(self):
+        G, A, _ = bipartite_to_networkx(*D_arcs_to_bipartite(100, *random_D_erdos_renyi(100, 0.3, seed=2)))
+        assert_true(is_dense(G, A))
+        G, A, _ = bipartite_to_networkx(*D_arcs_to_bipartite(100, *random_D_erdos_renyi(100, 0.01, seed=2)))
+        assert_false(is_dense(G, A))
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        assert_false(is_dense(G, {0, 2}))  # Too small
+
+        # Large graphs get the array backend even if dense, only smaller dense graphs get the bitsets
+        instances = [bipartite_to_networkx(*D_arcs_to_bipartite(k, *random_D_planted_sccs(
+            k, k, m, trivial_fraction=1, seed=3)[:2])) for k, m in ((300, 30000), (64, 420))]
+        with collect() as statistics:
+            for G, A, M in instances:
+                assert_true(is_dense(G, A))
+                bipartite_matching_augmentation(G, A, M)
+        assert_equal([details['backend'] for name, details in statistics.events if name == 'backend'
+                      and details['function'] == 'bipartite_matching_augmentation'], ['array', 'dense'])
+        assert_raises(ValueError, bipartite_matching_augmentation, G, {0, 2}, None, None, None, 'unknown')
+
+    def test_simple(self):
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, backend='dense'), {(0, 3), (2, 1)})
+        G.add_edges_from({(0, 3), (2, 1)})
+        assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, backend='dense'), set())
+
+    def test_gadget_family(self):
+        n, a, b = gadget_family(20)
+        G, A, M = bipartite_to_networkx(n, a, b)
+        L = dense_matching_augmentation(G, A, M)
+        assert_equal(len(L), 1)
+        assert_true(is_correctly_augmented(G, A, L))
+
+    def test_tree(self):
+        # The augmenting set of a tree has the optimal size max(s, t) + q
+        D = nx.balanced_tree(2, 8, nx.DiGraph())
+        D.remove_node(0)
+        G, A, M = D_to_bipartite(D)
+        L = bipartite_matching_augmentation(G, A, M, backend='dense')
+        assert_true(is_correctly_augmented(G, A, L))
+        assert_equal(len(L), len(bipartite_matching_augmentation(G, A, M, backend='networkx')))
+
+    def test_random_dense_graphs(self):
+        # Dense planted instances and dense random instances are correctly augmented
+        for seed in range(3):
+            tails, heads, _ = random_D_planted_sccs(200, 30, 8000, internal_arcs=2000, seed=seed)
+            G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(200, tails, heads))
+            L = bipartite_matching_augmentation(G, A, M)
+            assert_true(is_correctly_augmented(G, A, L))
+            G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(150, *random_D_erdos_renyi(150, 0.2, seed=seed)))
+            L = bipartite_matching_augmentation(G, A, M, backend='dense')
+            assert_true(is_correctly_augmented(G, A, L))
@@ -0,0 +1,72 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the differential harness of the engines
+"""
+
+import io
+import json
+from benchmarks import Differential
+from src.algo.CriticalEdges import critical_edges
+from src.utils.Generators import random_D_erdos_renyi, D_arcs_to_bipartite, bipartite_to_networkx
+from nose.tools import assert_equal, assert_true, assert_false, assert_in, assert_raises
+
+
+def run(argv) -> (int, list):
+    output = io.StringIO()
+    code = Differential.main(argv + ['--json'], output)
+    return code, [json.loads(line) for line in output.getvalue().splitlines()]
+
+
+class TestDifferential:
+
+    def test_engines_agree(self):
+        code, records = run(['--sizes', '300', '--seeds', '2'])
+        assert_equal(code, 0)
+        assert_equal(len(records), 4 * 2 * 6)
+        assert_equal([record['engine'] for record in records[:6]], ['networkx', 'dense', 'array', 'arrays', 'packed',
+                                                                    'external'])
+        for record in records:
+            assert_equal(record['mismatch'], '')
+            assert_true(record['robust'])
+            assert_true(record['within_bound'])
+            assert_true(record['ratio'] > 0)
+
+    def test_mismatch(self):
+        # An engine returning a too small set is detected by the independent robustness check
+        Differential.ENGINES['broken'] = lambda n, a, b, G, A, M: set(list(Differential.ENGINES['array'](
+            n, a, b, G, A, M))[1:])
+        try:
+            code, records = run(['--families', 'planted', '--sizes', '300', '--engines', 'array,broken'])
+        finally:
+            del Differential.ENGINES['broken']
+        assert_equal(code, 1)
+        assert_equal([record['mismatch'] for record in records[:2]], ['', ''])
+        assert_false(records[2]['robust'])
+        assert_in('critical edges remain', records[2]['mismatch'])
+
+        # The result of the reference is checked as well
+        reference = Differential.ENGINES['networkx']
+        Differential.ENGINES['networkx'] = lambda n, a, b, G, A, M: set()
+        try:
+            code, records = run(['--families', 'planted', '--sizes', '300', '--engines', 'array'])
+        finally:
+            Differential.ENGINES['networkx'] = reference
+        assert_equal(code, 1)
+        assert_false(records[0]['robust'])
+        assert_equal(records[0]['mismatch'], '{} critical edges remain'.format(records[0]['critical']))
+
+    def test_remaining_critical_edges(self):
+        # Critical edges of G + L agree with critical_edges, invalid edges are rejected
+        G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(200, *random_D_erdos_renyi(200, m=220, seed=4)))
+        assert_equal(Differential.remaining_critical_edges(G, A, M, []), len(critical_edges(G, A, M)[0]))
+        L = Differential.ENGINES['array'](None, None, None, G, A, M)
+        assert_equal(Differential.remaining_critical_edges(G, A, M, L), 0)
+        assert_raises(ValueError, Differential.remaining_critical_edges, G, A, M, [(0, 1)])
+
+    def test_bounds(self):
+        assert_equal(Differential.harmonic(1), 1.0)
+        assert_true(Differential.within_bound(10, 11, 1.0))
+        assert_false(Differential.within_bound(10, 30, 2.5))
+        assert_true(Differential.within_bound(10, 30, Differential.harmonic(20)))
@@ -0,0 +1,78 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the external-memory mode of the bipartite matching augmentation
+"""
+
+import os
+import tempfile
+import numpy as np
+import networkx as nx
+from src.algo.ExternalMemory import external_matching_augmentation, write_edge_file, \
+    semi_external_strong_components, _write_sorted_arcs
+from src.algo.ArrayBackend import array_matching_augmentation
+from src.utils.ArrayFunctions import strong_components, edges_to_csr
+from src.utils.Generators import random_D_erdos_renyi, random_D_power_law, random_D_planted_sccs, gadget_family, \
+    D_arcs_to_bipartite, bipartite_to_networkx
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises
+
+
+def external(n: int, a: np.ndarray, b: np.ndarray, **kwargs):
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'edges.bin')
+        write_edge_file(path, a, b)
+        return external_matching_augmentation(path, n, directory=directory, **kwargs)
+
+
+class TestExternalMemory:
+
+    def test_strong_components(self):
+        for seed in range(3):
+            tails, heads = random_D_erdos_renyi(2000, m=2200, seed=seed)
+            indptr, indices = edges_to_csr(2000, tails, heads)
+            num_of_components, component = semi_external_strong_components(indptr, indices)
+            expected_num, expected = strong_components(2000, tails, heads)
+            assert_equal(num_of_components, expected_num)
+            # Same partition, possibly numbered differently
+            assert_equal(len(set(zip(component.tolist(), expected.tolist()))), num_of_components)
+            # Numbered in a reverse topological order, so that arcs never lead to a higher component
+            assert_true(np.all(component[tails] >= component[heads]))
+
+    def test_external_sort(self):
+        # Runs overlapping in keys, duplicates across runs and empty chunks, merged in small blocks
+        random = np.random.default_rng(0)
+        chunks = [random.integers(0, 50 * 50, size) for size in (0, 300, 7, 0, 1000, 64)]
+        keys = np.unique(np.concatenate(chunks))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'heads.bin')
+            indptr = _write_sorted_arcs(iter(chunks), 50, path, 100)
+            expected_indptr, expected_indices = edges_to_csr(50, keys // 50, keys % 50)
+            assert_equal(indptr.tolist(), expected_indptr.tolist())
+            assert_equal(np.fromfile(path, dtype=np.int64).tolist(), expected_indices.tolist())
+            assert_equal(sorted(os.listdir(directory)), ['heads.bin'])
+            assert_equal(_write_sorted_arcs(iter([]), 3, path, 100).tolist(), [0, 0, 0, 0])
+
+    def test_same_size_as_array(self):
+        # Small chunks force many passes, the result agrees with the in-memory array backend
+        instances = [random_D_erdos_renyi(1000, m=1200, seed=1), random_D_power_law(1000, 2000, seed=2),
+                     random_D_planted_sccs(1000, 50, 3000, internal_arcs=1000, seed=3)[:2]]
+        for tails, heads in instances:
+            n, a, b = D_arcs_to_bipartite(1000, tails, heads)
+            L_a, L_b = external(n, a, b, chunk_size=257)
+            G, A, M = bipartite_to_networkx(n, a, b)
+            L = set(zip(L_a.tolist(), L_b.tolist()))
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(len(L), len(array_matching_augmentation(G, A, M)))
+        assert_equal(len(external(*gadget_family(50))[0]), 1)
+
+    def test_matching(self):
+        # A matching other than {i, n + i}, and invalid instances
+        n, a, b = 2, np.array([0, 1]), np.array([2, 3])
+        assert_equal(external(n, a, b)[0].tolist(), [0, 1])
+        n, a, b = 2, np.array([0, 0, 1, 1]), np.array([2, 3, 2, 3])
+        assert_equal(len(external(n, a, b, mate=np.array([3, 2]))[0]), 0)
+        assert_raises(nx.NetworkXError, external, 2, np.array([0, 1]), np.array([3, 2]))
+        assert_raises(nx.NetworkXError, external, 2, np.array([0, 1]), np.array([2, 3]), mate=np.array([2, 2]))
+        assert_raises(ValueError, external, 2, np.array([0, 1]), np.array([2, 0]))
@@ -0,0 +1,69 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the early exits of the bipartite matching augmentation
+"""
+
+import numpy as np
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.FastPaths import close_single_trivial, early_exit
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.utils.GraphMemo import GraphMemo
+from src.utils.Instrumentation import collect
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_is_none
+from typing import Set
+
+
+def augment(D: nx.DiGraph, backend: str) -> (Set, dict):
+    G, A, M = D_to_bipartite(D)
+    with collect() as statistics:
+        L = bipartite_matching_augmentation(G, A, M, backend=backend)
+    assert_true(is_correctly_augmented(G, A, L))
+    return L, {name: value for name, value in statistics.counters.items() if name.startswith('fast_path')}
+
+
+class TestFastPaths:
+
+    def test_close_single_trivial(self):
+        assert_equal(close_single_trivial(3, np.array([5, 6]), np.array([]), 0), [(5, 3)])
+        assert_equal(close_single_trivial(3, np.array([]), np.array([4]), 0), [(3, 4)])
+        assert_equal(close_single_trivial(3, np.array([]), np.array([]), 0), [(3, 0), (0, 3)])
+
+    def test_no_trivial_component(self):
+        for backend in ('networkx', 'dense', 'array'):
+            L, counters = augment(nx.DiGraph([(1, 2), (2, 3), (3, 1)]), backend)
+            assert_equal((L, counters), (set(), {'fast_path_robust': 1}))
+            L, counters = augment(nx.DiGraph([(1, 2), (2, 1), (3, 4), (4, 3), (1, 3)]), backend)
+            assert_equal((L, counters), (set(), {'fast_path_robust': 1}))
+
+    def test_single_trivial_component(self):
+        # The trivial component 5 has a successor, a predecessor, or no neighbour at all. The dense backend
+        # has no pre-check, it finds the same optimum by the full algorithm.
+        cycles = [(1, 2), (2, 3), (3, 1), (3, 4), (4, 3)]
+        for arcs, size in (([(5, 1)], 1), ([(2, 5)], 1), ([(5, 1), (5, 4)], 1), ([], 2)):
+            D = nx.DiGraph(cycles + arcs)
+            D.add_node(5)
+            for backend in ('networkx', 'dense', 'array'):
+                L, counters = augment(D, backend)
+                assert_equal(len(L), size)
+                assert_equal(counters, {} if backend == 'dense' else {'fast_path_single_trivial': 1})
+
+    def test_missed(self):
+        # Two trivial components need the full algorithm, memoized calls skip the pre-check
+        D = nx.DiGraph([(1, 2), (2, 3), (3, 1), (3, 4), (5, 1)])
+        L, counters = augment(D, 'networkx')
+        assert_equal(counters, {'fast_path_missed': 1})
+        G, A, M = D_to_bipartite(D)
+        L, arrays = early_exit(G, A, M)
+        assert_is_none(L)
+        assert_equal(len(arrays), 5)
+        assert_equal(augment(D, 'array')[1], {'fast_path_missed': 1})
+
+        G, A, M = D_to_bipartite(nx.DiGraph([(1, 2), (2, 1), (2, 3)]))
+        with collect() as statistics:
+            L = bipartite_matching_augmentation(G, A, M, memo=GraphMemo(), backend='networkx')
+        assert_true(is_correctly_augmented(G, A, L))
+        assert_equal(statistics.counters.get('fast_path_single_trivial', 0), 0)
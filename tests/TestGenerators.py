@@ -0,0 +1,84 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the instance generators
+"""
+
+import numpy as np
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.AuxiliaryFunctions import bipartite_to_D
+from src.utils.Generators import random_D_erdos_renyi, random_D_power_law, random_D_planted_sccs, gadget_family, \
+    D_arcs_to_bipartite, bipartite_to_networkx, D_to_networkx
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises
+from typing import Set
+
+
+def example_graph(num_of_gadgets: int) -> nx.Graph:
+    """ The graph of Example.example1. """
+    G: nx.Graph = nx.Graph()
+    for i in range(1, num_of_gadgets + 2):
+        G.add_edges_from([('s_' + str(2 * i), 's\'_' + str(2 * i)), ('s_' + str(2 * i - 1), 's\'_' + str(2 * i - 1)),
+                          ('s_' + str(2 * i), 's\'_' + str(2 * i - 1)), ('s_' + str(2 * i - 1), 's\'_' + str(2 * i)),
+                          ('s\'_' + str(2 * i - 1), 't_1')])
+    G.add_edge('t_1', 't\'_1')
+    for i in range(1, num_of_gadgets + 1):
+        us = ['t_' + str(4 * i + j) for j in range(-2, 2)]
+        vs = ['t\'_' + str(4 * i + j) for j in range(-2, 2)]
+        G.add_edges_from([(us[j], vs[j]) for j in range(len(us))])
+        G.add_edges_from([(us[2 * j], vs[2 * j + 1]) for j in range(len(us) // 2)])
+        G.add_edges_from([(us[2 * j + 1], vs[2 * j]) for j in range(len(us) // 2)])
+        G.add_edge('t_' + str(4 * i - 1), 's\'_' + str(2 * i + 1))
+        G.add_edge('t_' + str(4 * i + 1), 's\'_' + str(2 * i + 2))
+    return G
+
+
+class TestGenerators:
+
+    def test_erdos_renyi(self):
+        tails, heads = random_D_erdos_renyi(1000, 0.005, seed=0)
+        assert_true(np.all(tails != heads))
+        assert_equal(len(set(zip(tails.tolist(), heads.tolist()))), len(tails))
+        assert_true(4000 < len(tails) < 6000)
+        assert_equal(len(random_D_erdos_renyi(1000, m=3000, seed=0)[0]), len(np.unique(
+            random_D_erdos_renyi(1000, m=3000, seed=0)[0] * 1000 + random_D_erdos_renyi(1000, m=3000, seed=0)[1])))
+
+    def test_power_law(self):
+        tails, heads = random_D_power_law(2000, 10000, seed=0)
+        degrees = np.bincount(tails, minlength=2000) + np.bincount(heads, minlength=2000)
+        assert_true(np.all(tails != heads))
+        assert_true(degrees.max() > 10 * np.median(degrees))  # Heavy tail
+
+    def test_planted_sccs(self):
+        # The number of strong components and the membership must be exactly as planted
+        for seed in range(5):
+            tails, heads, component = random_D_planted_sccs(500, 60, 400, internal_arcs=200, seed=seed)
+            D = D_to_networkx(500, tails, heads)
+            components = list(nx.strongly_connected_components(D))
+            assert_equal(len(components), 60)
+            assert_equal(sum(len(c) == 1 for c in components), 30)
+            for c in components:
+                assert_equal(len(set(component[list(c)].tolist())), 1)
+            for u, v in zip(tails.tolist(), heads.tolist()):
+                assert_true(component[u] <= component[v])  # Components are topologically ordered
+        assert_raises(ValueError, random_D_planted_sccs, 10, 8, 0)
+
+    def test_gadget_family(self):
+        # The generated instance is isomorphic to Example.example1 and needs a single augmenting edge
+        for num_of_gadgets in (1, 2, 5):
+            n, a, b = gadget_family(num_of_gadgets)
+            G, A, M = bipartite_to_networkx(n, a, b)
+            assert_true(nx.is_isomorphic(G, example_graph(num_of_gadgets)))
+            L = bipartite_matching_augmentation(G, A, M)
+            assert_equal(len(L), 1)
+            assert_true(is_correctly_augmented(G, A, L))
+
+    def test_bipartite_round_trip(self):
+        # D of the generated bipartite instance with respect to the known matching is the original digraph
+        tails, heads = random_D_erdos_renyi(300, 0.01, seed=1)
+        G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(300, tails, heads))
+        D: nx.DiGraph = bipartite_to_D(G, A, M)
+        assert_equal(set(D.edges), set(zip(tails.tolist(), heads.tolist())))
+        assert_equal(set(D.nodes), set(range(300)))
@@ -0,0 +1,90 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the GraphMemo in-memory memoization
+"""
+
+import gc
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.GraphMemo import GraphMemo
+from src.algo.DenseBackend import is_dense
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.utils.Instrumentation import collect
+from nose.tools import assert_equal, assert_set_equal, assert_true, assert_is
+
+
+class TestGraphMemo:
+
+    def test_repeated_call_hits(self):
+        # The second call on unchanged G reuses the matching, D and the condensation
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        memo = GraphMemo()
+        L = bipartite_matching_augmentation(G, {0, 2}, memo=memo)
+        assert_equal((memo.hits, memo.misses), (0, 2))
+        assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, memo=memo), L)
+        assert_equal((memo.hits, memo.misses), (2, 2))
+
+    def test_dense_graph(self):
+        # A memoized dense graph uses the NetworkX backend, whose condensation is memoized and reused
+        D: nx.DiGraph = nx.generators.random_graphs.erdos_renyi_graph(80, 0.15, directed=True, seed=2)
+        D.add_node(80)  # A critical edge
+        G, A, M = D_to_bipartite(D)
+        assert_true(is_dense(G, A))
+        memo = GraphMemo()
+        with collect() as statistics:
+            L = bipartite_matching_augmentation(G, A, M, memo=memo)
+            assert_set_equal(bipartite_matching_augmentation(G, A, M, memo=memo), L)
+        assert_equal((memo.hits, memo.misses), (1, 1))
+        backends = [details['backend'] for name, details in statistics.events
+                    if name == 'backend' and details['function'] == 'bipartite_matching_augmentation']
+        assert_equal(backends, ['networkx', 'networkx'])
+
+    def test_invalidation_after_augmentation(self):
+        # After adding L, D must be recomputed, but the matching is still valid and reused
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        memo = GraphMemo()
+        M = memo.matching(G, {0, 2})
+        G.add_edges_from(bipartite_matching_augmentation(G, {0, 2}, memo=memo))
+        assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, memo=memo), set())
+        assert_equal(memo.invalidations, 1)
+        assert_is(memo.matching(G, {0, 2}), M)
+
+    def test_matching_dropped_after_removal(self):
+        # Removing a matched edge must invalidate the memoized matching
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3), (0, 3), (2, 1)})
+        memo = GraphMemo()
+        M = memo.matching(G, {0, 2})
+        G.remove_edge(0, M[0])
+        new_M = memo.matching(G, {0, 2})
+        assert_true(G.has_edge(0, new_M[0]) and G.has_edge(2, new_M[2]))
+        assert_equal(memo.misses, 2)
+
+    def test_bounded_and_weak(self):
+        # Only max_graphs graphs are kept and collected graphs are dropped
+        memo = GraphMemo(max_graphs=2)
+        graphs = []
+        for i in range(3):
+            G: nx.Graph = nx.Graph()
+            G.add_edges_from({(0, 1), (2, 3)})
+            memo.matching(G, {0, 2})
+            graphs.append(G)
+        assert_equal(len(memo), 2)
+        graphs.clear()
+        del G
+        gc.collect()
+        assert_equal(len(memo), 0)
+
+    def test_random_graph(self):
+        # Memoized and plain calls give equally large augmenting sets
+        D: nx.DiGraph = nx.generators.random_graphs.erdos_renyi_graph(300, 0.01, directed=True, seed=2)
+        D.remove_node(0)
+        G, A, M = D_to_bipartite(D)
+        memo = GraphMemo()
+        L = bipartite_matching_augmentation(G, A, memo=memo)
+        assert_set_equal(bipartite_matching_augmentation(G, A, memo=memo), L)
+        assert_equal(len(L), len(bipartite_matching_augmentation(G, A, M)))
@@ -0,0 +1,72 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the instrumentation of phases, counters, events and memory
+"""
+
+import io
+import tracemalloc
+from src.utils.Instrumentation import Statistics, ResidentMemorySampler, collect, active, phase, increment, event, \
+    resident_memory
+from benchmarks.Benchmark import main as benchmark_main
+from nose.tools import assert_equal, assert_true, assert_in, assert_not_in
+
+
+class TestInstrumentation:
+
+    def test_no_collector(self):
+        # Without an active collector, everything is a no-op
+        assert_equal(active(), None)
+        with phase('nothing'):
+            increment('nothing')
+            event('nothing')
+
+    def test_collect(self):
+        with collect() as statistics:
+            assert_true(active() is statistics)
+            for _ in range(2):
+                with phase('a'):
+                    increment('counter', 3)
+            event('decision', value=1)
+        assert_equal(active(), None)
+        assert_equal(set(statistics.timings), {'a'})
+        assert_equal(statistics.counters, {'counter': 6})
+        assert_equal(statistics.events, [('decision', {'value': 1})])
+        assert_equal(statistics.memory, {})  # Memory is not tracked by default
+
+    def test_memory(self):
+        # The peak of an enclosing phase includes the peaks of nested phases, which reset the peak of tracemalloc
+        statistics = Statistics(memory=True)
+        tracemalloc.start()
+        try:
+            with collect(statistics):
+                with phase('outer'):
+                    with phase('inner'):
+                        block = bytearray(4 * 10 ** 6)
+                        del block
+                    kept = bytearray(10 ** 6)
+        finally:
+            tracemalloc.stop()
+        assert_true(statistics.memory['inner']['peak'] >= 4 * 10 ** 6)
+        assert_true(statistics.memory['inner']['retained'] < 10 ** 5)
+        assert_true(statistics.memory['outer']['peak'] >= 4 * 10 ** 6)
+        assert_true(statistics.memory['outer']['retained'] >= 10 ** 6)
+        assert_equal(len(kept), 10 ** 6)
+
+    def test_resident_memory(self):
+        rss = resident_memory()
+        assert_true(rss is None or rss > 0)
+        with ResidentMemorySampler(0.001) as sampler:
+            bytearray(10 ** 6)
+        assert_true(sampler.peak is None or sampler.peak >= rss)
+
+    def test_memory_budget(self):
+        # The memory benchmark fails if the budget is exceeded
+        arguments = ['--memory', '--families', 'gadget', '--sizes', '300', '--json']
+        output = io.StringIO()
+        assert_equal(benchmark_main(arguments, output), 0)
+        assert_in('"within_budget": true', output.getvalue())
+        output = io.StringIO()
+        assert_equal(benchmark_main(arguments + ['--vertex-budget', '1', '--edge-budget', '0'], output), 1)
+        assert_not_in('"within_budget": true', output.getvalue())
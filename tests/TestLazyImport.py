@@ -0,0 +1,67 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the lazy import of NetworkX and the array-only entry point
+"""
+
+import sys
+import subprocess
+import numpy as np
+import networkx as nx
+from src.algo.ArrayBackend import augment_arrays, array_matching_augmentation
+from src.algo.EswaranTarjan import eswaran_tarjan
+from src.exceptions import Exceptions
+from src.exceptions.Exceptions import deadline_exceeded_exception
+from src.utils.LazyImport import lazy_import
+from src.utils.Generators import random_D_erdos_renyi, D_arcs_to_bipartite, bipartite_to_networkx
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_false, assert_raises
+
+
+def loads_networkx(statement: str) -> bool:
+    """ Returns whether the statement imports NetworkX in a fresh interpreter. """
+    script = statement + "\nimport sys\nprint('networkx' in sys.modules)"
+    return subprocess.run([sys.executable, '-c', script], check=True, capture_output=True,
+                          text=True).stdout.strip() == 'True'
+
+
+class TestLazyImport:
+
+    def test_no_networkx_at_import(self):
+        assert_false(loads_networkx('import src.algo.ArrayBackend'))
+        assert_false(loads_networkx('import src.algo.BipartiteMatchingAugmentation'))
+        assert_false(loads_networkx('import src.AsyncAugmentation'))
+        assert_false(loads_networkx('from src.algo.ArrayBackend import augment_arrays\n'
+                                    'from src.utils.Generators import gadget_family\n'
+                                    'augment_arrays(*gadget_family(10))'))
+        assert_true(loads_networkx('from src.exceptions.Exceptions import deadline_exceeded_exception'))
+
+    def test_augment_arrays(self):
+        for seed in range(3):
+            n, a, b = D_arcs_to_bipartite(300, *random_D_erdos_renyi(300, m=350, seed=seed))
+            L_a, L_b = augment_arrays(n, a, b, mate=np.arange(n, 2 * n))
+            G, A, M = bipartite_to_networkx(n, a, b)
+            L = set(zip(L_a.tolist(), L_b.tolist()))
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(len(L), len(array_matching_augmentation(G, A, M)))
+            assert_true(is_correctly_augmented(G, A, set(zip(*(array.tolist() for array in augment_arrays(n, a, b))))))
+        assert_raises(nx.NetworkXError, augment_arrays, 2, np.array([0, 1]), np.array([2, 2]))
+        assert_raises(Exceptions.bipartite_ghraph_not_augmentable_exception, augment_arrays, 1, np.array([0]),
+                      np.array([1]))
+
+    def test_exceptions(self):
+        # Exceptions defined on the first access are the same classes and still NetworkX exceptions
+        assert_true(Exceptions.deadline_exceeded_exception is deadline_exceeded_exception)
+        assert_true(issubclass(deadline_exceeded_exception, nx.NetworkXException))
+        assert_raises(AttributeError, getattr, Exceptions, 'unknown_exception')
+
+    def test_lazy_module(self):
+        assert_true(lazy_import('networkx') is nx)  # Already imported modules are returned as they are
+        sys.modules.pop('colorsys', None)
+        lazy = lazy_import('colorsys')
+        assert_false('colorsys' in sys.modules)
+        assert_equal(lazy.rgb_to_hsv(0, 0, 0), (0.0, 0.0, 0.0))
+        assert_true('colorsys' in sys.modules)
+        # The lazy decorator of NetworkX still rejects undirected graphs
+        assert_raises(nx.NetworkXNotImplemented, eswaran_tarjan, nx.Graph(), False, None, 'networkx')
@@ -0,0 +1,72 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the packed augmentation of many small graphs
+"""
+
+import networkx as nx
+from src.algo.PackedSolver import packed_matching_augmentation
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.Generators import random_D_erdos_renyi, gadget_family, D_arcs_to_bipartite, bipartite_to_networkx
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.utils.Deadline import Deadline
+from src.exceptions.Exceptions import bipartite_ghraph_not_augmentable_exception
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises
+
+
+def small_instances(count: int):
+    instances = []
+    for seed in range(count):
+        n = 5 + seed % 40
+        instances.append(bipartite_to_networkx(*D_arcs_to_bipartite(n, *random_D_erdos_renyi(n, m=n + n // 4,
+                                                                                            seed=seed))))
+    return instances
+
+
+class TestPackedSolver:
+
+    def test_same_size_as_single(self):
+        # Given the same matchings, each instance gets an augmenting set of the same size as when solved alone
+        instances = small_instances(200)
+        D = nx.balanced_tree(2, 4, nx.DiGraph())
+        D.remove_node(0)
+        G, A, M = D_to_bipartite(D)
+        instances.append((nx.relabel_nodes(G, str), {str(v) for v in A}, {str(u): str(v) for u, v in M.items()}))
+        instances.append(bipartite_to_networkx(*gadget_family(20)))
+        results = packed_matching_augmentation(instances)
+        assert_equal(len(results), len(instances))
+        for (G, A, M), L in zip(instances, results):
+            assert_true(is_correctly_augmented(G, A, L))
+            assert_equal(len(L), len(bipartite_matching_augmentation(G, A, M, backend='networkx')))
+        assert_equal(len(results[-1]), 1)
+        assert_equal(len(results[-2]), 16)
+
+    def test_own_matchings(self):
+        # Matchings are computed only for the instances without M
+        instances = small_instances(50)
+        instances = [(G, A, M if i % 2 else None) for i, (G, A, M) in enumerate(instances)]
+        for (G, A, _), L in zip(instances, packed_matching_augmentation(instances)):
+            assert_true(is_correctly_augmented(G, A, L))
+        robust = nx.complete_bipartite_graph(2, 2)
+        assert_equal(packed_matching_augmentation([(robust, {0, 1}, None)]), [set()])
+        assert_equal(packed_matching_augmentation([]), [])
+
+    def test_invalid(self):
+        instances = small_instances(3)
+        unmatchable = nx.Graph([(0, 2), (1, 2), (4, 3), (4, 5)])  # Both 0 and 1 can only be matched to 2
+        with assert_raises(nx.NetworkXError) as context:
+            packed_matching_augmentation(instances + [(unmatchable, {0, 1, 4}, None)])
+        assert_true('Instance 3' in str(context.exception))
+        assert_raises(bipartite_ghraph_not_augmentable_exception, packed_matching_augmentation,
+                      instances + [(nx.Graph([(0, 1)]), {0}, None)])
+
+    def test_deadline(self):
+        instances = small_instances(30)
+        deadline = Deadline()
+        deadline.cancel()
+        results = packed_matching_augmentation(instances, deadline)
+        assert_true(deadline.degraded)
+        for (G, A, M), L in zip(instances, results):
+            assert_true(is_correctly_augmented(G, A, L))
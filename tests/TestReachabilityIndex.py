@@ -0,0 +1,75 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the ReachabilityIndex
+"""
+
+import networkx as nx
+from src.utils.ReachabilityIndex import ReachabilityIndex
+from src.utils.Generators import random_D_planted_sccs, D_to_networkx
+from nose.tools import assert_equal, assert_set_equal, assert_true, assert_false
+
+
+def random_dag(seed: int) -> nx.DiGraph:
+    tails, heads, _ = random_D_planted_sccs(150, 150, 300, trivial_fraction=1, seed=seed)
+    return D_to_networkx(150, tails, heads)
+
+
+class TestReachabilityIndex:
+
+    def test_reaches(self):
+        # Single pair queries must agree with NetworkX, in both directions
+        for seed in range(3):
+            D = random_dag(seed)
+            index = ReachabilityIndex(D)
+            reversed_index = index.reverse()
+            for u in range(0, 150, 7):
+                descendants = nx.descendants(D, u) | {u}
+                ancestors = nx.ancestors(D, u) | {u}
+                for v in range(150):
+                    assert_equal(index.reaches(u, v), v in descendants)
+                    assert_equal(reversed_index.reaches(u, v), v in ancestors)
+
+    def test_reachable_from(self):
+        D = random_dag(5)
+        index = ReachabilityIndex(D)
+        starts = {3, 50, 77}
+        expected = set().union(*(nx.descendants(D, u) for u in starts))
+        assert_set_equal(index.reachable_from(starts), expected | starts)
+        assert_set_equal(index.reachable_from(starts, strict=True), expected)
+        expected = set().union(*(nx.ancestors(D, u) for u in starts))
+        assert_set_equal(index.reverse().reachable_from(starts), expected | starts)
+        # Set queries do not compute the interval labels, single-pair queries compute them once per direction
+        assert_equal(index._intervals, [None, None])
+        assert_true(index.reverse().reaches(77, 3) == (77 in nx.descendants(D, 3)))
+        assert_true(index._intervals[0] is None and index._intervals[1] is not None)
+
+    def test_blocked(self):
+        # Blocked vertices are neither reported nor traversed
+        D: nx.DiGraph = nx.path_graph(5, nx.DiGraph())
+        D.add_edge(0, 4)
+        index = ReachabilityIndex(D)
+        assert_set_equal(index.reachable_from([0], index.mask({2})), {0, 1, 4})
+        assert_set_equal(index.reachable_from([0], index.mask({2, 4}), strict=True), {1})
+        assert_true(index.reaches(0, 3))
+        assert_false(index.reaches(3, 0))
+        assert_equal(len(index.reverse().reverse()), 5)
+
+    def test_reduce_transitive_arcs(self):
+        # Redundant arcs are removed while reachability is preserved, also when reduced through a reversed view
+        for seed in range(3):
+            D = random_dag(seed)
+            D.add_edges_from((u, w) for u, v in list(D.edges) for w in list(D.successors(v)))
+            closure = {u: nx.descendants(D, u) for u in D}
+            for index in (ReachabilityIndex(D), ReachabilityIndex(D).reverse()):
+                arcs = index.num_of_arcs()
+                removed = index.reduce_transitive_arcs()
+                assert_true(removed > 0)
+                assert_equal(index.num_of_arcs(), arcs - removed)
+                forward = index.reverse() if index.is_reversed else index
+                reduced = forward.induced_subgraph(set(D))
+                assert_true(set(reduced.edges) <= set(D.edges))
+                for u in range(0, 150, 5):
+                    assert_set_equal(nx.descendants(reduced, u), closure[u])
+                    assert_set_equal(forward.reachable_from([u], strict=True), closure[u])
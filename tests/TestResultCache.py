@@ -0,0 +1,129 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the ResultCache and instance_fingerprint
+"""
+
+import os
+import zlib
+import pickle
+import tempfile
+import networkx as nx
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.ResultCache import ResultCache, instance_fingerprint
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from nose.tools import assert_equal, assert_not_equal, assert_set_equal, assert_true, assert_is_none
+
+
+class TestResultCache:
+
+    def test_fingerprint_order_independent(self):
+        # The same instance built in a different order must have the same fingerprint
+        G1: nx.Graph = nx.Graph()
+        G1.add_edges_from([(0, 1), (2, 3), (0, 3)])
+        G2: nx.Graph = nx.Graph()
+        G2.add_edges_from([(3, 0), (3, 2), (1, 0)])
+        assert_equal(instance_fingerprint(G1, {0, 2}), instance_fingerprint(G2, {2, 0}))
+        assert_equal(instance_fingerprint(G1, {0, 2}, {0: 1, 1: 0, 2: 3, 3: 2}),
+                     instance_fingerprint(G2, {0, 2}, {3: 2, 2: 3, 1: 0, 0: 1}))
+
+    def test_fingerprint_distinguishes(self):
+        # Different edges, bipartitions or matchings must yield different fingerprints
+        G1: nx.Graph = nx.Graph()
+        G1.add_edges_from([(0, 1), (2, 3), (0, 3)])
+        G2: nx.Graph = nx.Graph()
+        G2.add_edges_from([(0, 1), (2, 3), (2, 1)])
+        assert_not_equal(instance_fingerprint(G1, {0, 2}), instance_fingerprint(G2, {0, 2}))
+        assert_not_equal(instance_fingerprint(G1, {0, 2}), instance_fingerprint(G1, {1, 3}))
+        assert_not_equal(instance_fingerprint(G1, {0, 2}), instance_fingerprint(G1, {0, 2}, {0: 1, 1: 0, 2: 3, 3: 2}))
+
+    def test_hit_and_miss(self):
+        # The second call must be answered from the cache, also by a new cache on the same directory
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (2, 3)})
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            L = bipartite_matching_augmentation(G, {0, 2}, cache=cache)
+            assert_set_equal(L, {(0, 3), (2, 1)})
+            assert_equal((cache.hits, cache.misses), (0, 1))
+            assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, cache=cache), L)
+            assert_equal((cache.hits, cache.misses), (1, 1))
+
+            reopened = ResultCache(directory)
+            assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, cache=reopened), L)
+            assert_equal((reopened.hits, reopened.misses), (1, 0))
+
+    def test_empty_result_cached(self):
+        # An already robust graph has an empty L, which still must be a hit
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({(0, 1), (0, 3), (2, 1), (2, 3)})
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            bipartite_matching_augmentation(G, {0, 2}, cache=cache)
+            assert_set_equal(bipartite_matching_augmentation(G, {0, 2}, cache=cache), set())
+            assert_equal(cache.hits, 1)
+
+    def test_lru_eviction(self):
+        # With a size cap of roughly two entries, the least recently used entry is evicted
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            cache.put('a', {(i, -i) for i in range(100)})
+            entry_size = cache.size_bytes
+            cache = ResultCache(directory, max_bytes=2 * entry_size + entry_size // 2)
+            cache.put('b', {(i, -i) for i in range(100)})
+            assert_true(cache.get('a') is not None)  # 'b' is now the least recently used
+            cache.put('c', {(i, -i) for i in range(100)})
+            assert_is_none(cache.get('b'))
+            assert_true('a' in cache and 'c' in cache)
+            assert_equal(cache.evictions, 1)
+
+    def test_shared_directory(self):
+        # Entries written by another cache on the same directory are found, the cap counts all of them
+        with tempfile.TemporaryDirectory() as directory:
+            first, second = ResultCache(directory), ResultCache(directory)
+            first.put('a', {(i, -i) for i in range(100)})
+            assert_equal(second.get('a'), {(i, -i) for i in range(100)})
+            assert_equal((second.hits, second.misses), (1, 0))
+            entry_size = first.size_bytes
+            second.max_bytes = entry_size + entry_size // 2
+            second.put('b', {(i, -i) for i in range(100)})
+            assert_true('a' not in first and 'b' in first)
+            assert_is_none(first.get('a'))
+            assert_equal((len(first), first.size_bytes), (1, entry_size))
+
+    def test_random_graph(self):
+        # Cached result of a random instance must be the same augmenting set
+        D: nx.DiGraph = nx.generators.random_graphs.erdos_renyi_graph(300, 0.01, directed=True, seed=1)
+        D.remove_node(0)
+        G, A, M = D_to_bipartite(D)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            L = bipartite_matching_augmentation(G, A, M, cache=cache)
+            assert_set_equal(bipartite_matching_augmentation(G, A, M, cache=cache), L)
+            assert_equal(len(cache), 1)
+
+    def test_encoding(self):
+        # Integer and literal vertices round-trip, other vertices are not cached
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            for L in ({(0, 2 ** 40), (-1, 3)}, {('a1', 'b1'), ((1, 'x'), 2.5)}, {(True, 2 ** 70)}, set()):
+                cache.put('key', L)
+                assert_equal(cache.get('key'), L)
+                assert_equal({tuple(map(type, edge)) for edge in cache.get('key')},
+                             {tuple(map(type, edge)) for edge in L})
+            cache.put('object', {(object(), 1)})
+            assert_true('object' not in cache)
+
+    def test_unreadable_entry(self):
+        # Truncated, foreign and pickled files are misses, they are never unpickled
+        with tempfile.TemporaryDirectory() as directory:
+            cache = ResultCache(directory)
+            contents = [b'', b'BMAL1', b'BMAL1i' + zlib.compress(b'\x00' * 12), b'BMAL1r' + zlib.compress(b'[1'),
+                        pickle.dumps([(0, 1)]), b'BMAL1' + b'x' * 10]
+            for i, data in enumerate(contents):
+                cache.put(str(i), {(0, 1)})
+                with open(os.path.join(directory, str(i) + '.bin'), 'wb') as file:
+                    file.write(data)
+                assert_is_none(cache.get(str(i)))
+            assert_equal((cache.hits, cache.misses), (0, len(contents)))
@@ -0,0 +1,71 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the augment_under_matchings(G, A, matchings) function
+"""
+
+import networkx as nx
+from src.algo.ScenarioAnalysis import augment_under_matchings
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.utils.AuxiliaryFunctions import D_to_bipartite
+from src.exceptions.Exceptions import bipartite_ghraph_not_augmentable_exception
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_equal, assert_true, assert_raises, assert_is_none
+
+
+def alternative_matchings(G: nx.Graph, A, M, count: int):
+    """ Returns up to count perfect matchings of G obtained from M by switching along M-alternating 4-cycles. """
+    matchings = [M]
+    for a in A:
+        for b in G[a]:
+            a_prime = M[b]
+            if b != M[a] and G.has_edge(a_prime, M[a]) and len(matchings) < count:
+                M_prime = dict(M)
+                M_prime[a], M_prime[b] = b, a
+                M_prime[a_prime], M_prime[M[a]] = M[a], a_prime
+                matchings.append(M_prime)
+    return matchings
+
+
+class TestScenarioAnalysis:
+
+    def test_unaugmentable(self):
+        G: nx.Graph = nx.Graph()
+        G.add_edge(0, 1)
+        assert_raises(bipartite_ghraph_not_augmentable_exception, augment_under_matchings, G, {0}, [{0: 1, 1: 0}])
+
+    def test_parallel_equals_sequential(self):
+        # Results computed in worker processes must equal results computed in this process
+        D: nx.DiGraph = nx.generators.random_graphs.erdos_renyi_graph(200, 0.02, directed=True, seed=3)
+        D.remove_node(0)
+        D.add_edges_from([(i, i + 1) for i in range(1, 100, 2)] + [(i + 1, i) for i in range(1, 100, 2)])
+        G, A, M = D_to_bipartite(D)
+        matchings = alternative_matchings(G, A, M, 5)
+        assert_true(len(matchings) > 1)
+
+        parallel = augment_under_matchings(G, A, matchings, processes=2)
+        sequential = augment_under_matchings(G, A, matchings, processes=1)
+        # Workers run the same array pipeline on the shared arrays
+        assert_equal(parallel, sequential)
+        for (size, L), M_i in zip(parallel, matchings):
+            assert_equal(size, len(L))
+            assert_equal(size, len(bipartite_matching_augmentation(G, A, M_i)))
+            assert_true(is_correctly_augmented(G, A, L))
+
+    def test_best_only(self):
+        # The best result is the smallest augmenting set
+        G: nx.Graph = nx.Graph()
+        G.add_edges_from({('a1', 'b1'), ('a2', 'b2'), ('a1', 'b2'), ('a2', 'b1'), ('a3', 'b3'), ('a3', 'b1')})
+        A = {'a1', 'a2', 'a3'}
+        matchings = alternative_matchings(G, A, {'a1': 'b1', 'b1': 'a1', 'a2': 'b2', 'b2': 'a2',
+                                                 'a3': 'b3', 'b3': 'a3'}, 3)
+        results = augment_under_matchings(G, A, matchings, processes=2)
+        best, L = augment_under_matchings(G, A, matchings, processes=2, best_only=True)
+        assert_equal(len(L), min(size for size, _ in results))
+        assert_equal(len(L), results[best][0])
+
+    def test_no_matchings(self):
+        G, A, M = D_to_bipartite(nx.DiGraph([(1, 2), (2, 3)]))
+        assert_equal(augment_under_matchings(G, A, [], processes=2), [])
+        assert_is_none(augment_under_matchings(G, A, [], best_only=True))
@@ -5,9 +5,16 @@ Last change: 30.11.2019
 Description: tests for the source_cover(G) function
 """
 
+import numpy as np
 import networkx as nx
-from src.algo.SourceCover import source_cover
-from nose.tools import assert_set_equal, assert_true
+from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from src.algo.SourceCover import source_cover, _greedy_cover, _parallel_cover, EPSILON
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.ArrayBackend import augment_arrays
+from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+from tests.TestBipartiteMatchingAugmentation import is_correctly_augmented
+from nose.tools import assert_set_equal, assert_true, assert_equal, assert_raises
 from typing import Set
 
 
@@ -143,3 +150,70 @@ class TestSourceCover:
         })
         cover = source_cover(D, {"t_1"})
         assert_true(len(cover) == 1)
+
+    def test_greedy_cover(self):
+        # Sets {0, 1, 2, 3}, {0, 1}, {2, 3, 4}, {4} and an empty set, greedy picks the largest set first,
+        # then the set covering the most of the remaining elements
+        bounds = [0, 4, 6, 9, 10, 10]
+        incidence = [0, 1, 2, 3, 0, 1, 2, 3, 4, 4]
+        assert_equal(_greedy_cover(bounds, incidence, 5), [0, 2])
+        assert_equal(_greedy_cover([0], [], 0), [])
+
+    def test_parallel_cover(self):
+        bounds = [0, 4, 6, 9, 10, 10]
+        incidence = [0, 1, 2, 3, 0, 1, 2, 3, 4, 4]
+        assert_equal(sorted(_parallel_cover(bounds, incidence, 5)), [0, 2])
+        assert_equal(_parallel_cover([0], [], 0), [])
+
+        # Random sets cover all elements, the cover does not depend on the split of the rounds
+        rng = np.random.default_rng(3)
+        sizes = rng.integers(1, 30, 2000)
+        bounds = [0] + np.cumsum(sizes).tolist()
+        incidence = np.concatenate([rng.choice(5000, size, replace=False) for size in sizes]).tolist()
+        parallel = _parallel_cover(bounds, incidence, 5000)
+        covered = set()
+        for i in parallel:
+            covered.update(incidence[bounds[i]:bounds[i + 1]])
+        assert_equal(covered, set(incidence))
+        with ThreadPoolExecutor(3) as executor:
+            assert_equal(_parallel_cover(bounds, incidence, 5000, executor=executor, chunks=5), parallel)
+        with ProcessPoolExecutor(2) as executor:
+            assert_equal(_parallel_cover(bounds, incidence, 5000, executor=executor, chunks=2), parallel)
+
+    def test_parallel_cover_approximation(self):
+        # Within (1 + EPSILON)^2 H(n) of a brute force optimum on small random instances
+        rng = np.random.default_rng(5)
+        for seed in range(20):
+            n = 12
+            sets = [rng.choice(n, rng.integers(1, 6), replace=False).tolist() for _ in range(10)]
+            bounds = [0] + np.cumsum([len(elements) for elements in sets]).tolist()
+            incidence = [element for elements in sets for element in elements]
+            universe = set(incidence)
+            optimum = next(size for size in range(1, len(sets) + 1) for chosen in combinations(sets, size)
+                           if set().union(*chosen) == universe)
+            parallel = _parallel_cover(bounds, incidence, n, seed=seed)
+            assert_true(len(parallel) <= (1 + EPSILON) ** 2 * np.sum(1 / np.arange(1, n + 1)) * optimum)
+
+    def test_cover_methods(self):
+        D: nx.DiGraph = nx.balanced_tree(2, 5, nx.DiGraph())
+        critical: Set = {node for node in D.nodes if D.out_degree(node) == 0}
+        for backend in ('networkx', 'array'):
+            assert_set_equal(source_cover(D, critical, backend=backend, method='parallel'), {0})
+            assert_raises(ValueError, source_cover, D, critical, backend=backend, method='unknown')
+
+        tails, heads, _ = random_D_planted_sccs(600, 200, 1800, internal_arcs=300, seed=2)
+        G, A, M = bipartite_to_networkx(*D_arcs_to_bipartite(600, tails, heads))
+        for backend in ('networkx', 'array'):
+            L = bipartite_matching_augmentation(G, A, M, backend=backend, cover_method='parallel')
+            assert_true(is_correctly_augmented(G, A, L))
+        assert_raises(ValueError, bipartite_matching_augmentation, G, A, M, cover_method='unknown')
+
+        # The rounds of the parallel cover are split over a process pool passed through the entry points
+        with ProcessPoolExecutor(2) as cover_executor:
+            for backend in ('networkx', 'array'):
+                L = bipartite_matching_augmentation(G, A, M, backend=backend, cover_method='parallel',
+                                                    cover_executor=cover_executor)
+                assert_equal(L, bipartite_matching_augmentation(G, A, M, backend=backend, cover_method='parallel'))
+            a, b = augment_arrays(*D_arcs_to_bipartite(600, tails, heads), cover_method='parallel',
+                                  cover_executor=cover_executor)
+            assert_equal(len(a), len(L))
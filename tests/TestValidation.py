@@ -0,0 +1,86 @@
+"""
+Author: Tomas Jelinek
+Last change: 18.10.2026
+
+Description: tests for the validation of the input of the bipartite matching augmentation
+"""
+
+import pickle
+import networkx as nx
+import numpy as np
+from src.algo.BipartiteMatchingAugmentation import bipartite_matching_augmentation
+from src.algo.ArrayBackend import augment_arrays
+from src.utils.Validation import validate_instance, validate_bipartite_arrays
+from src.utils.Generators import random_D_planted_sccs, D_arcs_to_bipartite, bipartite_to_networkx
+from src.exceptions import Exceptions
+from nose.tools import assert_equal, assert_true, assert_raises, assert_in
+
+
+def problems_of(function, *args) -> list:
+    """ Returns the problems reported by function(*args), which is expected to raise invalid_instance_exception. """
+    with assert_raises(Exceptions.invalid_instance_exception) as context:
+        function(*args)
+    return context.exception.problems
+
+
+def small_instance():
+    G = nx.Graph([(0, 3), (1, 4), (2, 5), (0, 4), (1, 5)])
+    return G, {0, 1, 2}, {0: 3, 3: 0, 1: 4, 4: 1, 2: 5, 5: 2}
+
+
+class TestValidation:
+
+    def test_valid(self):
+        G, A, M = small_instance()
+        validate_instance(G, A, M)
+        validate_instance(G, A)
+        L = bipartite_matching_augmentation(G, A, M, validate=True)
+        assert_equal(L, bipartite_matching_augmentation(G, A, M))
+
+        tails, heads, _ = random_D_planted_sccs(200, 40, 600, seed=0)
+        n, a, b = D_arcs_to_bipartite(200, tails, heads)
+        validate_bipartite_arrays(n, a, b, np.arange(n, 2 * n))
+        assert_equal(len(augment_arrays(n, a, b, validate=True)[0]), len(augment_arrays(n, a, b)[0]))
+
+    def test_bipartition(self):
+        G, A, M = small_instance()
+        G.add_edge(0, 1)
+        assert_equal(problems_of(validate_instance, G, A, M), ['1 edges do not join A and B: (0, 1)'])
+        for backend in ('networkx', 'array'):
+            with assert_raises(Exceptions.invalid_instance_exception):
+                bipartite_matching_augmentation(G, A, M, backend=backend, validate=True)
+        G.remove_edge(0, 1)
+        problems = problems_of(validate_instance, G, {0, 1}, M)
+        assert_in('|A| = 2 is not |A + B| / 2 = 3.0', problems)
+        assert_in('1 edges of M do not join A and B: (2, 5)', problems)
+        assert_in('|A + B| = 2 < 4, G cannot be augmented', problems_of(validate_instance, nx.Graph([(0, 1)]), {0}))
+
+    def test_matching(self):
+        G, A, M = small_instance()
+        assert_equal(problems_of(validate_instance, G, A, {0: 4, 4: 0, 1: 3, 3: 1, 2: 5, 5: 2}),
+                     ['1 edges of M are not edges of G: (3, 1)'])
+        problems = problems_of(validate_instance, G, A, {0: 3, 3: 0, 1: 4, 4: 1})
+        assert_equal(problems, ['2 vertices are not matched by M: 2, 5'])
+        problems = problems_of(validate_instance, G, A, {0: 3, 3: 1, 1: 4, 4: 1, 2: 5, 5: 2})
+        assert_in('2 vertices v have M[M[v]] != v: 0, 3', problems)
+        problems = problems_of(validate_instance, G, A | {9}, dict(M, x=0))
+        assert_in('1 vertices of A are not in G: 9', problems)
+        assert_in("1 vertices of M are not in G or matched outside of G: 'x'", problems)
+
+    def test_arrays(self):
+        problems = problems_of(validate_bipartite_arrays, 3, [0, 1, 2, 0], [3, 4, 5, 4], [3, 3, 5])
+        assert_in('1 vertices are not matched by M: 4', problems)
+        assert_in('1 edges of M are not edges of G: (1, 3)', problems)
+        assert_equal(problems_of(augment_arrays, 2, [0, 1], [2, 0], None, None, True),
+                     ['1 edges do not join A = 0..n-1 and B = n..2n-1: (1, 0)'])
+        assert_equal(problems_of(validate_bipartite_arrays, 2, [0, 1], [2, 3], [2]),
+                     ['mate has length 1 instead of n = 2'])
+
+    def test_examples_and_pickle(self):
+        G = nx.complete_graph(20)
+        problems = problems_of(validate_instance, G, set(range(10)))
+        assert_true(problems[0].startswith('90 edges do not join A and B: '))
+        assert_true(problems[0].endswith(', ...'))
+        exception = pickle.loads(pickle.dumps(Exceptions.invalid_instance_exception(problems)))
+        assert_equal(exception.problems, problems)
+        assert_equal(str(exception), '; '.join(problems))